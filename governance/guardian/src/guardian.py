@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+_SECONDS_PER_HOUR_INV = 1 / 3600
+_SECONDS_PER_DAY = 86400
+_STALE_DEPENDENCY_DAYS = 90
 
 
 class HealthAlert(BaseModel):
@@ -17,12 +22,16 @@ class HealthAlert(BaseModel):
 
 
 class AutoFixSuggestion(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     action: str
     command: str
     rationale: str
 
 
 class GuardianReport(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     total_alerts: int
     critical_count: int
     warning_count: int
@@ -31,10 +40,113 @@ class GuardianReport(BaseModel):
     overall_health: str  # "ok" | "degraded" | "critical"
 
 
+def _emit(
+    alerts: list[dict],
+    type: str,
+    severity: str,
+    title: str,
+    description: str,
+    component: str,
+    metadata: dict,
+) -> None:
+    alerts.append(
+        {
+            "type": type,
+            "severity": severity,
+            "title": title,
+            "description": description,
+            "component": component,
+            "action_required": True,
+            "metadata": metadata,
+        }
+    )
+
+
+# Alerts are collected as plain dicts on the hot path and validated in one call.
+_ALERT_LIST = TypeAdapter(list[HealthAlert])
+
+
+@lru_cache(maxsize=1024)
+def _suggest(
+    alert_type: str, component: str, extra: tuple
+) -> Optional[AutoFixSuggestion]:
+    pr_id, latest_version = extra
+    if alert_type == "failed_workflow":
+        name = component
+        return AutoFixSuggestion(
+            action=f"Re-run workflow {name}",
+            command=f"gh workflow run '{name}'",
+            rationale="Re-running the workflow may resolve transient failures.",
+        )
+
+    if alert_type == "coverage_drop":
+        return AutoFixSuggestion(
+            action="Add tests for uncovered paths",
+            command="pytest --cov=src --cov-report=html",
+            rationale="Improving test coverage ensures code reliability.",
+        )
+
+    if alert_type == "stale_pr":
+        pr_id = pr_id or component.replace("pr-", "")
+        return AutoFixSuggestion(
+            action=f"Request review or close PR #{pr_id}",
+            command=f"gh pr review {pr_id} --request-changes",
+            rationale=(
+                "Stale PRs block development momentum "
+                "and should be reviewed or closed."
+            ),
+        )
+
+    if alert_type == "stale_dependency":
+        name = component
+        return AutoFixSuggestion(
+            action=f"Update {name} to {latest_version}",
+            command=f"pip install --upgrade {name}",
+            rationale=(
+                f"Keeping {name} up-to-date prevents security vulnerabilities "
+                "and compatibility issues."
+            ),
+        )
+
+    return None
+
+
 class GuardianSystem:
-    def check_workflow_health(self, runs: list[dict]) -> list[HealthAlert]:
-        alerts: list[HealthAlert] = []
-        now = datetime.now(timezone.utc)
+    def check_workflow_health(
+        self, runs: list[dict], now: Optional[datetime] = None
+    ) -> list[HealthAlert]:
+        now_ts = (now or datetime.now(timezone.utc)).timestamp()
+        return _ALERT_LIST.validate_python(self._workflow_alerts(runs, now_ts))
+
+    def check_test_coverage(
+        self, coverage_pct: float, threshold: float = 80.0
+    ) -> Optional[HealthAlert]:
+        if coverage_pct < threshold:
+            return HealthAlert(
+                type="coverage_drop",
+                severity="warning",
+                title="Test coverage below threshold",
+                description=(
+                    f"Coverage is {coverage_pct:.1f}%, below the "
+                    f"{threshold:.1f}% threshold."
+                ),
+                component="test-coverage",
+                action_required=True,
+                metadata={"coverage_pct": coverage_pct, "threshold": threshold},
+            )
+        return None
+
+    def check_stale_prs(
+        self, prs: list[dict], now: Optional[datetime] = None
+    ) -> list[HealthAlert]:
+        now_ts = (now or datetime.now(timezone.utc)).timestamp()
+        return _ALERT_LIST.validate_python(self._stale_pr_alerts(prs, now_ts))
+
+    def check_dependency_age(self, deps: list[dict]) -> list[HealthAlert]:
+        return _ALERT_LIST.validate_python(self._dependency_alerts(deps))
+
+    def _workflow_alerts(self, runs: list[dict], now_ts: float) -> list[dict]:
+        alerts: list[dict] = []
         failure_counts: dict[str, int] = {}
 
         for run in runs:
@@ -43,16 +155,14 @@ class GuardianSystem:
 
             if run.get("conclusion") == "failure":
                 failure_counts[name] = failure_counts.get(name, 0) + 1
-                alerts.append(
-                    HealthAlert(
-                        type="failed_workflow",
-                        severity="critical",
-                        title=f"Workflow failed: {name}",
-                        description=f"Workflow run {run_id} for '{name}' has failed.",
-                        component=name,
-                        action_required=True,
-                        metadata={"run_id": run_id, "name": name},
-                    )
+                _emit(
+                    alerts,
+                    "failed_workflow",
+                    "critical",
+                    f"Workflow failed: {name}",
+                    f"Workflow run {run_id} for '{name}' has failed.",
+                    name,
+                    {"run_id": run_id, "name": name},
                 )
 
             if run.get("status") == "in_progress":
@@ -61,62 +171,39 @@ class GuardianSystem:
                     created_at = datetime.fromisoformat(
                         created_at_str.replace("Z", "+00:00")
                     )
-                    elapsed_hours = (now - created_at).total_seconds() / 3600
+                    elapsed_hours = (now_ts - created_at.timestamp()) * _SECONDS_PER_HOUR_INV
                     if elapsed_hours > 2:
-                        alerts.append(
-                            HealthAlert(
-                                type="stale_workflow",
-                                severity="warning",
-                                title=f"Stale in-progress workflow: {name}",
-                                description=(
-                                    f"Workflow run {run_id} for '{name}' has been "
-                                    f"in progress for {elapsed_hours:.1f} hours."
-                                ),
-                                component=name,
-                                action_required=True,
-                                metadata={"run_id": run_id, "elapsed_hours": elapsed_hours},
-                            )
+                        _emit(
+                            alerts,
+                            "stale_workflow",
+                            "warning",
+                            f"Stale in-progress workflow: {name}",
+                            (
+                                f"Workflow run {run_id} for '{name}' has been "
+                                f"in progress for {elapsed_hours:.1f} hours."
+                            ),
+                            name,
+                            {"run_id": run_id, "elapsed_hours": elapsed_hours},
                         )
                 except (ValueError, AttributeError):
                     pass
 
         for name, count in failure_counts.items():
             if count > 3:
-                alerts.append(
-                    HealthAlert(
-                        type="repeated_failures",
-                        severity="critical",
-                        title=f"Repeated failures detected: {name}",
-                        description=f"Workflow '{name}' has failed {count} times.",
-                        component=name,
-                        action_required=True,
-                        metadata={"failure_count": count},
-                    )
+                _emit(
+                    alerts,
+                    "repeated_failures",
+                    "critical",
+                    f"Repeated failures detected: {name}",
+                    f"Workflow '{name}' has failed {count} times.",
+                    name,
+                    {"failure_count": count},
                 )
 
         return alerts
 
-    def check_test_coverage(
-        self, coverage_pct: float, threshold: float = 80.0
-    ) -> Optional[HealthAlert]:
-        if coverage_pct < threshold:
-            return HealthAlert(
-                type="coverage_drop",
-                severity="warning",
-                title="Test coverage below threshold",
-                description=(
-                    f"Coverage is {coverage_pct:.1f}%, below the "
-                    f"{threshold:.1f}% threshold."
-                ),
-                component="test-coverage",
-                action_required=True,
-                metadata={"coverage_pct": coverage_pct, "threshold": threshold},
-            )
-        return None
-
-    def check_stale_prs(self, prs: list[dict]) -> list[HealthAlert]:
-        alerts: list[HealthAlert] = []
-        now = datetime.now(timezone.utc)
+    def _stale_pr_alerts(self, prs: list[dict], now_ts: float) -> list[dict]:
+        alerts: list[dict] = []
 
         for pr in prs:
             if pr.get("draft"):
@@ -127,102 +214,88 @@ class GuardianSystem:
                 updated_at = datetime.fromisoformat(
                     updated_at_str.replace("Z", "+00:00")
                 )
-                age_days = (now - updated_at).days
+                age_days = int((now_ts - updated_at.timestamp()) // _SECONDS_PER_DAY)
                 if age_days > 7:
                     pr_id = pr.get("id", "unknown")
                     title = pr.get("title", "Untitled PR")
-                    alerts.append(
-                        HealthAlert(
-                            type="stale_pr",
-                            severity="warning",
-                            title=f"Stale PR: {title}",
-                            description=(
-                                f"PR #{pr_id} has not been updated in {age_days} days."
-                            ),
-                            component=f"pr-{pr_id}",
-                            action_required=True,
-                            metadata={"pr_id": pr_id, "age_days": age_days},
-                        )
+                    _emit(
+                        alerts,
+                        "stale_pr",
+                        "warning",
+                        f"Stale PR: {title}",
+                        f"PR #{pr_id} has not been updated in {age_days} days.",
+                        f"pr-{pr_id}",
+                        {"pr_id": pr_id, "age_days": age_days},
                     )
             except (ValueError, AttributeError):
                 pass
 
         return alerts
 
-    def check_dependency_age(self, deps: list[dict]) -> list[HealthAlert]:
-        alerts: list[HealthAlert] = []
-
-        for dep in deps:
-            age_days = dep.get("age_days", 0)
-            if age_days > 90:
-                name = dep.get("name", "unknown")
-                current_version = dep.get("current_version", "unknown")
-                latest_version = dep.get("latest_version", "unknown")
-                alerts.append(
-                    HealthAlert(
-                        type="stale_dependency",
-                        severity="warning",
-                        title=f"Stale dependency: {name}",
-                        description=(
-                            f"{name} is {age_days} days old "
-                            f"(current: {current_version}, latest: {latest_version})."
-                        ),
-                        component=name,
-                        action_required=True,
-                        metadata={
-                            "current_version": current_version,
-                            "latest_version": latest_version,
-                            "age_days": age_days,
-                        },
-                    )
-                )
-
-        return alerts
-
-    def suggest_autofix(self, alert: HealthAlert) -> Optional[AutoFixSuggestion]:
-        if alert.type == "failed_workflow":
-            name = alert.component
-            return AutoFixSuggestion(
-                action=f"Re-run workflow {name}",
-                command=f"gh workflow run '{name}'",
-                rationale="Re-running the workflow may resolve transient failures.",
-            )
-
-        if alert.type == "coverage_drop":
-            return AutoFixSuggestion(
-                action="Add tests for uncovered paths",
-                command="pytest --cov=src --cov-report=html",
-                rationale="Improving test coverage ensures code reliability.",
-            )
-
-        if alert.type == "stale_pr":
-            pr_id = alert.metadata.get("pr_id") or alert.component.replace("pr-", "")
-            return AutoFixSuggestion(
-                action=f"Request review or close PR #{pr_id}",
-                command=f"gh pr review {pr_id} --request-changes",
-                rationale=(
-                    "Stale PRs block development momentum "
-                    "and should be reviewed or closed."
+    def _dependency_alerts(self, deps: list[dict]) -> list[dict]:
+        alerts: list[dict] = []
+        # Filter first so the formatting work below only runs for the stale subset.
+        stale = [dep for dep in deps if dep.get("age_days", 0) > _STALE_DEPENDENCY_DAYS]
+
+        for dep in stale:
+            age_days = dep["age_days"]
+            name = dep.get("name", "unknown")
+            current_version = dep.get("current_version", "unknown")
+            latest_version = dep.get("latest_version", "unknown")
+            _emit(
+                alerts,
+                "stale_dependency",
+                "warning",
+                f"Stale dependency: {name}",
+                (
+                    f"{name} is {age_days} days old "
+                    f"(current: {current_version}, latest: {latest_version})."
                 ),
+                name,
+                {
+                    "current_version": current_version,
+                    "latest_version": latest_version,
+                    "age_days": age_days,
+                },
             )
 
-        if alert.type == "stale_dependency":
-            name = alert.component
-            latest_version = alert.metadata.get("latest_version", "latest")
-            return AutoFixSuggestion(
-                action=f"Update {name} to {latest_version}",
-                command=f"pip install --upgrade {name}",
-                rationale=(
-                    f"Keeping {name} up-to-date prevents security vulnerabilities "
-                    "and compatibility issues."
-                ),
-            )
-
-        return None
+        return alerts
 
-    def generate_report(self, alerts: list[HealthAlert]) -> GuardianReport:
-        critical_count = sum(1 for a in alerts if a.severity == "critical")
-        warning_count = sum(1 for a in alerts if a.severity == "warning")
+    def suggest_autofix(self, alert: HealthAlert) -> Optional[AutoFixSuggestion]:
+        extra = (alert.metadata.get("pr_id"), alert.metadata.get("latest_version", "latest"))
+        return _suggest(alert.type, alert.component, extra)
+
+    def run_all_checks(
+        self,
+        runs: list[dict],
+        prs: list[dict],
+        deps: list[dict],
+        coverage_pct: Optional[float] = None,
+        now: Optional[datetime] = None,
+    ) -> GuardianReport:
+        now = now or datetime.now(timezone.utc)
+        now_ts = now.timestamp()
+        alerts: list[HealthAlert | dict] = []
+        alerts += self._workflow_alerts(runs, now_ts)
+        alerts += self._stale_pr_alerts(prs, now_ts)
+        alerts += self._dependency_alerts(deps)
+        if coverage_pct is not None:
+            coverage_alert = self.check_test_coverage(coverage_pct)
+            if coverage_alert is not None:
+                alerts.append(coverage_alert)
+        return self.generate_report(alerts, now=now)
+
+    def generate_report(
+        self, alerts: list[HealthAlert | dict], now: Optional[datetime] = None
+    ) -> GuardianReport:
+        critical_count = 0
+        warning_count = 0
+        for a in alerts:
+            severity = a["severity"] if isinstance(a, dict) else a.severity
+            if severity == "critical":
+                critical_count += 1
+            elif severity == "warning":
+                warning_count += 1
 
         if critical_count > 0:
             overall_health = "critical"
@@ -236,7 +309,7 @@ class GuardianSystem:
             critical_count=critical_count,
             warning_count=warning_count,
             alerts=alerts,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now or datetime.now(timezone.utc),
             overall_health=overall_health,
         )
 
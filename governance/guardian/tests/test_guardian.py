@@ -161,3 +161,38 @@ def test_no_alerts_returns_ok() -> None:
     assert report.total_alerts == 0
     assert report.critical_count == 0
     assert report.warning_count == 0
+
+
+def test_run_all_checks_uses_single_timestamp() -> None:
+    now = datetime(2025, 6, 1, tzinfo=timezone.utc)
+    runs = [
+        {
+            "id": 7,
+            "name": "Deploy",
+            "status": "in_progress",
+            "created_at": (now - timedelta(hours=3)).isoformat(),
+        }
+    ]
+    prs = [{"id": 9, "title": "Docs", "updated_at": (now - timedelta(days=8)).isoformat()}]
+    deps = [{"name": "pydantic", "age_days": 120}]
+    report = guardian.run_all_checks(runs, prs, deps, coverage_pct=90.0, now=now)
+    assert report.timestamp == now
+    assert {a.type for a in report.alerts} == {"stale_workflow", "stale_pr", "stale_dependency"}
+    stale_run = next(a for a in report.alerts if a.type == "stale_workflow")
+    assert stale_run.metadata["elapsed_hours"] == pytest.approx(3.0)
+    stale_pr = next(a for a in report.alerts if a.type == "stale_pr")
+    assert stale_pr.metadata["age_days"] == 8
+
+
+def test_autofix_suggestion_is_memoized() -> None:
+    alerts = guardian.check_dependency_age(
+        [
+            {"name": "httpx", "age_days": 200, "latest_version": "0.28.1"},
+            {"name": "httpx", "age_days": 210, "latest_version": "0.28.1"},
+            {"name": "fresh", "age_days": 10},
+        ]
+    )
+    assert len(alerts) == 2
+    first, second = (guardian.suggest_autofix(a) for a in alerts)
+    assert first is second
+    assert first.action == "Update httpx to 0.28.1"
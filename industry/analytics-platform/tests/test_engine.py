@@ -72,3 +72,49 @@ def test_compute_cohort_retention(engine):
     assert len(retention) == 2
     assert retention[0] == pytest.approx(66.67, abs=0.01)
     assert retention[1] == pytest.approx(33.33, abs=0.01)
+
+
+def test_event_ids_are_unique(engine):
+    ids = {engine.ingest_event("web", "click", f"u{i}").id for i in range(100)}
+    assert len(ids) == 100
+
+
+def test_dashboard_trend_groups_by_day(engine):
+    now = datetime.now(timezone.utc)
+    for days_ago in (0, 0, 1):
+        e = engine.ingest_event("web", "visit", "u1")
+        e.timestamp = now - timedelta(days=days_ago)
+    engine.ingest_event("mobile", "visit", "u2")
+    dashboard = engine.generate_dashboard_data("web", 3)
+    assert dashboard.trend == [
+        {"date": (now - timedelta(days=1)).date().isoformat(), "count": 1},
+        {"date": now.date().isoformat(), "count": 2},
+    ]
+
+
+def test_ingest_events_bulk(engine):
+    earlier = datetime.now(timezone.utc) - timedelta(hours=1)
+    events = engine.ingest_events_bulk(
+        [
+            {"source": "web", "event_type": "click", "user_id": "u1"},
+            {"source": "web", "event_type": "click", "user_id": "u2", "timestamp": earlier},
+        ]
+    )
+    assert len(events) == 2
+    assert events[0].id != events[1].id
+    assert events[1].timestamp == earlier
+    dashboard = engine.generate_dashboard_data("web", 1)
+    assert dashboard.total_events == 2
+    assert dashboard.unique_users == 2
+
+
+def test_ingest_events_bulk_normalises_timestamps(engine):
+    earlier = datetime.now(timezone.utc) - timedelta(hours=1)
+    events = engine.ingest_events_bulk(
+        [
+            {"source": "web", "event_type": "click", "user_id": "u1", "timestamp": earlier.isoformat()},
+            {"source": "web", "event_type": "click", "user_id": "u2", "timestamp": earlier.replace(tzinfo=None)},
+        ]
+    )
+    assert [e.timestamp for e in events] == [earlier, earlier]
+    assert engine.generate_dashboard_data("web", 1).total_events == 2
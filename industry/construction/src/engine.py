@@ -1,35 +1,47 @@
 """Construction Workflow Engine – manages projects, milestones, and budget tracking."""
 from __future__ import annotations
 
-import uuid
+import itertools
+import os
 from datetime import date
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Process-unique prefix plus a counter: cheaper than a uuid4() syscall per record.
+_ID_PREFIX = os.urandom(6).hex()
+_id_counter = itertools.count()
+
+
+def _new_id() -> str:
+    return f"{_ID_PREFIX}-{next(_id_counter):x}"
 
 
 class Milestone(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str
-    due_date: str
+    due_date: date
     budget_pct: float
     status: str = "pending"
     float_days: int = 0
 
 
 class Project(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str
     budget: float
-    start_date: str
-    end_date: str
+    start_date: date
+    end_date: date
     status: str = "active"
     phases: List[str] = Field(default_factory=lambda: ["planning", "execution", "closeout"])
     milestones: List[Milestone] = Field(default_factory=list)
     actual_spend: float = 0.0
+    completed_pct: float = 0.0
 
 
 class BudgetVariance(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     project_id: str
     planned: float
     actual: float
@@ -43,38 +55,47 @@ class ConstructionWorkflowEngine:
         self._projects: Dict[str, Project] = {}
 
     def create_project(
-        self, name: str, budget: float, start_date: str, end_date: str
+        self, name: str, budget: float, start_date: str | date, end_date: str | date
     ) -> Project:
         project = Project(name=name, budget=budget, start_date=start_date, end_date=end_date)
         self._projects[project.id] = project
         return project
 
     def add_milestone(
-        self, project_id: str, name: str, due_date: str, budget_pct: float
+        self, project_id: str, name: str, due_date: str | date, budget_pct: float
     ) -> Milestone:
         project = self._get_project(project_id)
         milestone = Milestone(name=name, due_date=due_date, budget_pct=budget_pct)
         project.milestones.append(milestone)
         return milestone
 
+    def set_milestone_float(
+        self, project_id: str, milestone_id: str, days: int
+    ) -> Milestone:
+        project = self._get_project(project_id)
+        milestone = self._get_milestone(project, milestone_id)
+        milestone.float_days = days
+        return milestone
+
     def update_milestone_status(
         self, project_id: str, milestone_id: str, status: str
     ) -> Milestone:
         project = self._get_project(project_id)
-        for milestone in project.milestones:
-            if milestone.id == milestone_id:
-                milestone.status = status
-                if status == "complete":
-                    project.actual_spend += project.budget * (milestone.budget_pct / 100.0)
-                return milestone
-        raise KeyError(f"Milestone {milestone_id} not found in project {project_id}")
+        milestone = self._get_milestone(project, milestone_id)
+        was_complete = milestone.status == "complete"
+        milestone.status = status
+        is_complete = status == "complete"
+        if is_complete and not was_complete:
+            project.completed_pct += milestone.budget_pct
+            project.actual_spend += project.budget * (milestone.budget_pct / 100.0)
+        elif was_complete and not is_complete:
+            project.completed_pct -= milestone.budget_pct
+            project.actual_spend -= project.budget * (milestone.budget_pct / 100.0)
+        return milestone
 
     def calculate_budget_variance(self, project_id: str) -> BudgetVariance:
         project = self._get_project(project_id)
-        completed_pct = sum(
-            m.budget_pct for m in project.milestones if m.status == "complete"
-        )
-        planned = project.budget * (completed_pct / 100.0) if project.milestones else 0.0
+        planned = project.budget * (project.completed_pct / 100.0) if project.milestones else 0.0
         actual = project.actual_spend
         variance_pct = ((actual - planned) / planned * 100.0) if planned else 0.0
         return BudgetVariance(
@@ -93,6 +114,13 @@ class ConstructionWorkflowEngine:
             raise KeyError(f"Project {project_id} not found")
         return self._projects[project_id]
 
+    @staticmethod
+    def _get_milestone(project: Project, milestone_id: str) -> Milestone:
+        for milestone in project.milestones:
+            if milestone.id == milestone_id:
+                return milestone
+        raise KeyError(f"Milestone {milestone_id} not found in project {project.id}")
+
 
 if __name__ == "__main__":
     engine = ConstructionWorkflowEngine()
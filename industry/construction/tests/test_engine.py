@@ -1,5 +1,8 @@
 """Tests for ConstructionWorkflowEngine."""
+from datetime import date
+
 import pytest
+from pydantic import ValidationError
 from src.engine import ConstructionWorkflowEngine
 
 
@@ -39,8 +42,46 @@ def test_critical_path(engine):
     project = engine.create_project("Tower Block", 5_000_000.0, "2025-01-01", "2027-01-01")
     m_critical = engine.add_milestone(project.id, "Steel Frame", "2025-08-01", 30.0)
     m_float = engine.add_milestone(project.id, "Landscaping", "2026-10-01", 5.0)
-    project = engine._projects[project.id]
-    project.milestones[1].float_days = 30
+    engine.set_milestone_float(project.id, m_float.id, 30)
     critical = engine.get_critical_path(project.id)
     assert len(critical) == 1
     assert critical[0].name == "Steel Frame"
+
+
+def test_budget_variance_tracks_status_reversal(engine):
+    project = engine.create_project("Clinic Fit-out", 400_000.0, "2025-01-01", "2025-09-01")
+    m1 = engine.add_milestone(project.id, "Framing", "2025-03-01", 40.0)
+    engine.update_milestone_status(project.id, m1.id, "complete")
+    engine.update_milestone_status(project.id, m1.id, "complete")
+    assert engine._projects[project.id].completed_pct == 40.0
+    engine.update_milestone_status(project.id, m1.id, "in_progress")
+    variance = engine.calculate_budget_variance(project.id)
+    assert variance.planned == 0.0
+    assert variance.actual == 0.0
+
+
+def test_dates_parsed_once_at_construction(engine):
+    project = engine.create_project("Depot", 250_000.0, "2025-02-01", date(2025, 11, 30))
+    milestone = engine.add_milestone(project.id, "Slab Pour", "2025-05-15", 20.0)
+    assert project.start_date == date(2025, 2, 1)
+    assert project.end_date == date(2025, 11, 30)
+    assert milestone.due_date == date(2025, 5, 15)
+
+
+def test_critical_path_follows_float_changes(engine):
+    project = engine.create_project("Parking Deck", 900_000.0, "2025-01-01", "2025-12-01")
+    m1 = engine.add_milestone(project.id, "Excavation", "2025-03-01", 15.0)
+    m2 = engine.add_milestone(project.id, "Ramps", "2025-07-01", 25.0)
+    engine.set_milestone_float(project.id, m1.id, 10)
+    assert [m.id for m in engine.get_critical_path(project.id)] == [m2.id]
+    engine.set_milestone_float(project.id, m1.id, 0)
+    assert [m.id for m in engine.get_critical_path(project.id)] == [m1.id, m2.id]
+    m2.float_days = 3
+    assert [m.id for m in engine.get_critical_path(project.id)] == [m1.id]
+
+
+def test_budget_variance_is_immutable(engine):
+    project = engine.create_project("Pier", 100_000.0, "2025-01-01", "2025-06-01")
+    variance = engine.calculate_budget_variance(project.id)
+    with pytest.raises(ValidationError):
+        variance.actual = 1.0
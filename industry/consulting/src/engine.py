@@ -1,48 +1,86 @@
 from __future__ import annotations
-import uuid
-from datetime import date, datetime, timezone
+import itertools
+import math
+import os
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 
-class Engagement(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _from_ns(ns: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+# Process-unique prefix plus a counter: cheaper than a uuid4() syscall per record.
+_ID_PREFIX = os.urandom(6).hex()
+_id_counter = itertools.count()
+
+
+def _new_id() -> str:
+    return f"{_ID_PREFIX}-{next(_id_counter):x}"
+
+
+@dataclass(slots=True, kw_only=True)
+class Engagement:
+    id: str = field(default_factory=_new_id)
     client_name: str
     project_type: str
     budget: float
     start_date: date
     team_size: int
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def created_at(self) -> datetime:
+        return _from_ns(self.created_at_ns)
 
 
-class TimeEntry(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class TimeEntry:
+    id: str = field(default_factory=_new_id)
     engagement_id: str
     consultant_id: str
     hours: float
     activity: str
-    logged_at: datetime = Field(default_factory=datetime.utcnow)
+    logged_at_ns: int = field(default_factory=time.time_ns)
 
+    @property
+    def logged_at(self) -> datetime:
+        return _from_ns(self.logged_at_ns)
 
-class InvoiceLineItem(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class InvoiceLineItem:
     description: str
     hours: float
     rate: float
     amount: float
 
 
-class Invoice(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class Invoice:
+    id: str = field(default_factory=_new_id)
     engagement_id: str
     period_start: date
     period_end: date
     line_items: List[InvoiceLineItem]
     total: float
-    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    generated_at_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def generated_at(self) -> datetime:
+        return _from_ns(self.generated_at_ns)
 
 
-class Deliverable(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class Deliverable:
+    id: str = field(default_factory=_new_id)
     engagement_id: str
     name: str
     due_date: date
@@ -60,6 +98,8 @@ class ConsultingWorkflowEngine:
     def __init__(self) -> None:
         self._engagements: dict[str, Engagement] = {}
         self._time_entries: list[TimeEntry] = []
+        self._entries_by_engagement: dict[str, list[TimeEntry]] = defaultdict(list)
+        self._hours_by_engagement: dict[str, float] = defaultdict(float)
         self._deliverables: list[Deliverable] = []
 
     def create_engagement(
@@ -96,6 +136,8 @@ class ConsultingWorkflowEngine:
             activity=activity,
         )
         self._time_entries.append(entry)
+        self._entries_by_engagement[engagement_id].append(entry)
+        self._hours_by_engagement[engagement_id] += hours
         return entry
 
     def generate_invoice(
@@ -107,25 +149,23 @@ class ConsultingWorkflowEngine:
     ) -> Invoice:
         if engagement_id not in self._engagements:
             raise ValueError(f"Engagement {engagement_id} not found")
-        entries = [e for e in self._time_entries if e.engagement_id == engagement_id]
-        line_items: list[InvoiceLineItem] = []
-        for entry in entries:
-            amount = entry.hours * hourly_rate
-            line_items.append(
-                InvoiceLineItem(
-                    description=entry.activity,
-                    hours=entry.hours,
-                    rate=hourly_rate,
-                    amount=amount,
-                )
+        entries = self._entries_by_engagement.get(engagement_id, ())
+        amounts = [e.hours * hourly_rate for e in entries]
+        line_items = [
+            InvoiceLineItem(
+                description=e.activity,
+                hours=e.hours,
+                rate=hourly_rate,
+                amount=amount,
             )
-        total = sum(li.amount for li in line_items)
+            for e, amount in zip(entries, amounts)
+        ]
         return Invoice(
             engagement_id=engagement_id,
             period_start=period_start,
             period_end=period_end,
             line_items=line_items,
-            total=total,
+            total=math.fsum(amounts),
         )
 
     def track_deliverable(
@@ -153,13 +193,12 @@ class ConsultingWorkflowEngine:
     ) -> ProfitMetrics:
         if engagement_id not in self._engagements:
             raise ValueError(f"Engagement {engagement_id} not found")
-        entries = [e for e in self._time_entries if e.engagement_id == engagement_id]
-        total_hours = sum(e.hours for e in entries)
+        total_hours = self._hours_by_engagement.get(engagement_id, 0.0)
         eng = self._engagements[engagement_id]
         revenue = eng.budget
         cost = total_hours * cost_per_hour
         margin_pct = ((revenue - cost) / revenue * 100) if revenue else 0.0
-        return ProfitMetrics(
+        return ProfitMetrics.model_construct(
             engagement_id=engagement_id,
             revenue=revenue,
             cost=cost,
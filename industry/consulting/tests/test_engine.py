@@ -36,3 +36,18 @@ def test_calculate_profitability():
     assert metrics.revenue == 10000.0
     assert metrics.cost == 2000.0
     assert metrics.margin_pct == 80.0
+
+
+def test_generate_invoice_reflects_current_hours():
+    engine = ConsultingWorkflowEngine()
+    eng = engine.create_engagement("Epsilon", "ops", 30000.0, date(2024, 5, 1), 2)
+    entry = engine.log_hours(eng.id, "c1", 4.0, "Discovery")
+    period = (date(2024, 5, 1), date(2024, 5, 31))
+    first = engine.generate_invoice(eng.id, *period)
+    first.line_items.clear()
+    again = engine.generate_invoice(eng.id, *period)
+    assert again.id != first.id
+    assert [li.amount for li in again.line_items] == [600.0]
+    entry.hours = 5.0
+    engine.log_hours(eng.id, "c1", 2.0, "Follow-up")
+    assert engine.generate_invoice(eng.id, *period).total == 1050.0
@@ -1,28 +1,45 @@
 """E-Commerce Engine – products, orders, payments, inventory, and revenue analytics."""
 from __future__ import annotations
 
-import uuid
-from typing import Dict, List
+import itertools
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 
-class Product(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+# Status assigned by process_payment; shared so comparisons short-circuit on identity.
+PAID = "paid"
+
+# Process-unique prefix plus a counter: cheaper than a uuid4() syscall per record.
+_ID_PREFIX = os.urandom(6).hex()
+_id_counter = itertools.count()
+
+
+def _new_id() -> str:
+    return f"{_ID_PREFIX}-{next(_id_counter):x}"
+
+
+@dataclass(slots=True, kw_only=True)
+class Product:
+    id: str = field(default_factory=_new_id)
     name: str
     price: float
     inventory: int
     category: str
 
 
-class OrderItem(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class OrderItem:
     product_id: str
     quantity: int
     unit_price: float
 
 
-class Order(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class Order:
+    id: str = field(default_factory=_new_id)
     customer_id: str
     items: List[OrderItem]
     total: float
@@ -48,6 +65,8 @@ class ECommerceEngine:
     def __init__(self) -> None:
         self._products: Dict[str, Product] = {}
         self._orders: Dict[str, Order] = {}
+        self._paid_count = 0
+        self._paid_revenue = 0.0
 
     def create_product(
         self, name: str, price: float, inventory: int, category: str
@@ -57,28 +76,34 @@ class ECommerceEngine:
         return product
 
     def place_order(self, customer_id: str, items: List[dict]) -> Order:
+        products = self._products
         order_items: List[OrderItem] = []
         total = 0.0
         for item in items:
-            product = self._get_product(item["product_id"])
+            product_id = item["product_id"]
+            product = products.get(product_id)
+            if product is None:
+                raise KeyError(f"Product {product_id} not found")
             qty = item["quantity"]
-            order_items.append(
-                OrderItem(product_id=product.id, quantity=qty, unit_price=product.price)
-            )
-            total += product.price * qty
+            price = product.price
+            total += price * qty
+            order_items.append(OrderItem(product_id=product_id, quantity=qty, unit_price=price))
         order = Order(customer_id=customer_id, items=order_items, total=round(total, 2))
         self._orders[order.id] = order
         return order
 
     def process_payment(self, order_id: str, payment_method: str) -> PaymentResult:
         if order_id not in self._orders:
-            return PaymentResult(
+            return PaymentResult.model_construct(
                 order_id=order_id, success=False, transaction_id="", message="Order not found"
             )
         order = self._orders[order_id]
-        transaction_id = str(uuid.uuid4())
-        order.status = "paid"
-        return PaymentResult(order_id=order_id, success=True, transaction_id=transaction_id)
+        transaction_id = os.urandom(16).hex()
+        if order.status != PAID:
+            self._paid_count += 1
+            self._paid_revenue += order.total
+        order.status = PAID
+        return PaymentResult.model_construct(order_id=order_id, success=True, transaction_id=transaction_id)
 
     def update_inventory(self, product_id: str, quantity_delta: int) -> Product:
         product = self._get_product(product_id)
@@ -90,21 +115,33 @@ class ECommerceEngine:
         product.inventory = new_qty
         return product
 
-    def calculate_revenue_metrics(self, orders: List[Order]) -> RevenueMetrics:
-        paid_orders = [o for o in orders if o.status == "paid"]
-        total_revenue = round(sum(o.total for o in paid_orders), 2)
-        avg_order_value = round(total_revenue / len(paid_orders), 2) if paid_orders else 0.0
-        conversion_rate = round(len(paid_orders) / len(orders), 4) if orders else 0.0
-        return RevenueMetrics(
+    def calculate_revenue_metrics(self, orders: Optional[List[Order]] = None) -> RevenueMetrics:
+        if orders is None:
+            paid_count = self._paid_count
+            order_count = len(self._orders)
+            total_revenue = round(self._paid_revenue, 2)
+        else:
+            paid_count = 0
+            revenue = 0.0
+            for o in orders:
+                if o.status == PAID:
+                    paid_count += 1
+                    revenue += o.total
+            order_count = len(orders)
+            total_revenue = round(revenue, 2)
+        avg_order_value = round(total_revenue / paid_count, 2) if paid_count else 0.0
+        conversion_rate = round(paid_count / order_count, 4) if order_count else 0.0
+        return RevenueMetrics.model_construct(
             total_revenue=total_revenue,
             avg_order_value=avg_order_value,
             conversion_rate=conversion_rate,
         )
 
     def _get_product(self, product_id: str) -> Product:
-        if product_id not in self._products:
+        product = self._products.get(product_id)
+        if product is None:
             raise KeyError(f"Product {product_id} not found")
-        return self._products[product_id]
+        return product
 
 
 if __name__ == "__main__":
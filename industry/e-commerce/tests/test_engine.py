@@ -43,3 +43,22 @@ def test_update_inventory(engine):
     assert updated.inventory == 7
     with pytest.raises(ValueError):
         engine.update_inventory(product.id, -100)
+
+
+def test_revenue_metrics_from_running_totals(engine):
+    p = engine.create_product("Pen", 2.50, 100, "stationery")
+    paid = engine.place_order("CUST003", [{"product_id": p.id, "quantity": 4}])
+    engine.place_order("CUST004", [{"product_id": p.id, "quantity": 1}])
+    engine.process_payment(paid.id, "card")
+    engine.process_payment(paid.id, "card")
+    metrics = engine.calculate_revenue_metrics()
+    assert metrics.total_revenue == 10.0
+    assert metrics.avg_order_value == 10.0
+    assert metrics.conversion_rate == 0.5
+    assert engine.calculate_revenue_metrics(list(engine._orders.values())) == metrics
+
+
+def test_place_order_unknown_product(engine):
+    with pytest.raises(KeyError):
+        engine.place_order("CUST005", [{"product_id": "missing", "quantity": 1}])
+    assert engine._orders == {}
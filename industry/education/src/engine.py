@@ -1,15 +1,28 @@
 """Education Platform Engine – courses, enrollment, progress tracking, and certificates."""
 from __future__ import annotations
 
-import uuid
+import itertools
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
 
+COMPLETED = "completed"
 
-class Course(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+# Process-unique prefix plus a counter: cheaper than a uuid4() syscall per record.
+_ID_PREFIX = os.urandom(6).hex()
+_id_counter = itertools.count()
+
+
+def _new_id() -> str:
+    return f"{_ID_PREFIX}-{next(_id_counter):x}"
+
+
+@dataclass(slots=True, kw_only=True)
+class Course:
+    id: str = field(default_factory=_new_id)
     title: str
     instructor_id: str
     modules: List[str]
@@ -17,21 +30,24 @@ class Course(BaseModel):
     level: str
 
 
-class Enrollment(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class Enrollment:
+    id: str = field(default_factory=_new_id)
     student_id: str
     course_id: str
-    progress: List[Optional[float]] = Field(default_factory=list)
+    progress: List[Optional[float]] = field(default_factory=list)
+    remaining: int = 0
     status: str = "active"
 
 
-class Certificate(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class Certificate:
+    id: str = field(default_factory=_new_id)
     enrollment_id: str
     student_id: str
     course_id: str
     issue_date: str
-    credential_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    credential_id: str = field(default_factory=lambda: os.urandom(16).hex())
 
 
 class EducationPlatformEngine:
@@ -40,6 +56,8 @@ class EducationPlatformEngine:
     def __init__(self) -> None:
         self._courses: Dict[str, Course] = {}
         self._enrollments: Dict[str, Enrollment] = {}
+        self._enroll_totals: Dict[str, int] = defaultdict(int)
+        self._enroll_completed: Dict[str, int] = defaultdict(int)
 
     def create_course(
         self,
@@ -65,8 +83,10 @@ class EducationPlatformEngine:
             student_id=student_id,
             course_id=course_id,
             progress=[None] * len(course.modules),
+            remaining=len(course.modules),
         )
         self._enrollments[enrollment.id] = enrollment
+        self._enroll_totals[course_id] += 1
         return enrollment
 
     def record_progress(
@@ -75,21 +95,23 @@ class EducationPlatformEngine:
         enrollment = self._get_enrollment(enrollment_id)
         if module_index < 0 or module_index >= len(enrollment.progress):
             raise IndexError(f"module_index {module_index} out of range")
+        if enrollment.progress[module_index] is None:
+            enrollment.remaining -= 1
         enrollment.progress[module_index] = score
-        if all(s is not None for s in enrollment.progress):
-            enrollment.status = "completed"
+        if enrollment.remaining == 0 and enrollment.status != COMPLETED:
+            enrollment.status = COMPLETED
+            self._enroll_completed[enrollment.course_id] += 1
         return enrollment
 
     def calculate_completion_rate(self, course_id: str) -> float:
-        enrollments = [e for e in self._enrollments.values() if e.course_id == course_id]
-        if not enrollments:
+        total = self._enroll_totals.get(course_id, 0)
+        if not total:
             return 0.0
-        completed = sum(1 for e in enrollments if e.status == "completed")
-        return round(completed / len(enrollments), 4)
+        return round(self._enroll_completed.get(course_id, 0) / total, 4)
 
     def generate_certificate(self, enrollment_id: str) -> Certificate:
         enrollment = self._get_enrollment(enrollment_id)
-        if enrollment.status != "completed":
+        if enrollment.status != COMPLETED:
             raise ValueError("Enrollment is not yet completed")
         cert = Certificate(
             enrollment_id=enrollment_id,
@@ -45,3 +45,26 @@ def test_generate_certificate(engine):
     assert cert.course_id == course.id
     assert cert.credential_id is not None
     assert cert.issue_date is not None
+
+
+def test_calculate_completion_rate(engine):
+    course = engine.create_course("Statistics", "INST07", ["Intro"], 4.0, "beginner")
+    other = engine.create_course("Physics", "INST08", ["Intro"], 4.0, "beginner")
+    first = engine.enroll_student("STU010", course.id)
+    engine.enroll_student("STU011", course.id)
+    engine.enroll_student("STU012", other.id)
+    engine.record_progress(first.id, 0, 80.0)
+    assert engine.calculate_completion_rate(course.id) == 0.5
+    assert engine.calculate_completion_rate(other.id) == 0.0
+    assert engine.calculate_completion_rate("missing") == 0.0
+
+
+def test_rescoring_a_module_does_not_complete_enrollment(engine):
+    course = engine.create_course("Chemistry", "INST09", ["Atoms", "Bonds"], 6.0, "beginner")
+    enrollment = engine.enroll_student("STU020", course.id)
+    engine.record_progress(enrollment.id, 0, 50.0)
+    engine.record_progress(enrollment.id, 0, 75.0)
+    assert enrollment.remaining == 1
+    assert enrollment.status == "active"
+    engine.record_progress(enrollment.id, 1, 90.0)
+    assert enrollment.status == "completed"
@@ -1,38 +1,78 @@
 from __future__ import annotations
-import uuid
-from datetime import datetime, timezone
+import itertools
+import os
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 
-class Workflow(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+# Terminal instance states.
+COMPLETE = "complete"
+REJECTED = "rejected"
+
+_HOURS_PER_NS = 1 / 3_600_000_000_000
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _from_ns(ns: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+# Process-unique prefix plus a counter: cheaper than a uuid4() syscall per record.
+_ID_PREFIX = os.urandom(6).hex()
+_id_counter = itertools.count()
+
+
+def _new_id() -> str:
+    return f"{_ID_PREFIX}-{next(_id_counter):x}"
+
+
+@dataclass(slots=True, kw_only=True)
+class Workflow:
+    id: str = field(default_factory=_new_id)
     name: str
     steps: List[str]
     approvers: List[str]
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def created_at(self) -> datetime:
+        return _from_ns(self.created_at_ns)
 
 
-class StepRecord(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class StepRecord:
     step_index: int
     step_name: str
     approver: str
     approved: bool
     comment: str
-    completed_at: datetime = Field(default_factory=datetime.utcnow)
+    completed_at_ns: int = field(default_factory=time.time_ns)
 
+    @property
+    def completed_at(self) -> datetime:
+        return _from_ns(self.completed_at_ns)
 
-class WorkflowInstance(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+
+@dataclass(slots=True, kw_only=True)
+class WorkflowInstance:
+    id: str = field(default_factory=_new_id)
     workflow_id: str
     initiator: str
     data: Dict[str, Any]
     current_step: int = 0
     status: str = "in_progress"
-    step_records: List[StepRecord] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    step_records: List[StepRecord] = field(default_factory=list)
+    created_at_ns: int = field(default_factory=time.time_ns)
     completed_at: Optional[datetime] = None
 
+    @property
+    def created_at(self) -> datetime:
+        return _from_ns(self.created_at_ns)
+
 
 class BottleneckReport(BaseModel):
     step: str
@@ -44,6 +84,7 @@ class EnterpriseWorkflowEngine:
     def __init__(self) -> None:
         self._workflows: dict[str, Workflow] = {}
         self._instances: dict[str, WorkflowInstance] = {}
+        self._instances_by_workflow: dict[str, list[WorkflowInstance]] = defaultdict(list)
 
     def define_workflow(
         self,
@@ -70,6 +111,7 @@ class EnterpriseWorkflowEngine:
             current_step=0,
         )
         self._instances[inst.id] = inst
+        self._instances_by_workflow[workflow_id].append(inst)
         return inst
 
     def advance_step(
@@ -82,59 +124,70 @@ class EnterpriseWorkflowEngine:
         if instance_id not in self._instances:
             raise ValueError(f"Instance {instance_id} not found")
         inst = self._instances[instance_id]
-        if inst.status == "complete":
+        if inst.status == COMPLETE:
             raise ValueError("Workflow instance is already complete")
         wf = self._workflows[inst.workflow_id]
-        expected_approver = wf.approvers[inst.current_step % len(wf.approvers)]
+        steps = wf.steps
+        approvers = wf.approvers
+        current_step = inst.current_step
+        expected_approver = approvers[current_step % len(approvers)]
         if approver != expected_approver:
             raise ValueError(
                 f"Wrong approver: expected {expected_approver}, got {approver}"
             )
         record = StepRecord(
-            step_index=inst.current_step,
-            step_name=wf.steps[inst.current_step],
+            step_index=current_step,
+            step_name=steps[current_step],
             approver=approver,
             approved=approved,
             comment=comment,
         )
         inst.step_records.append(record)
         if not approved:
-            inst.status = "rejected"
+            inst.status = REJECTED
         else:
-            inst.current_step += 1
-            if inst.current_step >= len(wf.steps):
-                inst.status = "complete"
+            current_step += 1
+            inst.current_step = current_step
+            if current_step >= len(steps):
+                inst.status = COMPLETE
                 inst.completed_at = datetime.now(timezone.utc)
-        self._instances[instance_id] = inst
         return inst
 
     def get_bottlenecks(self, instances: list[WorkflowInstance]) -> list[BottleneckReport]:
-        step_durations: dict[str, list[float]] = {}
+        # Reduce to exact integer nanosecond sums and counts; convert once per step.
+        total_ns: dict[str, int] = defaultdict(int)
+        counts: dict[str, int] = defaultdict(int)
         for inst in instances:
-            for i, record in enumerate(inst.step_records):
+            prev = inst.created_at_ns
+            for record in inst.step_records:
                 step = record.step_name
-                if i == 0:
-                    duration = (record.completed_at - inst.created_at).total_seconds() / 3600
-                else:
-                    prev = inst.step_records[i - 1]
-                    duration = (record.completed_at - prev.completed_at).total_seconds() / 3600
-                step_durations.setdefault(step, []).append(duration)
-        reports = []
-        for step, durations in step_durations.items():
-            reports.append(
-                BottleneckReport(
-                    step=step,
-                    avg_duration_hours=sum(durations) / len(durations),
-                    count=len(durations),
-                )
+                total_ns[step] += record.completed_at_ns - prev
+                counts[step] += 1
+                prev = record.completed_at_ns
+        reports = [
+            BottleneckReport.model_construct(
+                step=step,
+                avg_duration_hours=total_ns[step] / count * _HOURS_PER_NS,
+                count=count,
             )
+            for step, count in counts.items()
+        ]
         return sorted(reports, key=lambda r: r.avg_duration_hours, reverse=True)
 
     def calculate_completion_rate(
-        self, workflow_id: str, instances: list[WorkflowInstance]
+        self, workflow_id: str, instances: Optional[list[WorkflowInstance]] = None
     ) -> float:
-        relevant = [i for i in instances if i.workflow_id == workflow_id]
-        if not relevant:
+        total = completed = 0
+        if instances is None:
+            relevant = self._instances_by_workflow.get(workflow_id, ())
+            total = len(relevant)
+            completed = sum(1 for i in relevant if i.status == COMPLETE)
+        else:
+            for i in instances:
+                if i.workflow_id == workflow_id:
+                    total += 1
+                    if i.status == COMPLETE:
+                        completed += 1
+        if not total:
             return 0.0
-        completed = sum(1 for i in relevant if i.status == "complete")
-        return completed / len(relevant)
+        return completed / total
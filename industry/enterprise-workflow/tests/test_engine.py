@@ -38,3 +38,54 @@ def test_advance_step_wrong_approver():
     inst = engine.create_instance(wf.id, "employee", {"amount": 200})
     with pytest.raises(ValueError, match="Wrong approver"):
         engine.advance_step(inst.id, "wrongperson", True)
+
+
+def test_completion_rate_uses_tracked_instances():
+    engine = EnterpriseWorkflowEngine()
+    wf = engine.define_workflow("Leave", ["Approve"], ["manager"])
+    other = engine.define_workflow("Travel", ["Approve"], ["manager"])
+    done = engine.create_instance(wf.id, "emp-1", {})
+    engine.create_instance(wf.id, "emp-2", {})
+    engine.create_instance(other.id, "emp-3", {})
+    engine.advance_step(done.id, "manager", True)
+    assert engine.calculate_completion_rate(wf.id) == 0.5
+    assert engine.calculate_completion_rate(other.id) == 0.0
+
+
+def test_get_bottlenecks():
+    engine = EnterpriseWorkflowEngine()
+    wf = engine.define_workflow("Contract", ["Legal", "Sign"], ["legal", "ceo"])
+    inst = engine.create_instance(wf.id, "sales", {})
+    engine.advance_step(inst.id, "legal", True)
+    engine.advance_step(inst.id, "ceo", True)
+    hour_ns = 3_600_000_000_000
+    inst.step_records[0].completed_at_ns = inst.created_at_ns + hour_ns
+    inst.step_records[1].completed_at_ns = inst.created_at_ns + 4 * hour_ns
+    reports = engine.get_bottlenecks([inst])
+    assert [r.step for r in reports] == ["Sign", "Legal"]
+    assert reports[0].avg_duration_hours == pytest.approx(3.0)
+    assert reports[1].avg_duration_hours == pytest.approx(1.0)
+    assert all(r.count == 1 for r in reports)
+
+
+def test_timestamps_are_utc_datetimes():
+    engine = EnterpriseWorkflowEngine()
+    wf = engine.define_workflow("Access", ["Grant"], ["it"])
+    inst = engine.create_instance(wf.id, "emp", {})
+    engine.advance_step(inst.id, "it", True)
+    assert inst.created_at.tzinfo is not None
+    assert inst.step_records[0].completed_at >= inst.created_at
+    assert inst.completed_at >= inst.created_at
+
+
+def test_completion_rate_filters_explicit_instances():
+    engine = EnterpriseWorkflowEngine()
+    wf = engine.define_workflow("Refund", ["Approve"], ["support"])
+    other = engine.define_workflow("Credit", ["Approve"], ["finance"])
+    done = engine.create_instance(wf.id, "cust-1", {})
+    pending = engine.create_instance(wf.id, "cust-2", {})
+    unrelated = engine.create_instance(other.id, "cust-3", {})
+    engine.advance_step(done.id, "support", True)
+    instances = [done, pending, unrelated]
+    assert engine.calculate_completion_rate(wf.id, instances) == 0.5
+    assert engine.calculate_completion_rate("missing", instances) == 0.0
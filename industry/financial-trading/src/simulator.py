@@ -10,7 +10,7 @@ from enum import Enum
 from typing import Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class OrderSide(str, Enum):
@@ -42,14 +42,24 @@ class Position(BaseModel):
     quantity: float
     avg_price: float
     current_price: float = 0.0
+    _market_value: float = PrivateAttr(default=0.0)
+    _unrealized_pnl: float = PrivateAttr(default=0.0)
+
+    def model_post_init(self, __context: object) -> None:
+        self.revalue()
+
+    def revalue(self) -> None:
+        """Recompute cached valuations; call after changing price, quantity or cost basis."""
+        self._market_value = self.current_price * self.quantity
+        self._unrealized_pnl = (self.current_price - self.avg_price) * self.quantity
 
     @property
     def unrealized_pnl(self) -> float:
-        return (self.current_price - self.avg_price) * self.quantity
+        return self._unrealized_pnl
 
     @property
     def market_value(self) -> float:
-        return self.current_price * self.quantity
+        return self._market_value
 
 
 class Portfolio(BaseModel):
@@ -61,11 +71,11 @@ class Portfolio(BaseModel):
 
     @property
     def total_value(self) -> float:
-        return self.cash + sum(p.market_value for p in self.positions.values())
+        return self.cash + sum(p._market_value for p in self.positions.values())
 
     @property
     def total_unrealized_pnl(self) -> float:
-        return sum(p.unrealized_pnl for p in self.positions.values())
+        return sum(p._unrealized_pnl for p in self.positions.values())
 
 
 class TradingSimulator:
@@ -81,13 +91,26 @@ class TradingSimulator:
     def set_price(self, symbol: str, price: float) -> None:
         """Update the simulated market price for a symbol."""
         self._market_prices[symbol] = price
-        if symbol in self.portfolio.positions:
-            self.portfolio.positions[symbol].current_price = price
+        pos = self.portfolio.positions.get(symbol)
+        if pos is not None:
+            pos.current_price = price
+            pos.revalue()
 
     async def place_order(self, symbol: str, side: OrderSide, quantity: float, price: Optional[float] = None) -> Order:
         """Place a simulated order."""
         await asyncio.sleep(0)
-        order = Order(symbol=symbol, side=side, quantity=quantity, price=price)
+        return self._execute(symbol, side, quantity, price, datetime.now(tz=timezone.utc).isoformat())
+
+    async def place_orders(
+        self, orders: list[tuple[str, OrderSide, float, Optional[float]]]
+    ) -> list[Order]:
+        """Place (symbol, side, quantity, price) orders in sequence, yielding to the loop once."""
+        await asyncio.sleep(0)
+        now = datetime.now(tz=timezone.utc).isoformat()
+        return [self._execute(symbol, side, quantity, price, now) for symbol, side, quantity, price in orders]
+
+    def _execute(self, symbol: str, side: OrderSide, quantity: float, price: Optional[float], now: str) -> Order:
+        order = Order(symbol=symbol, side=side, quantity=quantity, price=price, created_at=now)
         fill_price = price or self._market_prices.get(symbol)
 
         if fill_price is None:
@@ -108,8 +131,9 @@ class TradingSimulator:
                 pos.avg_price = (pos.avg_price * pos.quantity + fill_price * quantity) / total_qty
                 pos.quantity = total_qty
                 pos.current_price = fill_price
+                pos.revalue()
             else:
-                self.portfolio.positions[symbol] = Position(symbol=symbol, quantity=quantity, avg_price=fill_price, current_price=fill_price)
+                self.portfolio.positions[symbol] = Position.model_construct(symbol=symbol, quantity=quantity, avg_price=fill_price, current_price=fill_price)
         elif side == OrderSide.SELL:
             pos = self.portfolio.positions.get(symbol)
             if pos is None or pos.quantity < quantity:
@@ -120,9 +144,11 @@ class TradingSimulator:
             pos.quantity -= quantity
             if pos.quantity == 0:
                 del self.portfolio.positions[symbol]
+            else:
+                pos.revalue()
 
         order.status = OrderStatus.FILLED
         order.filled_price = fill_price
-        order.filled_at = datetime.now(tz=timezone.utc).isoformat()
+        order.filled_at = now
         self.portfolio.orders.append(order)
         return order
@@ -40,3 +40,30 @@ async def test_portfolio_value():
     await sim.place_order("AAPL", OrderSide.BUY, 50, price=100.0)
     sim.set_price("AAPL", 110.0)
     assert sim.portfolio.total_value == 10_500.0  # 5000 cash + 5500 position
+
+
+@pytest.mark.asyncio
+async def test_position_valuation_tracks_price_and_partial_sells():
+    sim = TradingSimulator(initial_cash=10_000.0)
+    sim.set_price("MSFT", 100.0)
+    await sim.place_order("MSFT", OrderSide.BUY, 20, price=100.0)
+    sim.set_price("MSFT", 120.0)
+    await sim.place_order("MSFT", OrderSide.SELL, 5, price=120.0)
+    pos = sim.portfolio.positions["MSFT"]
+    assert pos.market_value == 1_800.0
+    assert pos.unrealized_pnl == 300.0
+    assert sim.portfolio.total_unrealized_pnl == 300.0
+
+
+@pytest.mark.asyncio
+async def test_place_orders_batch_fills_in_sequence():
+    sim = TradingSimulator(initial_cash=1_000.0)
+    orders = await sim.place_orders([
+        ("AAPL", OrderSide.BUY, 5, 100.0),
+        ("AAPL", OrderSide.BUY, 6, 100.0),  # only 500 cash left
+        ("AAPL", OrderSide.SELL, 2, 110.0),
+    ])
+    assert [o.status for o in orders] == [OrderStatus.FILLED, OrderStatus.REJECTED, OrderStatus.FILLED]
+    assert sim.portfolio.cash == 720.0
+    assert sim.portfolio.positions["AAPL"].quantity == 3
+    assert orders[0].filled_at == orders[2].filled_at
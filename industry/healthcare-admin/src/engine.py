@@ -1,25 +1,45 @@
 """Healthcare Administration Engine – scheduling, billing, and provider utilization."""
 from __future__ import annotations
 
-import uuid
-from datetime import datetime, timedelta
-from typing import Dict, List
+import itertools
+import os
+from bisect import bisect_left, insort
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from math import fsum
+from typing import Dict, List, Tuple
 
-from pydantic import BaseModel, Field
 
+# Process-unique prefix plus a counter: cheaper than a uuid4() syscall per record.
+_ID_PREFIX = os.urandom(6).hex()
+_id_counter = itertools.count()
 
-class Appointment(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+
+def _new_id() -> str:
+    return f"{_ID_PREFIX}-{next(_id_counter):x}"
+
+
+@dataclass(slots=True, kw_only=True)
+class Appointment:
+    id: str = field(default_factory=_new_id)
     patient_id: str
     provider_id: str
     scheduled_at: str
     type: str
     duration_mins: int = 30
     status: str = "scheduled"
+    start_ts: float = field(init=False)
+    end_ts: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.start_ts = datetime.fromisoformat(self.scheduled_at).timestamp()
+        self.end_ts = self.start_ts + self.duration_mins * 60
 
 
-class BillingRecord(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class BillingRecord:
+    id: str = field(default_factory=_new_id)
     appointment_id: str
     procedure_codes: List[str]
     amounts: List[float]
@@ -35,6 +55,11 @@ class HealthcareAdminEngine:
     def __init__(self) -> None:
         self._appointments: Dict[str, Appointment] = {}
         self._billing: Dict[str, BillingRecord] = {}
+        self._by_provider_date: Dict[Tuple[str, str], List[Appointment]] = defaultdict(list)
+        # Per-provider (start_ts, end_ts, id) sorted by start, plus the longest
+        # booking, so conflict checks only visit intervals that can overlap.
+        self._provider_intervals: Dict[str, List[Tuple[float, float, str]]] = defaultdict(list)
+        self._max_duration: Dict[str, float] = defaultdict(float)
 
     def schedule_appointment(
         self,
@@ -52,26 +77,35 @@ class HealthcareAdminEngine:
             duration_mins=duration_mins,
         )
         self._appointments[appt.id] = appt
+        self._by_provider_date[(provider_id, datetime_str[:10])].append(appt)
+        insort(self._provider_intervals[provider_id], (appt.start_ts, appt.end_ts, appt.id))
+        if appt.end_ts - appt.start_ts > self._max_duration[provider_id]:
+            self._max_duration[provider_id] = appt.end_ts - appt.start_ts
         return appt
 
     def get_daily_schedule(self, provider_id: str, date_str: str) -> List[Appointment]:
+        if len(date_str) == 10:
+            return list(self._by_provider_date.get((provider_id, date_str), ()))
+        # Any other prefix ("2025-06", a full timestamp) keeps the original startswith match.
         return [
-            a
-            for a in self._appointments.values()
+            a for a in self._appointments.values()
             if a.provider_id == provider_id and a.scheduled_at.startswith(date_str)
         ]
 
     def check_appointment_conflict(
         self, provider_id: str, datetime_str: str, duration_mins: int
     ) -> bool:
-        new_start = datetime.fromisoformat(datetime_str)
-        new_end = new_start + timedelta(minutes=duration_mins)
-        for appt in self._appointments.values():
-            if appt.provider_id != provider_id or appt.status == "cancelled":
-                continue
-            existing_start = datetime.fromisoformat(appt.scheduled_at)
-            existing_end = existing_start + timedelta(minutes=appt.duration_mins)
-            if new_start < existing_end and new_end > existing_start:
+        intervals = self._provider_intervals.get(provider_id)
+        if not intervals:
+            return False
+        new_start = datetime.fromisoformat(datetime_str).timestamp()
+        new_end = new_start + duration_mins * 60
+        # Anything starting before new_start - longest booking has already ended.
+        lo = bisect_left(intervals, (new_start - self._max_duration[provider_id],))
+        for start_ts, end_ts, appt_id in intervals[lo:]:
+            if start_ts >= new_end:
+                break
+            if end_ts > new_start and self._appointments[appt_id].status != "cancelled":
                 return True
         return False
 
@@ -84,7 +118,7 @@ class HealthcareAdminEngine:
             appointment_id=appointment_id,
             procedure_codes=procedure_codes,
             amounts=amounts,
-            total=round(sum(amounts), 2),
+            total=round(fsum(amounts), 2),
         )
         self._billing[record.id] = record
         return record
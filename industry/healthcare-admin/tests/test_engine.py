@@ -25,6 +25,15 @@ def test_get_daily_schedule(engine):
     assert all(a.provider_id == "DR001" for a in schedule)
 
 
+def test_get_daily_schedule_accepts_other_prefixes(engine):
+    first = engine.schedule_appointment("P001", "DR001", "2025-06-10T09:00", "checkup")
+    second = engine.schedule_appointment("P002", "DR001", "2025-06-11T10:00", "followup")
+    engine.schedule_appointment("P003", "DR002", "2025-06-10T09:00", "checkup")
+    assert engine.get_daily_schedule("DR001", "2025-06") == [first, second]
+    assert engine.get_daily_schedule("DR001", "2025-06-11T10:00") == [second]
+    assert engine.get_daily_schedule("DR001", "2025-07") == []
+
+
 def test_check_appointment_conflict(engine):
     engine.schedule_appointment("P001", "DR001", "2025-06-10T09:00", "checkup", duration_mins=60)
     # Overlapping appointment
@@ -39,3 +48,19 @@ def test_generate_billing_record(engine):
     assert billing.appointment_id == appt.id
     assert billing.total == 225.50
     assert len(billing.procedure_codes) == 2
+
+
+def test_provider_utilization(engine):
+    engine.schedule_appointment("P001", "DR001", "2025-06-10T09:00", "checkup", duration_mins=120)
+    engine.schedule_appointment("P002", "DR001", "2025-06-10T13:00", "followup", duration_mins=120)
+    engine.schedule_appointment("P003", "DR001", "2025-06-11T09:00", "checkup", duration_mins=60)
+    assert engine.calculate_provider_utilization("DR001", "2025-06-10") == 0.5
+    assert engine.calculate_provider_utilization("DR002", "2025-06-10") == 0.0
+
+
+def test_conflict_with_long_earlier_appointment(engine):
+    engine.schedule_appointment("P001", "DR001", "2025-06-10T08:00", "surgery", duration_mins=240)
+    engine.schedule_appointment("P002", "DR001", "2025-06-10T09:00", "checkup", duration_mins=15)
+    assert engine.check_appointment_conflict("DR001", "2025-06-10T11:00", 30) is True
+    assert engine.check_appointment_conflict("DR001", "2025-06-10T12:00", 30) is False
+    assert engine.check_appointment_conflict("DR002", "2025-06-10T11:00", 30) is False
@@ -1,24 +1,56 @@
 from __future__ import annotations
-import uuid
+import itertools
+import operator
+import os
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 
 VALID_RATINGS = {"buy", "hold", "sell"}
 
 
-class ResearchNote(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+# criteria key -> (note attribute, comparison applied as op(note_value, criterion))
+_SCREEN_CHECKS = {
+    "rating": ("rating", operator.eq),
+    "min_target_price": ("target_price", operator.ge),
+    "max_target_price": ("target_price", operator.le),
+    "ticker": ("ticker", operator.eq),
+    "analyst_id": ("analyst_id", operator.eq),
+}
+
+
+# Process-unique prefix plus a counter: cheaper than a uuid4() syscall per record.
+_ID_PREFIX = os.urandom(6).hex()
+_id_counter = itertools.count()
+
+
+def _new_id() -> str:
+    return f"{_ID_PREFIX}-{next(_id_counter):x}"
+
+
+_utcnow = partial(datetime.now, timezone.utc)
+
+
+@dataclass(slots=True, kw_only=True)
+class ResearchNote:
+    id: str = field(default_factory=_new_id)
     analyst_id: str
     ticker: str
     thesis: str
     target_price: float
     rating: str
     current_price: float = 0.0
-    price_history: List[Dict[str, Any]] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    price_history: List[Dict[str, Any]] = field(default_factory=list)
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime = field(default_factory=_utcnow)
 
 
 class ResearchReport(BaseModel):
@@ -39,16 +71,50 @@ class InvestmentResearchEngine:
         target_price: float,
         rating: str,
         current_price: float = 0.0,
+    ) -> ResearchNote:
+        return self._create_note(
+            analyst_id, ticker, thesis, target_price, rating, current_price, _utcnow()
+        )
+
+    def create_research_notes_bulk(
+        self, records: list[dict[str, Any]], now: Optional[datetime] = None
+    ) -> list[ResearchNote]:
+        """Create many notes that share a single creation timestamp."""
+        now = now or _utcnow()
+        return [
+            self._create_note(
+                r["analyst_id"],
+                r["ticker"],
+                r["thesis"],
+                r["target_price"],
+                r["rating"],
+                r.get("current_price", 0.0),
+                now,
+            )
+            for r in records
+        ]
+
+    def _create_note(
+        self,
+        analyst_id: str,
+        ticker: str,
+        thesis: str,
+        target_price: float,
+        rating: str,
+        current_price: float,
+        now: datetime,
     ) -> ResearchNote:
         if rating not in VALID_RATINGS:
             raise ValueError(f"Invalid rating: {rating}. Must be one of {VALID_RATINGS}")
         note = ResearchNote(
             analyst_id=analyst_id,
-            ticker=ticker,
+            ticker=sys.intern(ticker),
             thesis=thesis,
             target_price=target_price,
-            rating=rating,
+            rating=sys.intern(rating),
             current_price=current_price,
+            created_at=now,
+            updated_at=now,
         )
         self._notes[note.id] = note
         return note
@@ -62,15 +128,15 @@ class InvestmentResearchEngine:
         if note_id not in self._notes:
             raise ValueError(f"Note {note_id} not found")
         note = self._notes[note_id]
+        now = _utcnow()
         note.price_history.append({
             "old_target": note.target_price,
             "new_target": new_target,
             "rationale": rationale,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "updated_at": now.isoformat(),
         })
         note.target_price = new_target
-        note.updated_at = datetime.now(timezone.utc)
-        self._notes[note_id] = note
+        note.updated_at = now
         return note
 
     def calculate_portfolio_alpha(
@@ -80,29 +146,24 @@ class InvestmentResearchEngine:
     ) -> float:
         if not notes:
             return 0.0
-        returns = []
+        total_return = 0.0
         for note in notes:
-            if note.current_price > 0:
-                implied_return = (note.target_price - note.current_price) / note.current_price * 100
-            else:
-                implied_return = 0.0
-            returns.append(implied_return)
-        avg_return = sum(returns) / len(returns)
-        return avg_return - market_return_pct
+            price = note.current_price
+            if price > 0:
+                total_return += (note.target_price - price) / price * 100
+        return total_return / len(notes) - market_return_pct
 
     def screen_opportunities(self, criteria: dict[str, Any]) -> list[ResearchNote]:
-        results = list(self._notes.values())
-        if "rating" in criteria:
-            results = [n for n in results if n.rating == criteria["rating"]]
-        if "min_target_price" in criteria:
-            results = [n for n in results if n.target_price >= criteria["min_target_price"]]
-        if "max_target_price" in criteria:
-            results = [n for n in results if n.target_price <= criteria["max_target_price"]]
-        if "ticker" in criteria:
-            results = [n for n in results if n.ticker == criteria["ticker"]]
-        if "analyst_id" in criteria:
-            results = [n for n in results if n.analyst_id == criteria["analyst_id"]]
-        return results
+        # Interned criteria match interned note fields by identity before any char compare.
+        checks = [
+            (operator.attrgetter(attr), op, _intern(criteria[key]))
+            for key, (attr, op) in _SCREEN_CHECKS.items()
+            if key in criteria
+        ]
+        return [
+            n for n in self._notes.values()
+            if all(op(get(n), value) for get, op, value in checks)
+        ]
 
     def generate_research_report(self, note_id: str) -> ResearchReport:
         if note_id not in self._notes:
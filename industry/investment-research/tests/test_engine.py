@@ -34,3 +34,38 @@ def test_generate_research_report():
     assert report.note.ticker == "NVDA"
     assert report.metrics["upside_pct"] == 25.0
     assert "Buy" in report.recommendation
+
+
+def test_screen_opportunities_combined_criteria():
+    engine = InvestmentResearchEngine()
+    engine.create_research_note("a1", "MSFT", "Cloud growth", 400.0, "buy", current_price=350.0)
+    engine.create_research_note("a2", "AMZN", "Retail margins", 220.0, "buy", current_price=180.0)
+    engine.create_research_note("a1", "ORCL", "Database moat", 150.0, "buy", current_price=140.0)
+    hits = engine.screen_opportunities(
+        {"rating": "buy", "min_target_price": 200.0, "max_target_price": 450.0, "analyst_id": "a1"}
+    )
+    assert [n.ticker for n in hits] == ["MSFT"]
+    assert len(engine.screen_opportunities({})) == 3
+
+
+def test_calculate_portfolio_alpha():
+    engine = InvestmentResearchEngine()
+    n1 = engine.create_research_note("a1", "MSFT", "Cloud growth", 120.0, "buy", current_price=100.0)
+    n2 = engine.create_research_note("a1", "IPO", "Unpriced listing", 50.0, "hold")
+    assert engine.calculate_portfolio_alpha([n1, n2], 5.0) == 5.0
+    assert engine.calculate_portfolio_alpha([], 5.0) == 0.0
+
+
+def test_create_research_notes_bulk_shares_timestamp():
+    engine = InvestmentResearchEngine()
+    notes = engine.create_research_notes_bulk([
+        {"analyst_id": "a1", "ticker": "TSLA", "thesis": "EV scale", "target_price": 300.0, "rating": "hold"},
+        {"analyst_id": "a2", "ticker": "F", "thesis": "Margins", "target_price": 15.0, "rating": "sell", "current_price": 12.0},
+    ])
+    assert len(notes) == 2
+    assert notes[0].created_at == notes[1].created_at == notes[0].updated_at
+    assert notes[0].created_at.tzinfo is not None
+    with pytest.raises(ValueError):
+        engine.create_research_notes_bulk([
+            {"analyst_id": "a1", "ticker": "X", "thesis": "t", "target_price": 1.0, "rating": "short"},
+        ])
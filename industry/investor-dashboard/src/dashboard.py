@@ -4,15 +4,27 @@ Portfolio tracking, returns analysis, and investor reporting.
 """
 from __future__ import annotations
 
+import itertools
+import os
+import sys
+from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Optional
-from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
 
+# Process-unique prefix plus a counter: cheaper than a uuid4() syscall per record.
+_ID_PREFIX = os.urandom(6).hex()
+_id_counter = itertools.count()
+
+
+def _new_id() -> str:
+    return f"{_ID_PREFIX}-{next(_id_counter):x}"
+
+
 class Investment(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str
     asset_class: str  # "equity" | "real_estate" | "fixed_income" | "crypto" | "alternative"
     invested_amount: float
@@ -46,6 +58,7 @@ class InvestorDashboard:
         self._investments: dict[str, Investment] = {}
 
     def add_investment(self, inv: Investment) -> Investment:
+        inv.asset_class = sys.intern(inv.asset_class)
         self._investments[inv.id] = inv
         return inv
 
@@ -60,28 +73,36 @@ class InvestorDashboard:
         if not self._investments:
             return PortfolioMetrics(total_invested=0, current_value=0, total_return=0, total_return_pct=0)
 
-        invs = list(self._investments.values())
-        total_invested = sum(i.invested_amount for i in invs)
-        current_value = sum(i.current_value for i in invs)
+        total_invested = 0.0
+        current_value = 0.0
+        best_pct = worst_pct = None
+        best = worst = None
+        allocation: dict[str, float] = defaultdict(float)
+        for inv in self._investments.values():
+            invested = inv.invested_amount
+            value = inv.current_value
+            total_invested += invested
+            current_value += value
+            allocation[inv.asset_class] += value
+            pct = (value - invested) / invested * 100 if invested else 0.0
+            if best_pct is None or pct > best_pct:
+                best_pct, best = pct, inv.name
+            if worst_pct is None or pct < worst_pct:
+                worst_pct, worst = pct, inv.name
         total_return = current_value - total_invested
         total_return_pct = (total_return / total_invested * 100) if total_invested else 0.0
 
-        best = max(invs, key=lambda i: i.return_pct)
-        worst = min(invs, key=lambda i: i.return_pct)
-
-        # Asset allocation
-        allocation: dict[str, float] = {}
-        for inv in invs:
-            allocation[inv.asset_class] = allocation.get(inv.asset_class, 0) + inv.current_value
         if current_value > 0:
             allocation = {k: v / current_value * 100 for k, v in allocation.items()}
+        else:
+            allocation = dict(allocation)
 
         return PortfolioMetrics(
             total_invested=round(total_invested, 2),
             current_value=round(current_value, 2),
             total_return=round(total_return, 2),
             total_return_pct=round(total_return_pct, 2),
-            best_performer=best.name,
-            worst_performer=worst.name,
+            best_performer=best,
+            worst_performer=worst,
             asset_allocation=allocation,
         )
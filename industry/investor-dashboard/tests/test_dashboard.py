@@ -33,3 +33,21 @@ def test_asset_allocation():
     metrics = dash.get_metrics()
     assert abs(metrics.asset_allocation["equity"] - 50.0) < 0.01
     assert abs(metrics.asset_allocation["real_estate"] - 50.0) < 0.01
+
+
+def test_best_and_worst_performers():
+    dash = InvestorDashboard()
+    dash.add_investment(Investment(name="Flat", asset_class="fixed_income", invested_amount=1000, current_value=1000, entry_date="2025-01-01"))
+    dash.add_investment(Investment(name="Up", asset_class="crypto", invested_amount=1000, current_value=1500, entry_date="2025-01-01"))
+    dash.add_investment(Investment(name="Down", asset_class="equity", invested_amount=1000, current_value=800, entry_date="2025-01-01"))
+    metrics = dash.get_metrics()
+    assert metrics.best_performer == "Up"
+    assert metrics.worst_performer == "Down"
+
+
+def test_investment_coerces_numeric_strings():
+    dash = InvestorDashboard()
+    dash.add_investment(Investment(name="S", asset_class="equity", invested_amount="1000", current_value="1500", entry_date="2025-01-01"))
+    metrics = dash.get_metrics()
+    assert metrics.total_invested == 1000
+    assert metrics.total_return == 500
@@ -1,6 +1,13 @@
 from __future__ import annotations
-import uuid
+import heapq
+import itertools
+import os
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial
+from math import fsum
 from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
@@ -8,22 +15,36 @@ from pydantic import BaseModel, Field
 ASSET_TYPES = {"course", "ebook", "template", "consulting", "saas"}
 
 
-class KnowledgeAsset(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+# Process-unique prefix plus a counter: cheaper than a uuid4() syscall per record.
+_ID_PREFIX = os.urandom(6).hex()
+_id_counter = itertools.count()
+
+
+def _new_id() -> str:
+    return f"{_ID_PREFIX}-{next(_id_counter):x}"
+
+
+_utcnow = partial(datetime.now, timezone.utc)
+
+
+@dataclass(slots=True, kw_only=True)
+class KnowledgeAsset:
+    id: str = field(default_factory=_new_id)
     title: str
     type: str
     price: float
     creator_id: str
     description: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_utcnow)
 
 
-class Sale(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class Sale:
+    id: str = field(default_factory=_new_id)
     asset_id: str
     buyer_id: str
     price_paid: float
-    sold_at: datetime = Field(default_factory=datetime.utcnow)
+    sold_at: datetime = field(default_factory=_utcnow)
 
 
 class RoyaltyReport(BaseModel):
@@ -33,11 +54,11 @@ class RoyaltyReport(BaseModel):
 
 
 class Subscription(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     creator_id: str
     subscriber_id: str
     tier: str
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: datetime = Field(default_factory=_utcnow)
 
 
 class CreatorDashboard(BaseModel):
@@ -52,6 +73,11 @@ class KnowledgeMonetizationEngine:
         self._assets: dict[str, KnowledgeAsset] = {}
         self._sales: list[Sale] = []
         self._subscriptions: list[Subscription] = []
+        # Aggregates maintained on write so dashboards never rescan the catalog or sales.
+        # Insertion-ordered id "sets", so revenue ties rank in creation order.
+        self._assets_by_creator: dict[str, dict[str, None]] = defaultdict(dict)
+        self._revenue_by_asset: dict[str, float] = defaultdict(float)
+        self._sales_by_creator: dict[str, int] = defaultdict(int)
 
     def create_asset(
         self,
@@ -65,12 +91,13 @@ class KnowledgeMonetizationEngine:
             raise ValueError(f"Invalid asset type: {type}. Must be one of {ASSET_TYPES}")
         asset = KnowledgeAsset(
             title=title,
-            type=type,
+            type=sys.intern(type),
             price=price,
             creator_id=creator_id,
             description=description,
         )
         self._assets[asset.id] = asset
+        self._assets_by_creator[creator_id][asset.id] = None
         return asset
 
     def record_sale(
@@ -79,10 +106,13 @@ class KnowledgeMonetizationEngine:
         buyer_id: str,
         price_paid: float,
     ) -> Sale:
-        if asset_id not in self._assets:
+        asset = self._assets.get(asset_id)
+        if asset is None:
             raise ValueError(f"Asset {asset_id} not found")
         sale = Sale(asset_id=asset_id, buyer_id=buyer_id, price_paid=price_paid)
         self._sales.append(sale)
+        self._revenue_by_asset[asset_id] += price_paid
+        self._sales_by_creator[asset.creator_id] += 1
         return sale
 
     def calculate_royalties(
@@ -90,12 +120,12 @@ class KnowledgeMonetizationEngine:
         creator_id: str,
         period_sales: list[Sale],
     ) -> RoyaltyReport:
-        creator_assets = {a.id for a in self._assets.values() if a.creator_id == creator_id}
+        creator_assets = self._assets_by_creator.get(creator_id, {})
         relevant = [s for s in period_sales if s.asset_id in creator_assets]
         by_asset: dict[str, float] = {}
         for sale in relevant:
             by_asset[sale.asset_id] = by_asset.get(sale.asset_id, 0.0) + sale.price_paid
-        total = sum(by_asset.values())
+        total = fsum(by_asset.values())
         return RoyaltyReport(creator_id=creator_id, total=total, by_asset=by_asset)
 
     def track_subscriber(
@@ -109,16 +139,16 @@ class KnowledgeMonetizationEngine:
         return sub
 
     def generate_creator_dashboard(self, creator_id: str) -> CreatorDashboard:
-        creator_assets = {a.id: a for a in self._assets.values() if a.creator_id == creator_id}
-        sales = [s for s in self._sales if s.asset_id in creator_assets]
-        revenue = sum(s.price_paid for s in sales)
-        asset_revenue: dict[str, float] = {}
-        for sale in sales:
-            asset_revenue[sale.asset_id] = asset_revenue.get(sale.asset_id, 0.0) + sale.price_paid
-        top_assets = sorted(asset_revenue, key=lambda k: asset_revenue[k], reverse=True)[:5]
+        revenue_by_asset = self._revenue_by_asset
+        asset_revenue = {
+            asset_id: revenue_by_asset[asset_id]
+            for asset_id in self._assets_by_creator.get(creator_id, ())
+            if asset_id in revenue_by_asset
+        }
+        top_assets = heapq.nlargest(5, asset_revenue, key=asset_revenue.__getitem__)
         return CreatorDashboard(
             creator_id=creator_id,
-            revenue=revenue,
-            sales=len(sales),
+            revenue=fsum(asset_revenue.values()),
+            sales=self._sales_by_creator.get(creator_id, 0),
             top_assets=top_assets,
         )
@@ -36,3 +36,43 @@ def test_generate_creator_dashboard():
     assert dashboard.revenue == 98.0
     assert dashboard.sales == 2
     assert asset.id in dashboard.top_assets
+
+
+def test_creator_dashboard_isolates_creators():
+    engine = KnowledgeMonetizationEngine()
+    course = engine.create_asset("Go Basics", "course", 50.0, "creator-5", "Go")
+    ebook = engine.create_asset("Go Tips", "ebook", 10.0, "creator-5", "Tips")
+    other = engine.create_asset("Rust Basics", "course", 80.0, "creator-6", "Rust")
+    engine.record_sale(ebook.id, "buyer-1", 10.0)
+    engine.record_sale(course.id, "buyer-2", 50.0)
+    engine.record_sale(other.id, "buyer-3", 80.0)
+    dashboard = engine.generate_creator_dashboard("creator-5")
+    assert dashboard.revenue == 60.0
+    assert dashboard.sales == 2
+    assert dashboard.top_assets == [course.id, ebook.id]
+    assert engine.generate_creator_dashboard("creator-7").sales == 0
+
+
+def test_calculate_royalties_ignores_other_creators():
+    engine = KnowledgeMonetizationEngine()
+    mine = engine.create_asset("Ops Guide", "ebook", 20.0, "creator-8", "Ops")
+    theirs = engine.create_asset("Dev Guide", "ebook", 30.0, "creator-9", "Dev")
+    sales = [
+        engine.record_sale(mine.id, "buyer-1", 20.0),
+        engine.record_sale(theirs.id, "buyer-2", 30.0),
+    ]
+    report = engine.calculate_royalties("creator-8", sales)
+    assert report.by_asset == {mine.id: 20.0}
+    assert engine.calculate_royalties("creator-10", sales).total == 0
+
+
+def test_creator_dashboard_breaks_revenue_ties_in_creation_order():
+    engine = KnowledgeMonetizationEngine()
+    assets = [
+        engine.create_asset(f"Ebook {i}", "ebook", 10.0, "creator-9", "Ebook")
+        for i in range(8)
+    ]
+    for asset in reversed(assets):
+        engine.record_sale(asset.id, "buyer-1", 10.0)
+    dashboard = engine.generate_creator_dashboard("creator-9")
+    assert dashboard.top_assets == [a.id for a in assets[:5]]
@@ -2,23 +2,37 @@
 
 from __future__ import annotations
 
-import uuid
+import itertools
+import os
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Optional
+from operator import itemgetter
+from typing import Any, Optional, TypedDict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 
-class Lead(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+# Process-unique prefix plus a counter: cheaper than a uuid4() syscall per record.
+_ID_PREFIX = os.urandom(6).hex()
+_id_counter = itertools.count()
+
+
+def _new_id() -> str:
+    return f"{_ID_PREFIX}-{next(_id_counter):x}"
+
+
+@dataclass(slots=True, kw_only=True)
+class Lead:
+    id: str = field(default_factory=_new_id)
     source: str
     email: Optional[str] = None
     name: Optional[str] = None
     phone: Optional[str] = None
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
     score: float = 0.0
     status: str = "new"
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 class PipelineStats(BaseModel):
@@ -28,7 +42,7 @@ class PipelineStats(BaseModel):
     conversion_rate: float
 
 
-class CRMPayload(BaseModel):
+class CRMPayload(TypedDict):
     lead_id: str
     email: Optional[str]
     name: Optional[str]
@@ -40,6 +54,8 @@ class CRMPayload(BaseModel):
 
 
 class LeadIngestionPipeline:
+    _SOURCE_SCORE = {"organic": 25.0, "paid": 20.0}
+
     def __init__(self) -> None:
         self._leads: dict[str, Lead] = {}
 
@@ -51,12 +67,13 @@ class LeadIngestionPipeline:
         phone: Optional[str] = None,
         metadata: Optional[dict[str, Any]] = None,
     ) -> Lead:
+        metadata = metadata or {}
         lead = Lead(
-            source=source,
+            source=sys.intern(source),
             email=email,
             name=name,
             phone=phone,
-            metadata=metadata or {},
+            metadata=metadata,
             status="new",
         )
         lead.score = self._compute_score(lead)
@@ -64,19 +81,18 @@ class LeadIngestionPipeline:
         return lead
 
     def _compute_score(self, lead: Lead) -> float:
-        score = 0.0
-        if lead.email:
-            score += 20.0
-        if lead.phone:
-            score += 15.0
-        if lead.source == "organic":
-            score += 25.0
-        elif lead.source == "paid":
-            score += 20.0
-        if lead.metadata:
-            filled = sum(1 for v in lead.metadata.values() if v is not None and v != "")
-            completeness = filled / len(lead.metadata) if lead.metadata else 0.0
-            score += completeness * 20.0
+        # Recomputed on every score so later edits to lead.metadata are picked up.
+        metadata = lead.metadata
+        completeness = 0.0
+        if metadata:
+            filled = sum(1 for v in metadata.values() if v is not None and v != "")
+            completeness = filled / len(metadata)
+        score = (
+            20.0 * bool(lead.email)
+            + 15.0 * bool(lead.phone)
+            + self._SOURCE_SCORE.get(lead.source, 0.0)
+            + completeness * 20.0
+        )
         return round(score, 2)
 
     def score_lead(self, lead_id: str) -> float:
@@ -90,9 +106,14 @@ class LeadIngestionPipeline:
         return lead
 
     def get_pipeline_stats(self) -> PipelineStats:
-        total = len(self._leads)
-        qualified = sum(1 for l in self._leads.values() if l.status == "qualified")
-        rejected = sum(1 for l in self._leads.values() if l.status == "rejected")
+        leads = self._leads
+        total = len(leads)
+        qualified = rejected = 0
+        for lead in leads.values():
+            if lead.status == "qualified":
+                qualified += 1
+            elif lead.status == "rejected":
+                rejected += 1
         conversion_rate = (qualified / total * 100.0) if total > 0 else 0.0
         return PipelineStats(
             total=total,
@@ -101,21 +122,24 @@ class LeadIngestionPipeline:
             conversion_rate=round(conversion_rate, 2),
         )
 
-    def export_to_crm(self, lead_ids: list[str]) -> list[dict[str, Any]]:
+    def export_to_crm(self, lead_ids: list[str]) -> list[CRMPayload]:
+        if not lead_ids:
+            return []
         now = datetime.now(timezone.utc)
-        payloads = []
-        for lid in lead_ids:
-            lead = self._leads[lid]
-            payloads.append(
-                CRMPayload(
-                    lead_id=lead.id,
-                    email=lead.email,
-                    name=lead.name,
-                    phone=lead.phone,
-                    score=lead.score,
-                    status=lead.status,
-                    source=lead.source,
-                    exported_at=now,
-                ).model_dump()
-            )
-        return payloads
+        leads = itemgetter(*lead_ids)(self._leads)
+        if len(lead_ids) == 1:
+            leads = (leads,)
+        # Build the payload dicts directly; asdict() would deep-copy every field.
+        return [
+            {
+                "lead_id": lead.id,
+                "email": lead.email,
+                "name": lead.name,
+                "phone": lead.phone,
+                "score": lead.score,
+                "status": lead.status,
+                "source": lead.source,
+                "exported_at": now,
+            }
+            for lead in leads
+        ]
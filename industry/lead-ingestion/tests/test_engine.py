@@ -68,3 +68,28 @@ def test_export_to_crm(pipeline):
     assert p["email"] == "e@x.com"
     assert p["source"] == "paid"
     assert "exported_at" in p
+
+
+def test_score_partial_metadata_and_unknown_source(pipeline):
+    lead = pipeline.ingest_lead(
+        source="referral",
+        email="f@x.com",
+        metadata={"company": "Acme", "role": "", "size": None, "region": "EU"},
+    )
+    # email=+20, referral=+0, metadata(2/4 filled)=+10 → 30
+    assert lead.score == 30.0
+    assert pipeline.score_lead(lead.id) == 30.0
+    # Filling the gaps later is reflected on rescore: metadata(4/4 filled)=+20 → 40
+    lead.metadata.update(role="CTO", size="50")
+    assert pipeline.score_lead(lead.id) == 40.0
+
+
+def test_export_to_crm_batch(pipeline):
+    leads = [pipeline.ingest_lead(source="organic", email=f"{i}@x.com") for i in range(3)]
+    ids = [lead.id for lead in reversed(leads)]
+    payloads = pipeline.export_to_crm(ids)
+    assert [p["lead_id"] for p in payloads] == ids
+    assert len({p["exported_at"] for p in payloads}) == 1
+    assert pipeline.export_to_crm([]) == []
+    with pytest.raises(KeyError):
+        pipeline.export_to_crm(["missing"])
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import heapq
 import uuid
-from datetime import datetime, timezone
-from typing import Optional
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class Provider(BaseModel):
@@ -18,21 +21,34 @@ class Provider(BaseModel):
     avg_rating: float = 0.0
     rating_count: int = 0
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Unrounded running mean; avg_rating is its rounded view.
+    _rating_mean: float = PrivateAttr(default=0.0)
 
+    def model_post_init(self, __context: Any) -> None:
+        # A provider restored with existing ratings continues from its stored average.
+        self._rating_mean = self.avg_rating
 
-class Booking(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+
+@dataclass(slots=True, kw_only=True)
+class Booking:
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
     customer_id: str
     provider_id: str
     service: str
     scheduled_at: datetime
     duration_hours: float
+    hourly_rate: float
     status: str = "pending"
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    scheduled_date: date = field(init=False)
 
+    def __post_init__(self) -> None:
+        self.scheduled_date = self.scheduled_at.date()
 
-class Invoice(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+
+@dataclass(slots=True, kw_only=True)
+class Invoice:
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
     booking_id: str
     provider_id: str
     customer_id: str
@@ -40,13 +56,16 @@ class Invoice(BaseModel):
     actual_hours: float
     hourly_rate: float
     amount: float
-    issued_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    issued_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 class LocalServicesEngine:
     def __init__(self) -> None:
         self._providers: dict[str, Provider] = {}
         self._bookings: dict[str, Booking] = {}
+        self._providers_by_service: dict[str, list[Provider]] = defaultdict(list)
+        # Open (not completed) bookings per (day, service), counted per provider.
+        self._open_bookings: dict[tuple[date, str], Counter[str]] = defaultdict(Counter)
 
     def register_provider(
         self,
@@ -62,6 +81,8 @@ class LocalServicesEngine:
             hourly_rate=hourly_rate,
         )
         self._providers[provider.id] = provider
+        for svc in dict.fromkeys(services):
+            self._providers_by_service[svc].append(provider)
         return provider
 
     def create_booking(
@@ -71,7 +92,9 @@ class LocalServicesEngine:
         service: str,
         datetime_str: str,
         duration_hours: float,
+        now: Optional[datetime] = None,
     ) -> Booking:
+        provider = self._providers[provider_id]
         scheduled_at = datetime.fromisoformat(datetime_str)
         if scheduled_at.tzinfo is None:
             scheduled_at = scheduled_at.replace(tzinfo=timezone.utc)
@@ -81,47 +104,52 @@ class LocalServicesEngine:
             service=service,
             scheduled_at=scheduled_at,
             duration_hours=duration_hours,
+            hourly_rate=provider.hourly_rate,
+            created_at=now or datetime.now(timezone.utc),
         )
         self._bookings[booking.id] = booking
+        self._open_bookings[(booking.scheduled_date, service)][provider_id] += 1
         return booking
 
-    def complete_job(self, booking_id: str, actual_hours: float) -> Invoice:
+    def complete_job(
+        self, booking_id: str, actual_hours: float, now: Optional[datetime] = None
+    ) -> Invoice:
         booking = self._bookings[booking_id]
+        if booking.status != "completed":
+            key = (booking.scheduled_date, booking.service)
+            open_bookings = self._open_bookings[key]
+            open_bookings[booking.provider_id] -= 1
+            if open_bookings[booking.provider_id] <= 0:
+                del open_bookings[booking.provider_id]
         booking.status = "completed"
-        provider = self._providers[booking.provider_id]
-        amount = round(actual_hours * provider.hourly_rate, 2)
+        amount = round(actual_hours * booking.hourly_rate, 2)
         return Invoice(
             booking_id=booking_id,
             provider_id=booking.provider_id,
             customer_id=booking.customer_id,
             service=booking.service,
             actual_hours=actual_hours,
-            hourly_rate=provider.hourly_rate,
+            hourly_rate=booking.hourly_rate,
             amount=amount,
+            issued_at=now or datetime.now(timezone.utc),
         )
 
     def rate_provider(
         self, provider_id: str, rating: float, review: str
     ) -> Provider:
         provider = self._providers[provider_id]
-        total = provider.avg_rating * provider.rating_count + rating
         provider.rating_count += 1
-        provider.avg_rating = round(total / provider.rating_count, 2)
+        provider._rating_mean += (rating - provider._rating_mean) / provider.rating_count
+        provider.avg_rating = round(provider._rating_mean, 2)
         return provider
 
     def find_available_providers(
-        self, service: str, date_str: str
+        self, service: str, date_str: str, limit: Optional[int] = None
     ) -> list[Provider]:
-        booked_provider_ids = {
-            b.provider_id
-            for b in self._bookings.values()
-            if b.scheduled_at.date().isoformat() == date_str
-            and b.service == service
-            and b.status != "completed"
-        }
+        booked = self._open_bookings.get((date.fromisoformat(date_str), service), ())
         available = [
-            p
-            for p in self._providers.values()
-            if service in p.services and p.id not in booked_provider_ids
+            p for p in self._providers_by_service.get(service, ()) if p.id not in booked
         ]
+        if limit is not None:
+            return heapq.nlargest(limit, available, key=lambda p: p.avg_rating)
         return sorted(available, key=lambda p: p.avg_rating, reverse=True)
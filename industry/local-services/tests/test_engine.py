@@ -1,7 +1,7 @@
 """Tests for LocalServicesEngine."""
 
 import pytest
-from src.engine import LocalServicesEngine
+from src.engine import LocalServicesEngine, Provider
 
 
 @pytest.fixture
@@ -54,3 +54,60 @@ def test_find_available_providers(engine):
     available = engine.find_available_providers("plumbing", "2025-07-10")
     assert all(prov.id != p1.id for prov in available)
     assert any(prov.id == p2.id for prov in available)
+
+
+def test_provider_available_again_after_all_jobs_complete(engine):
+    p = engine.register_provider("PipeMasters", ["plumbing", "heating"], "East", 70.0)
+    b1 = engine.create_booking("c1", p.id, "plumbing", "2025-08-01T08:00:00", 1.0)
+    b2 = engine.create_booking("c2", p.id, "plumbing", "2025-08-01T13:00:00", 1.0)
+    assert engine.find_available_providers("heating", "2025-08-01") == [p]
+    engine.complete_job(b1.id, 1.0)
+    engine.complete_job(b1.id, 1.0)
+    assert engine.find_available_providers("plumbing", "2025-08-01") == []
+    engine.complete_job(b2.id, 1.0)
+    assert engine.find_available_providers("plumbing", "2025-08-01") == [p]
+    assert engine.find_available_providers("roofing", "2025-08-01") == []
+
+
+def test_booking_date_uses_local_offset(engine):
+    p = engine.register_provider("NightOwl", ["locksmith"], "Central", 80.0)
+    booking = engine.create_booking("c1", p.id, "locksmith", "2025-08-02T23:30:00-05:00", 1.0)
+    assert booking.scheduled_date.isoformat() == "2025-08-02"
+    assert engine.find_available_providers("locksmith", "2025-08-02") == []
+    assert engine.find_available_providers("locksmith", "2025-08-03") == [p]
+
+
+def test_find_available_providers_limit(engine):
+    providers = [engine.register_provider(f"Roofer {i}", ["roofing"], "West", 60.0) for i in range(4)]
+    for p, rating in zip(providers, [3.0, 5.0, 4.0, 5.0]):
+        engine.rate_provider(p.id, rating, "")
+    top = engine.find_available_providers("roofing", "2025-09-01", limit=2)
+    assert top == [providers[1], providers[3]]
+    assert len(engine.find_available_providers("roofing", "2025-09-01")) == 4
+
+
+def test_rating_average_does_not_compound_rounding(engine):
+    p = engine.register_provider("Steady", ["painting"], "North", 45.0)
+    for rating in (1, 1, 1, 1, 1, 3, 1):
+        engine.rate_provider(p.id, rating, "")
+    assert p.avg_rating == 1.29
+
+
+def test_invoice_uses_rate_at_booking_time(engine):
+    p = engine.register_provider("HandyCo", ["repairs"], "South", 50.0)
+    booking = engine.create_booking("c1", p.id, "repairs", "2025-09-10T09:00:00", 2.0)
+    p.hourly_rate = 80.0
+    invoice = engine.complete_job(booking.id, 2.0)
+    assert invoice.hourly_rate == 50.0
+    assert invoice.amount == 100.0
+    with pytest.raises(KeyError):
+        engine.create_booking("c1", "missing", "repairs", "2025-09-10T09:00:00", 1.0)
+
+
+def test_restored_provider_continues_its_average(engine):
+    p = engine.register_provider("Restored", ["roofing"], "East", 70.0)
+    restored = Provider.model_validate({**p.model_dump(), "avg_rating": 4.0, "rating_count": 2})
+    engine._providers[restored.id] = restored
+    engine.rate_provider(restored.id, 1.0, "Late")
+    assert restored.rating_count == 3
+    assert restored.avg_rating == 3.0
@@ -2,23 +2,28 @@
 from __future__ import annotations
 
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 PRIORITY_DAYS = {"express": 1, "standard": 5, "economy": 10}
+TERMINAL_STATUSES = frozenset({"delivered", "cancelled"})
+ROUTE_PRIORITY = {"express": 0, "standard": 1, "economy": 2}
 
 
-class Shipment(BaseModel):
-    tracking_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class Shipment:
+    tracking_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     origin: str
     destination: str
     weight_kg: float
     priority: str
     status: str = "created"
     location: str = ""
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: datetime
+    eta: datetime
 
 
 class FleetMetrics(BaseModel):
@@ -33,44 +38,51 @@ class LogisticsEngine:
     def __init__(self, total_fleet: int = 100) -> None:
         self._shipments: Dict[str, Shipment] = {}
         self._total_fleet = total_fleet
+        self._active_count = 0
 
     def create_shipment(
-        self, origin: str, destination: str, weight_kg: float, priority: str
+        self,
+        origin: str,
+        destination: str,
+        weight_kg: float,
+        priority: str,
+        now: Optional[datetime] = None,
     ) -> Shipment:
         if priority not in PRIORITY_DAYS:
             raise ValueError(f"priority must be one of {list(PRIORITY_DAYS)}")
+        created_at = now or datetime.now(timezone.utc)
         shipment = Shipment(
-            origin=origin, destination=destination, weight_kg=weight_kg, priority=priority
+            origin=origin,
+            destination=destination,
+            weight_kg=weight_kg,
+            priority=priority,
+            created_at=created_at,
+            eta=created_at + timedelta(days=PRIORITY_DAYS[priority]),
         )
         self._shipments[shipment.tracking_id] = shipment
+        self._active_count += 1
         return shipment
 
     def update_status(self, tracking_id: str, status: str, location: str) -> Shipment:
         shipment = self._get_shipment(tracking_id)
+        was_active = shipment.status not in TERMINAL_STATUSES
+        is_active = status not in TERMINAL_STATUSES
+        if was_active != is_active:
+            self._active_count += 1 if is_active else -1
         shipment.status = status
         shipment.location = location
         return shipment
 
     def calculate_eta(self, tracking_id: str) -> str:
-        shipment = self._get_shipment(tracking_id)
-        created = datetime.fromisoformat(shipment.created_at)
-        days = PRIORITY_DAYS[shipment.priority]
-        eta = created + timedelta(days=days)
-        return eta.isoformat()
+        return self._get_shipment(tracking_id).eta.isoformat()
 
     def get_fleet_utilization(self) -> FleetMetrics:
-        active = sum(
-            1 for s in self._shipments.values() if s.status not in ("delivered", "cancelled")
-        )
+        active = self._active_count
         utilization_pct = round((active / self._total_fleet) * 100, 2) if self._total_fleet else 0.0
-        return FleetMetrics(active=active, total=self._total_fleet, utilization_pct=utilization_pct)
+        return FleetMetrics.model_construct(active=active, total=self._total_fleet, utilization_pct=utilization_pct)
 
     def route_optimize(self, shipments: List[Shipment]) -> List[Shipment]:
-        priority_order = {"express": 0, "standard": 1, "economy": 2}
-        return sorted(
-            shipments,
-            key=lambda s: (priority_order.get(s.priority, 99), self.calculate_eta(s.tracking_id)),
-        )
+        return sorted(shipments, key=lambda s: (ROUTE_PRIORITY.get(s.priority, 99), s.eta))
 
     def _get_shipment(self, tracking_id: str) -> Shipment:
         if tracking_id not in self._shipments:
@@ -1,4 +1,6 @@
 """Tests for LogisticsEngine."""
+from datetime import datetime, timezone
+
 import pytest
 from src.engine import LogisticsEngine
 
@@ -39,3 +41,30 @@ def test_fleet_utilization(engine):
     assert metrics.active == 1
     assert metrics.total == 50
     assert metrics.utilization_pct == 2.0
+
+
+def test_route_optimize_orders_by_priority_then_eta(engine):
+    economy = engine.create_shipment("A", "B", 1.0, "economy")
+    express = engine.create_shipment("A", "B", 1.0, "express")
+    standard = engine.create_shipment("A", "B", 1.0, "standard")
+    ordered = engine.route_optimize([economy, standard, express])
+    assert [s.priority for s in ordered] == ["express", "standard", "economy"]
+    assert (express.eta - express.created_at).days == 1
+
+
+def test_fleet_utilization_tracks_status_transitions(engine):
+    s1 = engine.create_shipment("A", "B", 1.0, "express")
+    engine.create_shipment("C", "D", 2.0, "standard")
+    engine.update_status(s1.tracking_id, "in_transit", "X")
+    engine.update_status(s1.tracking_id, "delivered", "B")
+    engine.update_status(s1.tracking_id, "cancelled", "B")
+    assert engine.get_fleet_utilization().active == 1
+    engine.update_status(s1.tracking_id, "returned", "A")
+    assert engine.get_fleet_utilization().active == 2
+
+
+def test_create_shipment_with_shared_timestamp(engine):
+    now = datetime(2025, 3, 1, tzinfo=timezone.utc)
+    batch = [engine.create_shipment("A", "B", 1.0, "standard", now=now) for _ in range(3)]
+    assert {s.created_at for s in batch} == {now}
+    assert engine.calculate_eta(batch[0].tracking_id) == "2025-03-06T00:00:00+00:00"
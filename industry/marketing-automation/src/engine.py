@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import math
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Sequence
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 
-class Campaign(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class Campaign:
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
     name: str
     channel: str
     budget: float
@@ -21,7 +24,7 @@ class Campaign(BaseModel):
     conversions: int = 0
     revenue: float = 0.0
     status: str = "active"
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 class ROIMetrics(BaseModel):
@@ -58,6 +61,7 @@ class MarketingAutomationEngine:
         target_audience: str,
         start_date: str,
         end_date: str,
+        now: Optional[datetime] = None,
     ) -> Campaign:
         campaign = Campaign(
             name=name,
@@ -66,13 +70,17 @@ class MarketingAutomationEngine:
             target_audience=target_audience,
             start_date=start_date,
             end_date=end_date,
+            created_at=now or datetime.now(timezone.utc),
         )
         self._campaigns[campaign.id] = campaign
         return campaign
 
     def record_impression(self, campaign_id: str) -> Campaign:
+        return self.record_impressions(campaign_id, 1)
+
+    def record_impressions(self, campaign_id: str, count: int) -> Campaign:
         campaign = self._campaigns[campaign_id]
-        campaign.impressions += 1
+        campaign.impressions += count
         return campaign
 
     def record_conversion(self, campaign_id: str, value: float) -> Campaign:
@@ -81,23 +89,31 @@ class MarketingAutomationEngine:
         campaign.revenue += value
         return campaign
 
+    def record_conversions(self, campaign_id: str, values: Sequence[float]) -> Campaign:
+        campaign = self._campaigns[campaign_id]
+        campaign.conversions += len(values)
+        campaign.revenue += math.fsum(values)
+        return campaign
+
     def calculate_roi(self, campaign_id: str) -> ROIMetrics:
         c = self._campaigns[campaign_id]
         cpa = (c.budget / c.conversions) if c.conversions > 0 else 0.0
         roas = (c.revenue / c.budget) if c.budget > 0 else 0.0
         roi_pct = ((c.revenue - c.budget) / c.budget * 100.0) if c.budget > 0 else 0.0
-        return ROIMetrics(
+        return ROIMetrics.model_construct(
             campaign_id=campaign_id,
             cpa=round(cpa, 2),
             roas=round(roas, 4),
             roi_pct=round(roi_pct, 2),
         )
 
-    def generate_report(self, campaign_id: str) -> CampaignReport:
+    def generate_report(
+        self, campaign_id: str, now: Optional[datetime] = None
+    ) -> CampaignReport:
         c = self._campaigns[campaign_id]
         roi = self.calculate_roi(campaign_id)
         ctr = (c.conversions / c.impressions * 100.0) if c.impressions > 0 else 0.0
-        return CampaignReport(
+        return CampaignReport.model_construct(
             campaign_id=campaign_id,
             name=c.name,
             channel=c.channel,
@@ -109,5 +125,5 @@ class MarketingAutomationEngine:
             roas=roi.roas,
             roi_pct=roi.roi_pct,
             click_through_rate=round(ctr, 4),
-            generated_at=datetime.now(timezone.utc),
+            generated_at=now or datetime.now(timezone.utc),
         )
@@ -41,3 +41,24 @@ def test_calculate_roi(engine):
     assert roi.roas == 1.3
     assert roi.roi_pct == 30.0
     assert roi.cpa == 500.0
+
+
+def test_generate_report(engine):
+    c = engine.create_campaign("Ad4", "email", 200.0, "all", "2025-10-01", "2025-10-31")
+    for _ in range(10):
+        engine.record_impression(c.id)
+    engine.record_conversion(c.id, 300.0)
+    report = engine.generate_report(c.id)
+    assert report.click_through_rate == 10.0
+    assert report.roi_pct == 50.0
+    assert report.impressions == 10
+
+
+def test_batch_recording(engine):
+    c = engine.create_campaign("Ad5", "social", 100.0, "all", "2025-11-01", "2025-11-30")
+    engine.record_impressions(c.id, 1000)
+    engine.record_impression(c.id)
+    engine.record_conversions(c.id, [10.0, 20.0, 30.5])
+    assert c.impressions == 1001
+    assert c.conversions == 3
+    assert c.revenue == 60.5
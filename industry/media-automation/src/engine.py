@@ -1,10 +1,18 @@
 from __future__ import annotations
+import heapq
 import uuid
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial
 from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
+_utcnow = partial(datetime.now, timezone.utc)
+
+
 class ContentBrief(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     title: str
@@ -13,33 +21,41 @@ class ContentBrief(BaseModel):
     keywords: List[str]
     due_date: datetime
     cost: float = 500.0
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
 
 
-class ScheduledPost(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class ScheduledPost:
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
     content_id: str
     platform: str
     publish_at: datetime
     status: str = "scheduled"
 
 
-class PerformanceMetrics(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class PerformanceMetrics:
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
     content_id: str
     platform: str
     views: int
     engagements: int
     shares: int
     engagement_rate: float
-    recorded_at: datetime = Field(default_factory=datetime.utcnow)
+    recorded_at: datetime = field(default_factory=_utcnow)
 
 
 class MediaAutomationEngine:
     def __init__(self) -> None:
         self._briefs: dict[str, ContentBrief] = {}
-        self._posts: list[ScheduledPost] = []
-        self._metrics: list[PerformanceMetrics] = []
+        # Posts bucketed by (content_id, year, month), each bucket kept in
+        # publish_at order alongside a parallel list of its publish times for bisect.
+        self._posts_by_content_month: dict[tuple[str, int, int], list[ScheduledPost]] = defaultdict(list)
+        self._publish_times: dict[tuple[str, int, int], list[datetime]] = defaultdict(list)
+        self._metrics_by_content: dict[str, list[PerformanceMetrics]] = defaultdict(list)
+        # Running per-content totals so ROI needs no pass over the metrics.
+        self._views_total: dict[str, int] = defaultdict(int)
+        self._engagement_rate_total: dict[str, float] = defaultdict(float)
 
     def create_content_brief(
         self,
@@ -49,6 +65,7 @@ class MediaAutomationEngine:
         keywords: list[str],
         due_date: datetime,
         cost: float = 500.0,
+        now: Optional[datetime] = None,
     ) -> ContentBrief:
         brief = ContentBrief(
             title=title,
@@ -57,6 +74,7 @@ class MediaAutomationEngine:
             keywords=keywords,
             due_date=due_date,
             cost=cost,
+            created_at=now or _utcnow(),
         )
         self._briefs[brief.id] = brief
         return brief
@@ -72,7 +90,11 @@ class MediaAutomationEngine:
             platform=platform,
             publish_at=publish_at,
         )
-        self._posts.append(post)
+        key = (content_id, publish_at.year, publish_at.month)
+        times = self._publish_times[key]
+        i = bisect_right(times, publish_at)
+        times.insert(i, publish_at)
+        self._posts_by_content_month[key].insert(i, post)
         return post
 
     def track_performance(
@@ -82,6 +104,7 @@ class MediaAutomationEngine:
         views: int,
         engagements: int,
         shares: int,
+        now: Optional[datetime] = None,
     ) -> PerformanceMetrics:
         engagement_rate = (engagements / views) if views > 0 else 0.0
         m = PerformanceMetrics(
@@ -91,19 +114,22 @@ class MediaAutomationEngine:
             engagements=engagements,
             shares=shares,
             engagement_rate=engagement_rate,
+            recorded_at=now or _utcnow(),
         )
-        self._metrics.append(m)
+        self._metrics_by_content[content_id].append(m)
+        self._views_total[content_id] += views
+        self._engagement_rate_total[content_id] += engagement_rate
         return m
 
     def calculate_content_roi(self, content_id: str) -> float:
         brief = self._briefs.get(content_id)
         if brief is None:
             return 0.0
-        metrics = [m for m in self._metrics if m.content_id == content_id]
-        if not metrics:
+        count = len(self._metrics_by_content.get(content_id, ()))
+        if not count:
             return 0.0
-        avg_engagement_rate = sum(m.engagement_rate for m in metrics) / len(metrics)
-        total_views = sum(m.views for m in metrics)
+        avg_engagement_rate = self._engagement_rate_total[content_id] / count
+        total_views = self._views_total[content_id]
         cost = brief.cost
         if cost == 0:
             return 0.0
@@ -112,12 +138,9 @@ class MediaAutomationEngine:
     def generate_content_calendar(
         self, briefs: list[ContentBrief], month_str: str
     ) -> list[ScheduledPost]:
-        year, month = int(month_str.split("-")[0]), int(month_str.split("-")[1])
-        brief_ids = {b.id for b in briefs}
-        posts = [
-            p for p in self._posts
-            if p.content_id in brief_ids
-            and p.publish_at.year == year
-            and p.publish_at.month == month
+        year, month = (int(part) for part in month_str.split("-")[:2])
+        buckets = [
+            self._posts_by_content_month.get((brief_id, year, month), ())
+            for brief_id in dict.fromkeys(b.id for b in briefs)
         ]
-        return sorted(posts, key=lambda p: p.publish_at)
+        return list(heapq.merge(*buckets, key=lambda p: p.publish_at))
@@ -32,3 +32,38 @@ def test_calculate_content_roi():
     engine.track_performance(brief.id, "LinkedIn", 2000, 100, 50)
     roi = engine.calculate_content_roi(brief.id)
     assert roi > 0
+
+
+def test_content_roi_aggregates_all_platforms():
+    engine = MediaAutomationEngine()
+    brief = engine.create_content_brief("Multi", "video", "all", ["ai"], datetime(2024, 8, 1), cost=100.0)
+    engine.track_performance(brief.id, "YouTube", 1000, 100, 10)
+    engine.track_performance(brief.id, "TikTok", 3000, 900, 30)
+    engine.track_performance("other", "TikTok", 5000, 500, 0)
+    # avg rate (0.1 + 0.3) / 2 = 0.2, views 4000, cost 100 → 8.0
+    assert abs(engine.calculate_content_roi(brief.id) - 8.0) < 1e-9
+    assert engine.calculate_content_roi("missing") == 0.0
+
+
+def test_generate_content_calendar():
+    engine = MediaAutomationEngine()
+    brief = engine.create_content_brief("Series", "video", "all", ["ai"], datetime(2024, 7, 1))
+    other = engine.create_content_brief("Other", "blog", "all", ["ml"], datetime(2024, 7, 1))
+    late = engine.schedule_publication(brief.id, "YouTube", datetime(2024, 7, 20, 9, 0))
+    early = engine.schedule_publication(brief.id, "Twitter", datetime(2024, 7, 2, 9, 0))
+    engine.schedule_publication(brief.id, "YouTube", datetime(2024, 8, 1, 9, 0))
+    engine.schedule_publication(other.id, "Blog", datetime(2024, 7, 10, 9, 0))
+    calendar = engine.generate_content_calendar([brief], "2024-07")
+    assert [p.id for p in calendar] == [early.id, late.id]
+    assert engine.generate_content_calendar([brief], "2024-09") == []
+
+
+def test_content_calendar_merges_briefs_in_publish_order():
+    engine = MediaAutomationEngine()
+    a = engine.create_content_brief("A", "blog", "all", ["a"], datetime(2024, 7, 1))
+    b = engine.create_content_brief("B", "blog", "all", ["b"], datetime(2024, 7, 1))
+    a2 = engine.schedule_publication(a.id, "Blog", datetime(2024, 7, 20))
+    b1 = engine.schedule_publication(b.id, "Blog", datetime(2024, 7, 5))
+    a1 = engine.schedule_publication(a.id, "Blog", datetime(2024, 7, 10))
+    calendar = engine.generate_content_calendar([a, b, a], "2024-07")
+    assert [p.id for p in calendar] == [b1.id, a1.id, a2.id]
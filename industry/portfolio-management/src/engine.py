@@ -1,10 +1,17 @@
 from __future__ import annotations
+import math
 import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
+_utcnow = partial(datetime.now, timezone.utc)
+
+
 class ManagedPortfolio(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     name: str
@@ -12,17 +19,18 @@ class ManagedPortfolio(BaseModel):
     strategy: str
     risk_level: str
     target_return_pct: float
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
 
 
-class Holding(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class Holding:
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
     portfolio_id: str
     ticker: str
     shares: float
     purchase_price: float
     current_price: float
-    added_at: datetime = Field(default_factory=datetime.utcnow)
+    added_at: datetime = field(default_factory=_utcnow)
 
     @property
     def current_value(self) -> float:
@@ -37,7 +45,7 @@ class RebalanceOrder(BaseModel):
     portfolio_id: str
     buys: List[Dict[str, Any]]
     sells: List[Dict[str, Any]]
-    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    generated_at: datetime = Field(default_factory=_utcnow)
 
 
 class RiskMetrics(BaseModel):
@@ -61,13 +69,15 @@ class ClientReport(BaseModel):
     return_pct: float
     holdings: List[Holding]
     attribution: List[Attribution]
-    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    generated_at: datetime = Field(default_factory=_utcnow)
 
 
 class PortfolioManagementEngine:
     def __init__(self) -> None:
         self._portfolios: dict[str, ManagedPortfolio] = {}
-        self._holdings: list[Holding] = []
+        self._holdings_by_portfolio: dict[str, list[Holding]] = defaultdict(list)
+        self._total_value: dict[str, float] = defaultdict(float)
+        self._total_cost: dict[str, float] = defaultdict(float)
 
     def create_portfolio(
         self,
@@ -94,6 +104,7 @@ class PortfolioManagementEngine:
         shares: float,
         purchase_price: float,
         current_price: float,
+        now: Optional[datetime] = None,
     ) -> Holding:
         if portfolio_id not in self._portfolios:
             raise ValueError(f"Portfolio {portfolio_id} not found")
@@ -103,10 +114,41 @@ class PortfolioManagementEngine:
             shares=shares,
             purchase_price=purchase_price,
             current_price=current_price,
+            added_at=now or _utcnow(),
         )
-        self._holdings.append(h)
+        self._holdings_by_portfolio[portfolio_id].append(h)
+        self._total_value[portfolio_id] += shares * current_price
+        self._total_cost[portfolio_id] += shares * purchase_price
         return h
 
+    def bulk_add_holdings(
+        self, portfolio_id: str, rows: list[dict[str, Any]]
+    ) -> list[Holding]:
+        """Add many holdings that share a single added_at timestamp."""
+        now = _utcnow()
+        return [
+            self.add_holding(
+                portfolio_id,
+                row["ticker"],
+                row["shares"],
+                row["purchase_price"],
+                row["current_price"],
+                now=now,
+            )
+            for row in rows
+        ]
+
+    def update_price(self, portfolio_id: str, ticker: str, current_price: float) -> list[Holding]:
+        if portfolio_id not in self._portfolios:
+            raise ValueError(f"Portfolio {portfolio_id} not found")
+        updated = []
+        for h in self._holdings_by_portfolio.get(portfolio_id, ()):
+            if h.ticker == ticker:
+                self._total_value[portfolio_id] += (current_price - h.current_price) * h.shares
+                h.current_price = current_price
+                updated.append(h)
+        return updated
+
     def rebalance(
         self,
         portfolio_id: str,
@@ -114,40 +156,39 @@ class PortfolioManagementEngine:
     ) -> RebalanceOrder:
         if portfolio_id not in self._portfolios:
             raise ValueError(f"Portfolio {portfolio_id} not found")
-        holdings = [h for h in self._holdings if h.portfolio_id == portfolio_id]
-        total_value = sum(h.current_value for h in holdings)
-        current_alloc = {h.ticker: h.current_value / total_value if total_value else 0 for h in holdings}
+        total_value = self._total_value.get(portfolio_id, 0.0)
+        value_by_ticker: dict[str, float] = defaultdict(float)
+        for h in self._holdings_by_portfolio.get(portfolio_id, ()):
+            value_by_ticker[h.ticker] += h.shares * h.current_price
         buys = []
         sells = []
         for ticker, target_pct in target_allocations.items():
-            current_pct = current_alloc.get(ticker, 0.0)
-            diff_pct = target_pct - current_pct
-            diff_value = diff_pct * total_value
+            diff_value = target_pct * total_value - value_by_ticker.get(ticker, 0.0)
             if diff_value > 0:
                 buys.append({"ticker": ticker, "value": round(diff_value, 2), "target_pct": target_pct})
             elif diff_value < 0:
                 sells.append({"ticker": ticker, "value": round(abs(diff_value), 2), "target_pct": target_pct})
-        return RebalanceOrder(portfolio_id=portfolio_id, buys=buys, sells=sells)
+        return RebalanceOrder.model_construct(portfolio_id=portfolio_id, buys=buys, sells=sells)
 
     def calculate_risk_metrics(self, portfolio_id: str) -> RiskMetrics:
         if portfolio_id not in self._portfolios:
             raise ValueError(f"Portfolio {portfolio_id} not found")
-        holdings = [h for h in self._holdings if h.portfolio_id == portfolio_id]
+        holdings = self._holdings_by_portfolio.get(portfolio_id, [])
         if not holdings:
-            return RiskMetrics(
+            return RiskMetrics.model_construct(
                 portfolio_id=portfolio_id,
                 volatility_score=0.0,
                 beta=1.0,
                 sharpe_ratio_estimate=0.0,
             )
-        returns = [(h.current_price - h.purchase_price) / h.purchase_price for h in holdings]
-        avg_return = sum(returns) / len(returns)
-        variance = sum((r - avg_return) ** 2 for r in returns) / len(returns)
-        volatility = variance ** 0.5
+        n = len(holdings)
+        returns = [h.current_price / h.purchase_price - 1.0 for h in holdings]
+        avg_return = math.fsum(returns) / n
+        volatility = math.sqrt(math.fsum((r - avg_return) ** 2 for r in returns) / n)
         beta = 1.0 + (avg_return - 0.08)
         risk_free_rate = 0.04
         sharpe = (avg_return - risk_free_rate) / volatility if volatility > 0 else 0.0
-        return RiskMetrics(
+        return RiskMetrics.model_construct(
             portfolio_id=portfolio_id,
             volatility_score=round(volatility, 4),
             beta=round(beta, 4),
@@ -157,26 +198,26 @@ class PortfolioManagementEngine:
     def generate_client_report(self, portfolio_id: str) -> ClientReport:
         if portfolio_id not in self._portfolios:
             raise ValueError(f"Portfolio {portfolio_id} not found")
-        holdings = [h for h in self._holdings if h.portfolio_id == portfolio_id]
-        total_value = sum(h.current_value for h in holdings)
-        total_cost = sum(h.shares * h.purchase_price for h in holdings)
+        holdings = self._holdings_by_portfolio.get(portfolio_id, [])
+        total_value = self._total_value.get(portfolio_id, 0.0)
+        total_cost = self._total_cost.get(portfolio_id, 0.0)
         total_gain_loss = total_value - total_cost
         return_pct = (total_gain_loss / total_cost * 100) if total_cost else 0.0
         attribution = []
         for h in holdings:
             weight = h.current_value / total_value if total_value else 0.0
             contribution = weight * (h.current_price - h.purchase_price) / h.purchase_price if h.purchase_price else 0.0
-            attribution.append(Attribution(
+            attribution.append(Attribution.model_construct(
                 ticker=h.ticker,
                 weight=round(weight, 4),
                 gain_loss=round(h.gain_loss, 2),
                 contribution=round(contribution, 4),
             ))
-        return ClientReport(
+        return ClientReport.model_construct(
             portfolio_id=portfolio_id,
             total_value=round(total_value, 2),
             total_gain_loss=round(total_gain_loss, 2),
             return_pct=round(return_pct, 2),
-            holdings=holdings,
+            holdings=list(holdings),
             attribution=attribution,
         )
@@ -35,3 +35,64 @@ def test_generate_client_report():
     assert report.total_value == 52500.0
     assert report.total_gain_loss == 7500.0
     assert len(report.holdings) == 2
+
+
+def test_calculate_risk_metrics():
+    engine = PortfolioManagementEngine()
+    p = engine.create_portfolio("Risk Fund", "mgr-4", "growth", "high", 10.0)
+    engine.add_holding(p.id, "AAA", 10, 100.0, 120.0)
+    engine.add_holding(p.id, "BBB", 10, 100.0, 100.0)
+    metrics = engine.calculate_risk_metrics(p.id)
+    assert metrics.volatility_score == 0.1
+    assert metrics.beta == 1.02
+    assert metrics.sharpe_ratio_estimate == 0.6
+    empty = engine.create_portfolio("Empty", "mgr-4", "cash", "low", 1.0)
+    assert engine.calculate_risk_metrics(empty.id).volatility_score == 0.0
+
+
+def test_holdings_are_scoped_to_portfolio():
+    engine = PortfolioManagementEngine()
+    a = engine.create_portfolio("Fund A", "mgr-5", "growth", "high", 10.0)
+    b = engine.create_portfolio("Fund B", "mgr-5", "income", "low", 5.0)
+    engine.add_holding(a.id, "AAPL", 10, 100.0, 110.0)
+    engine.add_holding(b.id, "T", 100, 20.0, 18.0)
+    report = engine.generate_client_report(b.id)
+    assert [h.ticker for h in report.holdings] == ["T"]
+    report.holdings.clear()
+    assert len(engine.generate_client_report(b.id).holdings) == 1
+
+
+def test_update_price_refreshes_report_totals():
+    engine = PortfolioManagementEngine()
+    p = engine.create_portfolio("Marked Fund", "mgr-6", "growth", "medium", 9.0)
+    engine.add_holding(p.id, "AAPL", 10, 100.0, 100.0)
+    engine.add_holding(p.id, "MSFT", 5, 200.0, 200.0)
+    updated = engine.update_price(p.id, "AAPL", 150.0)
+    assert [h.current_price for h in updated] == [150.0]
+    report = engine.generate_client_report(p.id)
+    assert report.total_value == 2500.0
+    assert report.total_gain_loss == 500.0
+    assert report.return_pct == 25.0
+
+
+def test_bulk_add_holdings_shares_timestamp():
+    engine = PortfolioManagementEngine()
+    p = engine.create_portfolio("Bulk Fund", "mgr-7", "index", "low", 7.0)
+    holdings = engine.bulk_add_holdings(p.id, [
+        {"ticker": "VTI", "shares": 10, "purchase_price": 200.0, "current_price": 210.0},
+        {"ticker": "BND", "shares": 20, "purchase_price": 70.0, "current_price": 72.0},
+    ])
+    assert holdings[0].added_at == holdings[1].added_at
+    assert holdings[0].added_at.tzinfo is not None
+    assert engine.generate_client_report(p.id).total_value == 3540.0
+
+
+def test_rebalance_aggregates_lots_of_the_same_ticker():
+    engine = PortfolioManagementEngine()
+    p = engine.create_portfolio("Lots Fund", "mgr-8", "balanced", "medium", 8.0)
+    engine.add_holding(p.id, "AAPL", 10, 100.0, 100.0)
+    engine.add_holding(p.id, "AAPL", 10, 90.0, 100.0)
+    engine.add_holding(p.id, "BND", 20, 100.0, 100.0)
+    order = engine.rebalance(p.id, {"AAPL": 0.25, "BND": 0.75})
+    assert order.sells == [{"ticker": "AAPL", "value": 1000.0, "target_pct": 0.25}]
+    assert order.buys == [{"ticker": "BND", "value": 1000.0, "target_pct": 0.75}]
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import uuid
+import itertools
+import os
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
-
 PLAN_PRICES: dict[str, float] = {
     "starter": 29.0,
     "pro": 99.0,
@@ -19,31 +20,52 @@ BILLING_CYCLE_MONTHS: dict[str, int] = {
     "annual": 12,
 }
 
+BILLABLE_STATUSES = frozenset({"active", "trialing"})
+
+_TRIAL_DELTA = timedelta(days=14)
+_CHURN_WINDOW = timedelta(days=14)
+_RENEWAL_DELTAS: dict[str, timedelta] = {
+    cycle: timedelta(days=30 * months) for cycle, months in BILLING_CYCLE_MONTHS.items()
+}
+_DEFAULT_RENEWAL_DELTA = _RENEWAL_DELTAS["monthly"]
+
+
+# Process-unique prefix plus a counter: cheaper than a uuid4() syscall per record.
+_ID_PREFIX = os.urandom(6).hex()
+_id_counter = itertools.count()
+
+
+def _new_id() -> str:
+    return f"{_ID_PREFIX}-{next(_id_counter):x}"
+
 
 class SubscriptionError(Exception):
     pass
 
 
-class Subscription(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class Subscription:
+    id: str = field(default_factory=_new_id)
     customer_id: str
     plan: str
     billing_cycle: str
     status: str = "trialing"
     trial_end: datetime
     renewal_date: datetime
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-class UsageRecord(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class UsageRecord:
+    id: str = field(default_factory=_new_id)
     subscription_id: str
     metric: str
     value: float
-    recorded_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    recorded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-class ChurnRisk(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ChurnRisk:
     subscription_id: str
     score: float
     factors: list[str]
@@ -54,14 +76,14 @@ class SaaSAutomationEngine:
     def __init__(self) -> None:
         self._subscriptions: dict[str, Subscription] = {}
         self._usage: list[UsageRecord] = []
+        self._usage_by_sub: dict[str, list[UsageRecord]] = defaultdict(list)
 
     def create_subscription(
         self, customer_id: str, plan: str, billing_cycle: str
     ) -> Subscription:
         now = datetime.now(timezone.utc)
-        trial_end = now + timedelta(days=14)
-        months = BILLING_CYCLE_MONTHS.get(billing_cycle, 1)
-        renewal_date = trial_end + timedelta(days=30 * months)
+        trial_end = now + _TRIAL_DELTA
+        renewal_date = trial_end + _RENEWAL_DELTAS.get(billing_cycle, _DEFAULT_RENEWAL_DELTA)
         sub = Subscription(
             customer_id=customer_id,
             plan=plan,
@@ -77,8 +99,7 @@ class SaaSAutomationEngine:
         sub = self._subscriptions[subscription_id]
         if sub.status == "cancelled":
             raise SubscriptionError(f"Subscription {subscription_id} is cancelled.")
-        months = BILLING_CYCLE_MONTHS.get(sub.billing_cycle, 1)
-        sub.renewal_date = sub.renewal_date + timedelta(days=30 * months)
+        sub.renewal_date += _RENEWAL_DELTAS.get(sub.billing_cycle, _DEFAULT_RENEWAL_DELTA)
         sub.status = "active"
         return sub
 
@@ -89,30 +110,41 @@ class SaaSAutomationEngine:
             subscription_id=subscription_id, metric=metric, value=value
         )
         self._usage.append(record)
+        self._usage_by_sub[subscription_id].append(record)
         return record
 
     def calculate_mrr(self, subscriptions: list[Subscription]) -> float:
+        # Count billable subscriptions per (plan, cycle) and price each group once.
+        groups = Counter(
+            (sub.plan, sub.billing_cycle)
+            for sub in subscriptions
+            if sub.status in BILLABLE_STATUSES
+        )
         mrr = 0.0
-        for sub in subscriptions:
-            if sub.status in ("active", "trialing"):
-                monthly_price = PLAN_PRICES.get(sub.plan, 0.0)
-                if sub.billing_cycle == "annual":
-                    monthly_price = monthly_price * 10 / 12
-                mrr += monthly_price
+        for (plan, billing_cycle), count in groups.items():
+            monthly_price = PLAN_PRICES.get(plan, 0.0)
+            if billing_cycle == "annual":
+                monthly_price = monthly_price * 10 / 12
+            mrr += monthly_price * count
         return round(mrr, 2)
 
     def detect_churn_risk(self, subscription_id: str) -> ChurnRisk:
+        cutoff = datetime.now(timezone.utc) - _CHURN_WINDOW
+        return self._churn_risk(subscription_id, cutoff)
+
+    def detect_churn_risk_bulk(self, subscription_ids: list[str]) -> list[ChurnRisk]:
+        """Score many subscriptions against a single usage cutoff."""
+        cutoff = datetime.now(timezone.utc) - _CHURN_WINDOW
+        return [self._churn_risk(sid, cutoff) for sid in subscription_ids]
+
+    def _churn_risk(self, subscription_id: str, cutoff: datetime) -> ChurnRisk:
         sub = self._subscriptions[subscription_id]
         score = 0.0
         factors: list[str] = []
 
-        cutoff = datetime.now(timezone.utc) - timedelta(days=14)
-        recent = [
-            r
-            for r in self._usage
-            if r.subscription_id == subscription_id and r.recorded_at >= cutoff
-        ]
-        if not recent:
+        # Newest records are at the end, so scan backwards and stop at the first hit.
+        usage = self._usage_by_sub.get(subscription_id, ())
+        if not any(r.recorded_at >= cutoff for r in reversed(usage)):
             score += 50.0
             factors.append("no_usage_14d")
 
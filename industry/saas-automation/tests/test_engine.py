@@ -36,3 +36,45 @@ def test_detect_churn_risk_no_usage(engine):
     risk = engine.detect_churn_risk(sub.id)
     assert "no_usage_14d" in risk.factors
     assert risk.risk_level == "high"
+
+
+def test_detect_churn_risk_recent_usage(engine):
+    active = engine.create_subscription("cust-5", "pro", "monthly")
+    idle = engine.create_subscription("cust-6", "pro", "monthly")
+    engine.process_renewal(active.id)
+    engine.process_renewal(idle.id)
+    engine.track_usage(active.id, "api_calls", 120.0)
+    assert engine.detect_churn_risk(active.id).risk_level == "low"
+    assert engine.detect_churn_risk(idle.id).factors == ["no_usage_14d"]
+
+
+def test_calculate_mrr_groups_by_plan_and_cycle(engine):
+    subs = [
+        engine.create_subscription("c1", "pro", "monthly"),
+        engine.create_subscription("c2", "pro", "monthly"),
+        engine.create_subscription("c3", "enterprise", "annual"),
+        engine.create_subscription("c4", "starter", "monthly"),
+    ]
+    subs[3].status = "cancelled"
+    assert engine.calculate_mrr(subs) == round(2 * 99.0 + 499.0 * 10 / 12, 2)
+
+
+def test_renewal_periods_follow_billing_cycle(engine):
+    annual = engine.create_subscription("c1", "pro", "annual")
+    assert (annual.renewal_date - annual.trial_end).days == 360
+    original = annual.renewal_date
+    engine.process_renewal(annual.id)
+    assert (annual.renewal_date - original).days == 360
+    unknown = engine.create_subscription("c2", "pro", "weekly")
+    assert (unknown.renewal_date - unknown.trial_end).days == 30
+
+
+def test_detect_churn_risk_bulk_matches_single(engine):
+    active = engine.create_subscription("c1", "pro", "monthly")
+    engine.process_renewal(active.id)
+    engine.track_usage(active.id, "api_calls", 10)
+    idle = engine.create_subscription("c2", "starter", "monthly")
+    bulk = engine.detect_churn_risk_bulk([active.id, idle.id])
+    assert [r.subscription_id for r in bulk] == [active.id, idle.id]
+    assert [r.risk_level for r in bulk] == ["low", "high"]
+    assert bulk[1] == engine.detect_churn_risk(idle.id)
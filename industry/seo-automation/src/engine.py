@@ -6,12 +6,20 @@ from __future__ import annotations
 
 import asyncio
 import re
+from dataclasses import dataclass
 from typing import Optional
 from uuid import uuid4
 from datetime import datetime, timezone
 
 from pydantic import BaseModel, Field
 
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_META_DESCRIPTION_RE = re.compile(
+    r'<meta[^>]+name=["\']description["\'][^>]+content=["\']([^"\']+)["\']', re.IGNORECASE
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_HEADING_TAGS = tuple(f"h{i}" for i in range(1, 7))
+
 
 class SEOScore(BaseModel):
     overall: float = Field(ge=0.0, le=100.0)
@@ -20,7 +28,8 @@ class SEOScore(BaseModel):
     content: float = Field(ge=0.0, le=100.0)
 
 
-class SEOIssue(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class SEOIssue:
     category: str
     severity: str  # "critical" | "warning" | "info"
     description: str
@@ -39,50 +48,73 @@ class PageAnalysis(BaseModel):
     analyzed_at: str = Field(default_factory=lambda: datetime.now(tz=timezone.utc).isoformat())
 
 
+def _find_title(html: str, lower: str) -> Optional[str]:
+    """Extract the <title> text with substring search, matching _TITLE_RE."""
+    if len(lower) != len(html):
+        # Some non-ASCII characters change length when lowercased, shifting offsets.
+        match = _TITLE_RE.search(html)
+        return match.group(1).strip() if match else None
+    start = lower.find("<title")
+    if start < 0:
+        return None
+    start = lower.find(">", start) + 1
+    end = lower.find("</title>", start)
+    if not start or end < 0:
+        return None
+    return html[start:end].strip()
+
+
 class SEOEngine:
     """SEO analysis and content optimization automation."""
 
     def analyze_content(self, html: str, target_keyword: str = "") -> PageAnalysis:
         """Analyze HTML content for SEO issues."""
+        lower = html.lower()
+
         # Extract title
-        title_match = re.search(r"<title[^>]*>(.*?)</title>", html, re.IGNORECASE | re.DOTALL)
-        title = title_match.group(1).strip() if title_match else None
+        title = _find_title(html, lower)
 
-        # Extract meta description
-        meta_match = re.search(r'<meta[^>]+name=["\']description["\'][^>]+content=["\']([^"\']+)["\']', html, re.IGNORECASE)
+        # Extract meta description; the regex cannot match without "description"
+        meta_match = _META_DESCRIPTION_RE.search(html) if "description" in lower else None
         meta_desc = meta_match.group(1) if meta_match else None
 
-        # Count words
-        text_content = re.sub(r"<[^>]+>", " ", html)
-        words = [w for w in text_content.split() if w.strip()]
-        word_count = len(words)
-
-        # Count headings
-        headings = {f"h{i}": len(re.findall(f"<h{i}[^>]*>", html, re.IGNORECASE)) for i in range(1, 7)}
+        # Strip tags in C via sub(); count headings with plain substring search
+        word_count = len(_TAG_RE.sub(" ", html).split())
+        headings = {tag: lower.count("<" + tag) for tag in _HEADING_TAGS}
 
-        # Identify issues
+        # Identify issues, accumulating score penalties as each one is added
         issues: list[SEOIssue] = []
+        on_page_penalty = 0
+        content_penalty = 0
         if not title:
             issues.append(SEOIssue(category="on-page", severity="critical", description="Missing <title> tag", recommendation="Add a descriptive title (50-60 chars)"))
+            on_page_penalty += 25
         elif len(title) < 30:
             issues.append(SEOIssue(category="on-page", severity="warning", description="Title too short", recommendation="Expand title to 50-60 characters"))
+            on_page_penalty += 10
         elif len(title) > 70:
             issues.append(SEOIssue(category="on-page", severity="warning", description="Title too long (may be truncated in SERPs)", recommendation="Shorten title to 50-60 characters"))
+            on_page_penalty += 10
 
         if not meta_desc:
             issues.append(SEOIssue(category="on-page", severity="critical", description="Missing meta description", recommendation="Add a meta description (150-160 chars)"))
+            on_page_penalty += 25
 
-        if headings.get("h1", 0) == 0:
+        h1_count = headings["h1"]
+        if h1_count == 0:
             issues.append(SEOIssue(category="on-page", severity="critical", description="Missing H1 tag", recommendation="Add a single H1 heading with target keyword"))
-        elif headings.get("h1", 0) > 1:
+            on_page_penalty += 25
+        elif h1_count > 1:
             issues.append(SEOIssue(category="on-page", severity="warning", description="Multiple H1 tags", recommendation="Use only one H1 per page"))
+            on_page_penalty += 10
 
         if word_count < 300:
             issues.append(SEOIssue(category="content", severity="warning", description=f"Thin content ({word_count} words)", recommendation="Expand content to at least 300 words"))
+            content_penalty += 20
 
         # Compute scores
-        on_page_score = max(0.0, 100.0 - len([i for i in issues if i.category == "on-page" and i.severity == "critical"]) * 25 - len([i for i in issues if i.category == "on-page" and i.severity == "warning"]) * 10)
-        content_score = max(0.0, 100.0 - len([i for i in issues if i.category == "content"]) * 20)
+        on_page_score = max(0.0, 100.0 - on_page_penalty)
+        content_score = max(0.0, 100.0 - content_penalty)
 
         return PageAnalysis(
             url="",
@@ -97,5 +129,8 @@ class SEOEngine:
 
     async def batch_analyze(self, pages: list[dict[str, str]]) -> list[PageAnalysis]:
         """Analyze multiple pages concurrently."""
-        tasks = [asyncio.create_task(asyncio.coroutine(lambda p: self.analyze_content(p["html"], p.get("keyword", "")))()) for p in pages]
-        return [self.analyze_content(p["html"], p.get("keyword", "")) for p in pages]
+        return list(
+            await asyncio.gather(
+                *(asyncio.to_thread(self.analyze_content, p["html"], p.get("keyword", "")) for p in pages)
+            )
+        )
@@ -1,4 +1,6 @@
 """Tests for the SEO automation engine."""
+import asyncio
+
 from src.engine import SEOEngine
 
 
@@ -32,3 +34,53 @@ def test_score_range():
     result = engine.analyze_content(html)
     assert 0 <= result.score.overall <= 100
     assert 0 <= result.score.on_page <= 100
+
+
+def test_extracts_title_meta_and_headings():
+    engine = SEOEngine()
+    html = """<html><head><TITLE> A Reasonably Long Page Title For Testing </TITLE>
+    <meta name="description" content="Short description"></head>
+    <body><h1 class="x">One</h1><h2>Two</h2><H2>Three</H2><h3>Four</h3></body></html>"""
+    result = engine.analyze_content(html)
+    assert result.title == "A Reasonably Long Page Title For Testing"
+    assert result.meta_description == "Short description"
+    assert result.heading_count == {"h1": 1, "h2": 2, "h3": 1, "h4": 0, "h5": 0, "h6": 0}
+    assert result.word_count == 11
+
+
+def test_batch_analyze_preserves_order():
+    engine = SEOEngine()
+    pages = [
+        {"html": "<title>First page title that is long enough</title>", "keyword": "first"},
+        {"html": "<h1>No title</h1>"},
+    ]
+    results = asyncio.run(engine.batch_analyze(pages))
+    assert [r.keywords for r in results] == [["first"], []]
+    assert results[0].title == "First page title that is long enough"
+    assert results[1].title is None
+
+
+def test_scores_reflect_issue_penalties():
+    engine = SEOEngine()
+    html = "<html><head><title>Short</title></head><body><h1>A</h1><h1>B</h1></body></html>"
+    result = engine.analyze_content(html)
+    # Short title (-10), missing meta (-25), multiple H1 (-10); thin content (-20).
+    assert result.score.on_page == 55.0
+    assert result.score.content == 80.0
+    assert result.score.overall == 67.5
+
+
+def test_heading_count_ignores_similar_tags():
+    engine = SEOEngine()
+    html = "<header><h1>Title</h1></header><hr/><H3 id='a'>Sub</H3><p>text</p>"
+    result = engine.analyze_content(html)
+    assert result.heading_count == {"h1": 1, "h2": 0, "h3": 1, "h4": 0, "h5": 0, "h6": 0}
+    assert result.word_count == 3
+
+
+def test_title_extraction_edge_cases():
+    engine = SEOEngine()
+    assert engine.analyze_content("<title>Unclosed").title is None
+    assert engine.analyze_content("<TITLE lang='en'>\n Mixed Case \n</Title>").title == "Mixed Case"
+    # Lowercasing "İ" changes the string length, so offsets cannot be shared.
+    assert engine.analyze_content("<p>İİ</p><title>Ünïcode</title>").title == "Ünïcode"
@@ -0,0 +1,92 @@
+"""Shared JSON Lines helpers for log_decision.py and log_telemetry.py.
+
+Not a script: it is imported from the scripts directory, which is on
+sys.path whenever one of the scripts is run directly.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+try:  # orjson is optional; the stdlib json module is the fallback.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+@lru_cache(maxsize=1)
+def _iso_seconds(seconds: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+
+def iso_from_ns(ns: int) -> str:
+    """Format epoch nanoseconds as UTC ISO-8601 with microseconds, without a datetime."""
+    seconds, ns = divmod(ns, 1_000_000_000)
+    return f"{_iso_seconds(seconds)}.{ns // 1000:06d}+00:00"
+
+
+def now_iso() -> str:
+    return iso_from_ns(time.time_ns())
+
+
+_RAND_POOL_SIZE = 4096
+_rand_pool = b""
+_rand_off = 0
+_last_ms = -1
+_last_rand = 0
+
+
+def new_id() -> str:
+    """Return a time-ordered id: 48-bit ms timestamp plus 80 pooled random bits.
+
+    Ids minted within the same millisecond increment the random part, so they
+    still sort in creation order.
+    """
+    global _rand_pool, _rand_off, _last_ms, _last_rand
+    ms = time.time_ns() // 1_000_000
+    if ms <= _last_ms:
+        _last_rand += 1
+        return f"{_last_ms:012x}{_last_rand:020x}"
+    if _rand_off + 10 > len(_rand_pool):
+        _rand_pool = os.urandom(_RAND_POOL_SIZE)
+        _rand_off = 0
+    _last_rand = int.from_bytes(_rand_pool[_rand_off:_rand_off + 10], "big")
+    _rand_off += 10
+    _last_ms = ms
+    return f"{ms:012x}{_last_rand:020x}"
+
+
+def _dumps_line(entry: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(entry) + b"\n"
+    return json.dumps(entry, separators=(",", ":")).encode() + b"\n"
+
+
+def _migrate_json_to_jsonl(json_path: Path, jsonl_path: Path) -> None:
+    """Convert a legacy JSON-array log to JSONL once, before the first append."""
+    entries: list[Any] = json.loads(json_path.read_bytes())
+    tmp_path = jsonl_path.with_suffix(".tmp")
+    with tmp_path.open("wb") as fh:
+        fh.writelines(_dumps_line(entry) for entry in entries)
+    os.replace(tmp_path, jsonl_path)
+    json_path.unlink()
+
+
+def prepare_log(state_dir: Path, filename: str) -> Path:
+    """Return state_dir/filename, creating the directory and converting a legacy .json log."""
+    state_dir.mkdir(parents=True, exist_ok=True)
+    log_path = state_dir / filename
+    legacy_path = log_path.with_suffix(".json")
+    if legacy_path.exists() and not log_path.exists():
+        _migrate_json_to_jsonl(legacy_path, log_path)
+    return log_path
+
+
+def append_jsonl(path: Path, entries: list[dict[str, Any]]) -> None:
+    with path.open("ab") as fh:
+        fh.writelines(_dumps_line(entry) for entry in entries)
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Append a decision entry to decision_log.json.
+"""Append a decision entry to decision_log.jsonl.
 
 Creates the file if it does not already exist.
 
@@ -16,22 +16,37 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
-import os
-import uuid
-from datetime import datetime, timezone
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from _logio import append_jsonl, new_id, now_iso, prepare_log
 
-def _now_iso() -> str:
-    return datetime.now(tz=timezone.utc).isoformat()
+_LOG_NAME = "decision_log.jsonl"
 
 
-def _atomic_write(path: Path, data: list[Any]) -> None:
-    tmp_path = path.with_suffix(".tmp")
-    tmp_path.write_text(json.dumps(data, indent=2))
-    os.replace(tmp_path, path)
+def _build_entry(
+    timestamp: str,
+    decision_type: str,
+    description: str,
+    rationale: str,
+    made_by: str,
+    outcome: str | None = None,
+    related_components: list[str] | None = None,
+) -> dict[str, Any]:
+    entry: dict[str, Any] = {
+        "id": new_id(),
+        "timestamp": timestamp,
+        "decision_type": decision_type,
+        "description": description,
+        "rationale": rationale,
+        "made_by": made_by,
+        "related_components": related_components or [],
+    }
+    if outcome is not None:
+        entry["outcome"] = outcome
+    return entry
 
 
 def log_decision(
@@ -43,34 +58,33 @@ def log_decision(
     outcome: str | None,
     related_components: list[str],
 ) -> None:
-    state_dir.mkdir(parents=True, exist_ok=True)
-    log_path = state_dir / "decision_log.json"
+    entry = _build_entry(
+        now_iso(),
+        decision_type,
+        description,
+        rationale,
+        made_by,
+        outcome,
+        related_components,
+    )
+    append_jsonl(prepare_log(state_dir, _LOG_NAME), [entry])
 
-    if log_path.exists():
-        with log_path.open() as fh:
-            log: list[dict[str, Any]] = json.load(fh)
-    else:
-        log = []
 
-    entry: dict[str, Any] = {
-        "id": str(uuid.uuid4()),
-        "timestamp": _now_iso(),
-        "decision_type": decision_type,
-        "description": description,
-        "rationale": rationale,
-        "made_by": made_by,
-        "related_components": related_components,
-    }
-    if outcome is not None:
-        entry["outcome"] = outcome
+def log_decision_batch(state_dir: Path, decisions: list[dict[str, Any]]) -> None:
+    """Append many decisions with one shared timestamp and a single file write.
 
-    log.append(entry)
-    _atomic_write(log_path, log)
+    Each dict takes the keyword arguments of log_decision (except state_dir);
+    outcome and related_components may be omitted.
+    """
+    timestamp = now_iso()
+    entries = [_build_entry(timestamp, **decision) for decision in decisions]
+    append_jsonl(prepare_log(state_dir, _LOG_NAME), entries)
 
 
-def main() -> None:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
-        description="Append a decision to decision_log.json."
+        description="Append a decision to decision_log.jsonl."
     )
     parser.add_argument(
         "--state-dir",
@@ -96,7 +110,11 @@ def main() -> None:
         metavar="COMPONENT",
         help="Related component (may be repeated).",
     )
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
 
     log_decision(
         state_dir=args.state_dir,
@@ -107,7 +125,8 @@ def main() -> None:
         outcome=args.outcome,
         related_components=args.components,
     )
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Append a telemetry event to telemetry.json.
+"""Append a telemetry event to telemetry.jsonl.
 
 Creates the file if it does not already exist.
 
@@ -17,43 +17,27 @@ from __future__ import annotations
 
 import argparse
 import json
-import os
-import uuid
-from datetime import datetime, timezone
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from _logio import append_jsonl, new_id, now_iso, prepare_log
 
-def _now_iso() -> str:
-    return datetime.now(tz=timezone.utc).isoformat()
+_LOG_NAME = "telemetry.jsonl"
 
 
-def _atomic_write(path: Path, data: list[Any]) -> None:
-    tmp_path = path.with_suffix(".tmp")
-    tmp_path.write_text(json.dumps(data, indent=2))
-    os.replace(tmp_path, path)
-
-
-def log_telemetry(
-    state_dir: Path,
+def _build_event(
+    timestamp: str,
     event_type: str,
     component: str,
-    value: float | None,
-    unit: str | None,
-    metadata: dict[str, Any] | None,
-) -> None:
-    state_dir.mkdir(parents=True, exist_ok=True)
-    telemetry_path = state_dir / "telemetry.json"
-
-    if telemetry_path.exists():
-        with telemetry_path.open() as fh:
-            events: list[dict[str, Any]] = json.load(fh)
-    else:
-        events = []
-
+    value: float | None = None,
+    unit: str | None = None,
+    metadata: dict[str, Any] | None = None,
+) -> dict[str, Any]:
     event: dict[str, Any] = {
-        "event_id": str(uuid.uuid4()),
-        "timestamp": _now_iso(),
+        "event_id": new_id(),
+        "timestamp": timestamp,
         "event_type": event_type,
         "component": component,
     }
@@ -63,14 +47,36 @@ def log_telemetry(
         event["unit"] = unit
     if metadata is not None:
         event["metadata"] = metadata
+    return event
+
+
+def log_telemetry(
+    state_dir: Path,
+    event_type: str,
+    component: str,
+    value: float | None,
+    unit: str | None,
+    metadata: dict[str, Any] | None,
+) -> None:
+    event = _build_event(now_iso(), event_type, component, value, unit, metadata)
+    append_jsonl(prepare_log(state_dir, _LOG_NAME), [event])
+
 
-    events.append(event)
-    _atomic_write(telemetry_path, events)
+def log_telemetry_batch(state_dir: Path, events: list[dict[str, Any]]) -> None:
+    """Append many events with one shared timestamp and a single file write.
 
+    Each dict takes the keyword arguments of log_telemetry (except state_dir);
+    value, unit and metadata may be omitted.
+    """
+    timestamp = now_iso()
+    entries = [_build_event(timestamp, **event) for event in events]
+    append_jsonl(prepare_log(state_dir, _LOG_NAME), entries)
 
-def main() -> None:
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
-        description="Append a telemetry event to telemetry.json."
+        description="Append a telemetry event to telemetry.jsonl."
     )
     parser.add_argument(
         "--state-dir",
@@ -92,16 +98,19 @@ def main() -> None:
         default=None,
         help="JSON string of additional metadata key-value pairs.",
     )
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
 
     metadata: dict[str, Any] | None = None
     if args.metadata is not None:
         try:
             metadata = json.loads(args.metadata)
         except json.JSONDecodeError as exc:
-            import sys
             print(f"ERROR: --metadata is not valid JSON: {exc}", file=sys.stderr)
-            sys.exit(1)
+            return 1
 
     log_telemetry(
         state_dir=args.state_dir,
@@ -111,7 +120,8 @@ def main() -> None:
         unit=args.unit,
         metadata=metadata,
     )
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 """Rehydrate system memory by loading and validating all state files.
 
-Reads system_state.json, decision_log.json, architecture_map.json, and
-telemetry.json from --state-dir, validates each against its JSON Schema,
+Reads system_state.json, decision_log.jsonl, architecture_map.json, and
+telemetry.jsonl from --state-dir, validates each against its JSON Schema,
 and writes a consolidated context dict as JSON to --output (or stdout).
 
 Exit code is always 0; missing files are reported as warnings.
@@ -12,26 +12,39 @@ from __future__ import annotations
 
 import argparse
 import json
+import mmap
+import os
 import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:  # orjson is optional; the stdlib json module is the fallback.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 try:
     import jsonschema
-    from jsonschema import validate, ValidationError
+    from jsonschema import ValidationError
+    from jsonschema.exceptions import best_match
+    from jsonschema.validators import validator_for
 except ImportError:  # pragma: no cover
     print("ERROR: jsonschema is required. Run: pip install jsonschema", file=sys.stderr)
     sys.exit(1)
 
+_loads = orjson.loads if orjson is not None else json.loads
+
 # Resolve schema directory relative to this script.
 _SCHEMA_DIR = Path(__file__).resolve().parent.parent / "schemas"
 
 _STATE_FILES: dict[str, str] = {
     "system_state": "system_state.json",
-    "decision_log": "decision_log.json",
+    "decision_log": "decision_log.jsonl",
     "architecture_map": "architecture_map.json",
-    "telemetry": "telemetry.json",
+    "telemetry": "telemetry.jsonl",
 }
 
 _SCHEMA_FILES: dict[str, str] = {
@@ -42,10 +55,32 @@ _SCHEMA_FILES: dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=None)
 def _load_schema(key: str) -> dict[str, Any]:
     schema_path = _SCHEMA_DIR / _SCHEMA_FILES[key]
-    with schema_path.open() as fh:
-        return json.load(fh)
+    return _loads(schema_path.read_bytes())
+
+
+@lru_cache(maxsize=None)
+def _validator(key: str) -> Any:
+    """Check the schema once and return a reusable validator for it."""
+    schema = _load_schema(key)
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def _read_state_file(file_path: Path) -> Any:
+    with file_path.open("rb") as fh:
+        if file_path.suffix == ".jsonl":
+            # Stream the log so only one line's bytes are alive at a time.
+            return [_loads(line) for line in fh if line.strip()]
+        if orjson is None or os.fstat(fh.fileno()).st_size == 0:
+            return _loads(fh.read())
+        # orjson parses straight from the page cache without a heap copy.
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
 
 
 def _load_and_validate(
@@ -54,34 +89,46 @@ def _load_and_validate(
     warn_list: list[str],
 ) -> Any:
     file_path = state_dir / _STATE_FILES[key]
+    if not file_path.exists() and file_path.suffix == ".jsonl":
+        # Logs written before the JSONL switch are still JSON arrays.
+        legacy_path = file_path.with_suffix(".json")
+        if legacy_path.exists():
+            file_path = legacy_path
     if not file_path.exists():
         warn_list.append(f"Missing state file: {file_path}")
         return None
 
-    with file_path.open() as fh:
-        data = json.load(fh)
+    data = _read_state_file(file_path)
 
-    schema = _load_schema(key)
-    try:
-        validate(instance=data, schema=schema)
-    except ValidationError as exc:
-        warn_list.append(f"Validation warning for {file_path.name}: {exc.message}")
+    error: ValidationError | None = best_match(_validator(key).iter_errors(data))
+    if error is not None:
+        warn_list.append(f"Validation warning for {file_path.name}: {error.message}")
 
     return data
 
 
 def rehydrate(state_dir: Path) -> dict[str, Any]:
     """Load all state files and return a consolidated context dict."""
-    warn_list: list[str] = []
-    context: dict[str, Any] = {"warnings": warn_list}
-
-    for key in _STATE_FILES:
-        context[key] = _load_and_validate(state_dir, key, warn_list)
+    # Each file is read and validated on its own thread so disk reads overlap;
+    # warnings are kept per file and merged in _STATE_FILES order.
+    warn_lists: dict[str, list[str]] = {key: [] for key in _STATE_FILES}
+    with ThreadPoolExecutor(max_workers=len(_STATE_FILES)) as pool:
+        results = list(
+            pool.map(
+                lambda key: _load_and_validate(state_dir, key, warn_lists[key]),
+                _STATE_FILES,
+            )
+        )
 
+    context: dict[str, Any] = {
+        "warnings": [w for key in _STATE_FILES for w in warn_lists[key]]
+    }
+    context.update(zip(_STATE_FILES, results))
     return context
 
 
-def main() -> None:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Rehydrate system memory from state files."
     )
@@ -97,7 +144,11 @@ def main() -> None:
         default=None,
         help="Path to write the consolidated context JSON. Defaults to stdout.",
     )
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
 
     if not args.state_dir.is_dir():
         print(
@@ -110,14 +161,18 @@ def main() -> None:
     for warning in context.get("warnings", []):
         print(f"WARNING: {warning}", file=sys.stderr)
 
-    output_json = json.dumps(context, indent=2)
+    if orjson is not None:
+        output_json = orjson.dumps(context, option=orjson.OPT_INDENT_2).decode()
+    else:
+        output_json = json.dumps(context, indent=2)
 
     if args.output:
         args.output.parent.mkdir(parents=True, exist_ok=True)
         args.output.write_text(output_json)
     else:
         print(output_json)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
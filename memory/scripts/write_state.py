@@ -18,9 +18,15 @@ import json
 import os
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:  # orjson is optional; the stdlib json module is the fallback.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 _DEFAULT_STATE: dict[str, Any] = {
     "manifest_version": "1.0.0",
     "system_name": "infinity-template-library",
@@ -35,25 +41,34 @@ _DEFAULT_STATE: dict[str, Any] = {
 }
 
 
+_loads = orjson.loads if orjson is not None else json.loads
+
+
 def _now_iso() -> str:
     return datetime.now(tz=timezone.utc).isoformat()
 
 
 def _atomic_write(path: Path, data: dict[str, Any]) -> None:
     tmp_path = path.with_suffix(".tmp")
-    tmp_path.write_text(json.dumps(data, indent=2))
+    if orjson is not None:
+        tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        tmp_path.write_text(json.dumps(data, indent=2))
     os.replace(tmp_path, path)
 
 
 def load_state(state_dir: Path) -> dict[str, Any]:
     state_path = state_dir / "system_state.json"
     if state_path.exists():
-        with state_path.open() as fh:
-            return json.load(fh)
-    state = dict(_DEFAULT_STATE)
-    state["last_action_at"] = _now_iso()
-    return state
-
+        return _loads(state_path.read_bytes())
+    # Fresh containers so updates never alias the module-level defaults.
+    return {
+        **_DEFAULT_STATE,
+        "components_status": {},
+        "errors": [],
+        "warnings": [],
+        "last_action_at": _now_iso(),
+    }
 
 
 def write_state(
@@ -73,9 +88,7 @@ def write_state(
     if phase is not None:
         state["phase"] = phase
     if component is not None and status is not None:
-        if "components_status" not in state:
-            state["components_status"] = {}
-        state["components_status"][component] = status
+        state.setdefault("components_status", {})[component] = status
     if action is not None:
         state["last_action"] = action
     if health_score is not None:
@@ -86,7 +99,8 @@ def write_state(
     _atomic_write(state_dir / "system_state.json", state)
 
 
-def main() -> None:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Update system_state.json with current system information."
     )
@@ -117,11 +131,15 @@ def main() -> None:
         metavar="0-100",
         help="Overall system health score (0-100).",
     )
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
 
     if args.health_score is not None and not (0 <= args.health_score <= 100):
         print("ERROR: --health-score must be between 0 and 100.", file=sys.stderr)
-        sys.exit(1)
+        return 1
 
     write_state(
         state_dir=args.state_dir,
@@ -132,7 +150,8 @@ def main() -> None:
         action=args.action,
         health_score=args.health_score,
     )
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import importlib.util
 import json
 import subprocess
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
@@ -15,6 +17,27 @@ _REHYDRATE = str(_SCRIPTS_DIR / "rehydrate.py")
 _WRITE_STATE = str(_SCRIPTS_DIR / "write_state.py")
 _LOG_DECISION = str(_SCRIPTS_DIR / "log_decision.py")
 _LOG_TELEMETRY = str(_SCRIPTS_DIR / "log_telemetry.py")
+# The log scripts import their shared _logio helpers from the scripts directory.
+sys.path.insert(0, str(_SCRIPTS_DIR))
+
+
+def _read_jsonl(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _load_script(path: str):
+    spec = importlib.util.spec_from_file_location(Path(path).stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Scripts are imported once and driven through main(argv) in-process.
+rehydrate = _load_script(_REHYDRATE)
+write_state = _load_script(_WRITE_STATE)
+log_decision = _load_script(_LOG_DECISION)
+log_telemetry = _load_script(_LOG_TELEMETRY)
+import _logio  # noqa: E402
 
 
 # ---------------------------------------------------------------------------
@@ -22,15 +45,13 @@ _LOG_TELEMETRY = str(_SCRIPTS_DIR / "log_telemetry.py")
 # ---------------------------------------------------------------------------
 
 
-def test_rehydrate_empty_dir(tmp_path: Path) -> None:
+def test_rehydrate_empty_dir(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
     """Running rehydrate.py on an empty directory exits with code 0."""
-    result = subprocess.run(
-        [sys.executable, _REHYDRATE, "--state-dir", str(tmp_path)],
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0, result.stderr
-    context = json.loads(result.stdout)
+    rc = rehydrate.main(["--state-dir", str(tmp_path)])
+    assert rc == 0
+    context = json.loads(capsys.readouterr().out)
     assert "warnings" in context
     # All four keys should be present but None (files missing).
     for key in ("system_state", "decision_log", "architecture_map", "telemetry"):
@@ -38,7 +59,21 @@ def test_rehydrate_empty_dir(tmp_path: Path) -> None:
         assert context[key] is None
 
 
-def test_rehydrate_with_state_file(tmp_path: Path) -> None:
+def test_rehydrate_warnings_follow_file_order(tmp_path: Path) -> None:
+    """rehydrate() reports missing files in a stable order despite parallel loads."""
+    context = rehydrate.rehydrate(tmp_path)
+    missing = [w.rsplit("/", 1)[-1] for w in context["warnings"]]
+    assert missing == [
+        "system_state.json",
+        "decision_log.jsonl",
+        "architecture_map.json",
+        "telemetry.jsonl",
+    ]
+
+
+def test_rehydrate_with_state_file(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
     """rehydrate.py validates a valid system_state.json without warnings."""
     state = {
         "manifest_version": "1.0.0",
@@ -54,32 +89,57 @@ def test_rehydrate_with_state_file(tmp_path: Path) -> None:
     }
     (tmp_path / "system_state.json").write_text(json.dumps(state))
 
-    result = subprocess.run(
-        [sys.executable, _REHYDRATE, "--state-dir", str(tmp_path)],
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0, result.stderr
-    context = json.loads(result.stdout)
+    rc = rehydrate.main(["--state-dir", str(tmp_path)])
+    assert rc == 0
+    context = json.loads(capsys.readouterr().out)
     assert context["system_state"]["system_name"] == "test-system"
 
 
+def test_rehydrate_reports_validation_warning(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """rehydrate.py reports schema violations as warnings and still loads data."""
+    (tmp_path / "system_state.json").write_text(json.dumps({"phase": "building"}))
+
+    rc = rehydrate.main(["--state-dir", str(tmp_path)])
+    assert rc == 0
+    context = json.loads(capsys.readouterr().out)
+    assert context["system_state"] == {"phase": "building"}
+    assert any(
+        w.startswith("Validation warning for system_state.json")
+        for w in context["warnings"]
+    )
+
+
+def test_rehydrate_reads_legacy_json_log(tmp_path: Path) -> None:
+    """rehydrate.py still loads a decision_log.json array written before JSONL."""
+    entry = {
+        "id": "legacy-1",
+        "timestamp": "2024-01-01T00:00:00+00:00",
+        "decision_type": "architecture",
+        "description": "Use PostgreSQL",
+        "rationale": "ACID compliance",
+        "made_by": "human",
+    }
+    (tmp_path / "decision_log.json").write_text(json.dumps([entry], indent=2))
+
+    context = rehydrate.rehydrate(tmp_path)
+    assert context["decision_log"] == [entry]
+    assert not any("decision_log" in w for w in context["warnings"])
+
+
 def test_rehydrate_output_file(tmp_path: Path) -> None:
     """rehydrate.py writes context JSON to --output path."""
     out_file = tmp_path / "ctx" / "context.json"
-    result = subprocess.run(
+    rc = rehydrate.main(
         [
-            sys.executable,
-            _REHYDRATE,
             "--state-dir",
             str(tmp_path),
             "--output",
             str(out_file),
-        ],
-        capture_output=True,
-        text=True,
+        ]
     )
-    assert result.returncode == 0, result.stderr
+    assert rc == 0
     assert out_file.exists()
     context = json.loads(out_file.read_text())
     assert "warnings" in context
@@ -92,19 +152,15 @@ def test_rehydrate_output_file(tmp_path: Path) -> None:
 
 def test_write_state_creates_file(tmp_path: Path) -> None:
     """write_state.py creates system_state.json when it does not exist."""
-    result = subprocess.run(
+    rc = write_state.main(
         [
-            sys.executable,
-            _WRITE_STATE,
             "--state-dir",
             str(tmp_path),
             "--action",
             "initialise",
-        ],
-        capture_output=True,
-        text=True,
+        ]
     )
-    assert result.returncode == 0, result.stderr
+    assert rc == 0
     state_file = tmp_path / "system_state.json"
     assert state_file.exists()
     state = json.loads(state_file.read_text())
@@ -114,70 +170,64 @@ def test_write_state_creates_file(tmp_path: Path) -> None:
 def test_write_state_updates_phase(tmp_path: Path) -> None:
     """write_state.py updates the phase field correctly."""
     # First call creates the file.
-    subprocess.run(
-        [sys.executable, _WRITE_STATE, "--state-dir", str(tmp_path), "--phase", "planning"],
-        check=True,
-    )
+    assert write_state.main(["--state-dir", str(tmp_path), "--phase", "planning"]) == 0
     # Second call updates the phase.
-    subprocess.run(
-        [sys.executable, _WRITE_STATE, "--state-dir", str(tmp_path), "--phase", "building"],
-        check=True,
-    )
+    assert write_state.main(["--state-dir", str(tmp_path), "--phase", "building"]) == 0
     state = json.loads((tmp_path / "system_state.json").read_text())
     assert state["phase"] == "building"
 
 
 def test_write_state_updates_component_status(tmp_path: Path) -> None:
     """write_state.py stores component status correctly."""
-    subprocess.run(
+    assert write_state.main(
         [
-            sys.executable,
-            _WRITE_STATE,
             "--state-dir",
             str(tmp_path),
             "--component",
             "api",
             "--status",
             "healthy",
-        ],
-        check=True,
-    )
+        ]
+    ) == 0
     state = json.loads((tmp_path / "system_state.json").read_text())
     assert state["components_status"]["api"] == "healthy"
 
 
 def test_write_state_updates_health_score(tmp_path: Path) -> None:
     """write_state.py sets health_score correctly."""
-    subprocess.run(
+    assert write_state.main(
         [
-            sys.executable,
-            _WRITE_STATE,
             "--state-dir",
             str(tmp_path),
             "--health-score",
             "72",
-        ],
-        check=True,
-    )
+        ]
+    ) == 0
     state = json.loads((tmp_path / "system_state.json").read_text())
     assert state["health_score"] == 72
 
 
+def test_load_state_default_does_not_alias_module_defaults(tmp_path: Path) -> None:
+    """load_state returns fresh containers when no state file exists."""
+    state = write_state.load_state(tmp_path)
+    state["components_status"]["api"] = "healthy"
+    state["errors"].append("boom")
+    assert write_state._DEFAULT_STATE["components_status"] == {}
+    assert write_state._DEFAULT_STATE["errors"] == []
+    assert write_state.load_state(tmp_path)["components_status"] == {}
+
+
 def test_write_state_invalid_health_score(tmp_path: Path) -> None:
     """write_state.py exits non-zero for out-of-range health score."""
-    result = subprocess.run(
+    rc = write_state.main(
         [
-            sys.executable,
-            _WRITE_STATE,
             "--state-dir",
             str(tmp_path),
             "--health-score",
             "150",
-        ],
-        capture_output=True,
-        text=True,
+        ]
     )
-    assert result.returncode != 0
+    assert rc != 0
 
 
 # ---------------------------------------------------------------------------
@@ -186,11 +236,9 @@ def test_write_state_invalid_health_score(tmp_path: Path) -> None:
 
 
 def test_log_decision_creates_file(tmp_path: Path) -> None:
-    """log_decision.py creates decision_log.json when it does not exist."""
-    result = subprocess.run(
+    """log_decision.py creates decision_log.jsonl when it does not exist."""
+    rc = log_decision.main(
         [
-            sys.executable,
-            _LOG_DECISION,
             "--state-dir",
             str(tmp_path),
             "--type",
@@ -201,26 +249,22 @@ def test_log_decision_creates_file(tmp_path: Path) -> None:
             "ACID compliance",
             "--made-by",
             "human",
-        ],
-        capture_output=True,
-        text=True,
+        ]
     )
-    assert result.returncode == 0, result.stderr
-    log_file = tmp_path / "decision_log.json"
+    assert rc == 0
+    log_file = tmp_path / "decision_log.jsonl"
     assert log_file.exists()
-    log = json.loads(log_file.read_text())
+    log = _read_jsonl(log_file)
     assert isinstance(log, list)
     assert len(log) == 1
     assert log[0]["decision_type"] == "architecture"
 
 
 def test_log_decision_appends(tmp_path: Path) -> None:
-    """log_decision.py appends entries to an existing decision_log.json."""
+    """log_decision.py appends entries to an existing decision_log.jsonl."""
     for i in range(3):
-        subprocess.run(
+        assert log_decision.main(
             [
-                sys.executable,
-                _LOG_DECISION,
                 "--state-dir",
                 str(tmp_path),
                 "--type",
@@ -231,19 +275,39 @@ def test_log_decision_appends(tmp_path: Path) -> None:
                 "reason",
                 "--made-by",
                 "agent",
-            ],
-            check=True,
-        )
-    log = json.loads((tmp_path / "decision_log.json").read_text())
+            ]
+        ) == 0
+    log = _read_jsonl(tmp_path / "decision_log.jsonl")
     assert len(log) == 3
 
 
+def test_log_decision_ids_are_time_ordered(tmp_path: Path) -> None:
+    """log_decision.py assigns unique ids that sort in append order."""
+    for i in range(3):
+        assert log_decision.main(
+            [
+                "--state-dir",
+                str(tmp_path),
+                "--type",
+                "tooling",
+                "--description",
+                f"Decision {i}",
+                "--rationale",
+                "reason",
+                "--made-by",
+                "agent",
+            ]
+        ) == 0
+    log = _read_jsonl(tmp_path / "decision_log.jsonl")
+    ids = [entry["id"] for entry in log]
+    assert len(set(ids)) == 3
+    assert ids == sorted(ids)
+
+
 def test_log_decision_with_components(tmp_path: Path) -> None:
     """log_decision.py records related_components correctly."""
-    subprocess.run(
+    assert log_decision.main(
         [
-            sys.executable,
-            _LOG_DECISION,
             "--state-dir",
             str(tmp_path),
             "--type",
@@ -258,10 +322,9 @@ def test_log_decision_with_components(tmp_path: Path) -> None:
             "backend",
             "--component",
             "frontend",
-        ],
-        check=True,
-    )
-    log = json.loads((tmp_path / "decision_log.json").read_text())
+        ]
+    ) == 0
+    log = _read_jsonl(tmp_path / "decision_log.jsonl")
     assert set(log[0]["related_components"]) == {"backend", "frontend"}
 
 
@@ -271,32 +334,26 @@ def test_log_decision_with_components(tmp_path: Path) -> None:
 
 
 def test_log_telemetry_creates_file(tmp_path: Path) -> None:
-    """log_telemetry.py creates telemetry.json when it does not exist."""
-    result = subprocess.run(
+    """log_telemetry.py creates telemetry.jsonl when it does not exist."""
+    rc = log_telemetry.main(
         [
-            sys.executable,
-            _LOG_TELEMETRY,
             "--state-dir",
             str(tmp_path),
             "--event-type",
             "health_check",
             "--component",
             "api",
-        ],
-        capture_output=True,
-        text=True,
+        ]
     )
-    assert result.returncode == 0, result.stderr
-    assert (tmp_path / "telemetry.json").exists()
+    assert rc == 0
+    assert (tmp_path / "telemetry.jsonl").exists()
 
 
 def test_log_telemetry_appends(tmp_path: Path) -> None:
-    """log_telemetry.py appends multiple events to telemetry.json."""
+    """log_telemetry.py appends multiple events to telemetry.jsonl."""
     for event_type in ("test_pass", "test_fail", "deploy"):
-        subprocess.run(
+        assert log_telemetry.main(
             [
-                sys.executable,
-                _LOG_TELEMETRY,
                 "--state-dir",
                 str(tmp_path),
                 "--event-type",
@@ -307,10 +364,9 @@ def test_log_telemetry_appends(tmp_path: Path) -> None:
                 "42",
                 "--unit",
                 "ms",
-            ],
-            check=True,
-        )
-    events = json.loads((tmp_path / "telemetry.json").read_text())
+            ]
+        ) == 0
+    events = _read_jsonl(tmp_path / "telemetry.jsonl")
     assert len(events) == 3
     assert events[0]["event_type"] == "test_pass"
     assert events[1]["event_type"] == "test_fail"
@@ -320,10 +376,8 @@ def test_log_telemetry_appends(tmp_path: Path) -> None:
 def test_log_telemetry_with_metadata(tmp_path: Path) -> None:
     """log_telemetry.py stores metadata dict correctly."""
     meta = json.dumps({"run_id": "abc123", "branch": "main"})
-    subprocess.run(
+    assert log_telemetry.main(
         [
-            sys.executable,
-            _LOG_TELEMETRY,
             "--state-dir",
             str(tmp_path),
             "--event-type",
@@ -332,19 +386,16 @@ def test_log_telemetry_with_metadata(tmp_path: Path) -> None:
             "ci",
             "--metadata",
             meta,
-        ],
-        check=True,
-    )
-    events = json.loads((tmp_path / "telemetry.json").read_text())
+        ]
+    ) == 0
+    events = _read_jsonl(tmp_path / "telemetry.jsonl")
     assert events[0]["metadata"]["run_id"] == "abc123"
 
 
 def test_log_telemetry_invalid_metadata(tmp_path: Path) -> None:
     """log_telemetry.py exits non-zero for invalid --metadata JSON."""
-    result = subprocess.run(
+    rc = log_telemetry.main(
         [
-            sys.executable,
-            _LOG_TELEMETRY,
             "--state-dir",
             str(tmp_path),
             "--event-type",
@@ -353,8 +404,88 @@ def test_log_telemetry_invalid_metadata(tmp_path: Path) -> None:
             "api",
             "--metadata",
             "not-valid-json",
+        ]
+    )
+    assert rc != 0
+
+
+def test_log_telemetry_migrates_legacy_json(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """log_telemetry.py converts an existing telemetry.json array to JSONL."""
+    legacy = [
+        {
+            "event_id": "legacy-1",
+            "timestamp": "2024-01-01T00:00:00+00:00",
+            "event_type": "deploy",
+            "component": "api",
+        }
+    ]
+    (tmp_path / "telemetry.json").write_text(json.dumps(legacy, indent=2))
+    assert log_telemetry.main(
+        [
+            "--state-dir",
+            str(tmp_path),
+            "--event-type",
+            "health_check",
+            "--component",
+            "api",
+        ]
+    ) == 0
+    assert not (tmp_path / "telemetry.json").exists()
+    events = _read_jsonl(tmp_path / "telemetry.jsonl")
+    assert [e["event_type"] for e in events] == ["deploy", "health_check"]
+
+    rc = rehydrate.main(["--state-dir", str(tmp_path)])
+    assert rc == 0
+    context = json.loads(capsys.readouterr().out)
+    assert len(context["telemetry"]) == 2
+    assert not any("telemetry.json" in w for w in context["warnings"])
+
+
+def test_log_telemetry_batch_shares_timestamp(tmp_path: Path) -> None:
+    """log_telemetry_batch appends every event with one shared timestamp."""
+    log_telemetry.log_telemetry_batch(
+        tmp_path,
+        [
+            {"event_type": "test_pass", "component": "api", "value": 12.0, "unit": "ms"},
+            {"event_type": "test_fail", "component": "web"},
         ],
+    )
+    events = _read_jsonl(tmp_path / "telemetry.jsonl")
+    assert [e["event_type"] for e in events] == ["test_pass", "test_fail"]
+    assert events[0]["timestamp"] == events[1]["timestamp"]
+    assert "unit" not in events[1]
+
+
+def test_iso_from_ns_matches_datetime_isoformat() -> None:
+    """iso_from_ns formats the same string as datetime.isoformat."""
+    iso_from_ns = _logio.iso_from_ns
+    for ns in (0, 1_700_000_000_123_456_789, 1_700_000_001_000_000_000):
+        expected = datetime.fromtimestamp(ns // 1_000_000_000, tz=timezone.utc).replace(
+            microsecond=ns % 1_000_000_000 // 1000
+        )
+        assert iso_from_ns(ns) == expected.isoformat(timespec="microseconds")
+
+
+# ---------------------------------------------------------------------------
+# Command-line entry points
+# ---------------------------------------------------------------------------
+
+
+def test_scripts_propagate_exit_codes(tmp_path: Path) -> None:
+    """Running a script directly exits with the code returned by main()."""
+    ok = subprocess.run(
+        [sys.executable, _REHYDRATE, "--state-dir", str(tmp_path)],
+        capture_output=True,
+        text=True,
+    )
+    assert ok.returncode == 0, ok.stderr
+    assert "warnings" in json.loads(ok.stdout)
+
+    failed = subprocess.run(
+        [sys.executable, _WRITE_STATE, "--state-dir", str(tmp_path), "--health-score", "150"],
         capture_output=True,
         text=True,
     )
-    assert result.returncode != 0
+    assert failed.returncode == 1
@@ -3,27 +3,28 @@ import pytest
 from pathlib import Path
 
 STAGES_DIR = Path(__file__).parent.parent / "stages"
-REQUIRED_STAGE_KEYS = {"stage", "order", "description", "trigger", "inputs", "outputs", "tools", "governance", "next_stage"}
+REQUIRED_STAGE_KEYS = frozenset({"stage", "order", "description", "trigger", "inputs", "outputs", "tools", "governance", "next_stage"})
 
 
 def get_stage_files():
-    return list(STAGES_DIR.glob("*/stage.json"))
+    return sorted(STAGES_DIR.glob("*/stage.json"))
 
 
-@pytest.mark.parametrize("stage_file", get_stage_files(), ids=lambda f: f.parent.name)
-def test_stage_json_valid(stage_file):
+# Each stage.json is read and parsed once, then shared by every test below.
+_STAGES = [(f, json.loads(f.read_text())) for f in get_stage_files()]
+_STAGES_BY_NAME = {f.parent.name: data for f, data in _STAGES}
+
+
+@pytest.mark.parametrize("stage_file, data", _STAGES, ids=[f.parent.name for f, _ in _STAGES])
+def test_stage_json_valid(stage_file, data):
     """Every stage.json must be valid JSON with required keys."""
-    data = json.loads(stage_file.read_text())
-    missing = REQUIRED_STAGE_KEYS - set(data.keys())
+    missing = REQUIRED_STAGE_KEYS.difference(data)
     assert not missing, f"Stage {stage_file.parent.name} missing keys: {missing}"
 
 
 def test_stage_order_unique():
     """No two stages should have the same order."""
-    orders = []
-    for sf in get_stage_files():
-        data = json.loads(sf.read_text())
-        orders.append(data["order"])
+    orders = [data["order"] for _, data in _STAGES]
     assert len(orders) == len(set(orders))
 
 
@@ -36,5 +37,12 @@ def test_pipeline_json_valid():
 
 def test_next_stage_forms_cycle():
     """scale's next_stage should be discovery (forms a loop)."""
-    scale = json.loads((STAGES_DIR / "scale" / "stage.json").read_text())
+    scale = _STAGES_BY_NAME["scale"]
     assert scale["next_stage"] == "discovery"
+
+
+def test_stage_files_match_pipeline():
+    """Every stage listed in pipeline.json has exactly one stage.json."""
+    pipeline_file = Path(__file__).parent.parent / "pipeline.json"
+    stages = json.loads(pipeline_file.read_text())["stages"]
+    assert sorted(stages) == sorted(_STAGES_BY_NAME)
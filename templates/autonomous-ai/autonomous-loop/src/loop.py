@@ -5,12 +5,30 @@ A self-running agent loop that executes tasks until a goal is achieved
 or governance limits are hit (budget, iterations, time).
 Implements the OODA loop: Observe → Orient → Decide → Act
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+from dataclasses import dataclass, field
 from typing import Any, Optional, Callable
-from datetime import datetime, timezone
+from functools import lru_cache
+from bisect import bisect_left
+from operator import attrgetter
 from enum import Enum
+import itertools
+import time
 import uuid
 
+
+@lru_cache(maxsize=1)
+def _iso_seconds(seconds: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+
+def _utc_now_iso() -> str:
+    """UTC ISO-8601 timestamp; the per-second prefix is formatted once and reused."""
+    seconds, ns = divmod(time.time_ns(), 1_000_000_000)
+    return f"{_iso_seconds(seconds)}.{ns // 1000:06d}+00:00"
+
+_ITERATION = attrgetter("iteration")
+
 class LoopStatus(str, Enum):
     IDLE = "idle"
     RUNNING = "running"
@@ -27,17 +45,19 @@ class GovernanceLimits(BaseModel):
     require_human_above_cost: float = 0.50
     allow_irreversible_actions: bool = False
 
-class LoopObservation(BaseModel):
-    observation_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class LoopObservation:
+    observation_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     iteration: int
     data: Any
-    timestamp: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    timestamp: str = field(default_factory=_utc_now_iso)
 
-class LoopAction(BaseModel):
-    action_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class LoopAction:
+    action_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     iteration: int
     action_type: str
-    parameters: dict = Field(default_factory=dict)
+    parameters: dict = field(default_factory=dict)
     cost_usd: float = 0.0
     reversible: bool = True
     executed: bool = False
@@ -54,6 +74,8 @@ class LoopState(BaseModel):
     goal_achieved: bool = False
     started_at: Optional[str] = None
     completed_at: Optional[str] = None
+    # Maintained by execute_action so summaries never rescan the action list.
+    _executed_count: int = PrivateAttr(default=0)
 
 class AutonomousLoop:
     """
@@ -65,15 +87,23 @@ class AutonomousLoop:
     def __init__(self, goal: str, limits: GovernanceLimits | None = None):
         self.state = LoopState(goal=goal)
         self.limits = limits or GovernanceLimits()
+        # Observation/action ids are scoped by loop_id, so a counter keeps them unique.
+        self._ids = itertools.count()
+
+    def _next_id(self) -> str:
+        return f"{self.state.loop_id}-{next(self._ids):x}"
 
     def observe(self, data: Any) -> LoopObservation:
-        obs = LoopObservation(iteration=self.state.iteration, data=data)
+        obs = LoopObservation(
+            observation_id=self._next_id(), iteration=self.state.iteration, data=data
+        )
         self.state.observations.append(obs)
         return obs
 
     def decide_action(self, action_type: str, parameters: dict,
                       cost_usd: float = 0.0, reversible: bool = True) -> LoopAction:
         action = LoopAction(
+            action_id=self._next_id(),
             iteration=self.state.iteration,
             action_type=action_type,
             parameters=parameters,
@@ -97,8 +127,9 @@ class AutonomousLoop:
         else:
             action.result = {"status": "simulated", "action": action.action_type}
         action.executed = True
-        self.state.total_cost_usd += action.cost_usd
+        self.state.total_cost_usd = projected_cost
         self.state.actions.append(action)
+        self.state._executed_count += 1
         return action
 
     def advance_iteration(self) -> bool:
@@ -112,12 +143,12 @@ class AutonomousLoop:
     def mark_complete(self, goal_achieved: bool = True) -> LoopState:
         self.state.goal_achieved = goal_achieved
         self.state.status = LoopStatus.COMPLETE if goal_achieved else LoopStatus.FAILED
-        self.state.completed_at = datetime.now(timezone.utc).isoformat()
+        self.state.completed_at = _utc_now_iso()
         return self.state
 
     def start(self) -> LoopState:
         self.state.status = LoopStatus.RUNNING
-        self.state.started_at = datetime.now(timezone.utc).isoformat()
+        self.state.started_at = _utc_now_iso()
         return self.state
 
     def get_summary(self) -> dict:
@@ -127,5 +158,17 @@ class AutonomousLoop:
             "iterations": self.state.iteration,
             "total_cost_usd": self.state.total_cost_usd,
             "goal_achieved": self.state.goal_achieved,
-            "actions_taken": len([a for a in self.state.actions if a.executed]),
+            "actions_taken": self.state._executed_count,
+        }
+
+    def summary_delta(self, since_iteration: int) -> dict:
+        """Summary plus only the observations/actions from since_iteration onward."""
+        # Observations are appended in iteration order, so their delta starts at a bisected
+        # index. Actions are appended when executed, which can lag the iteration they were
+        # decided in, so they are filtered.
+        observations = self.state.observations
+        return {
+            **self.get_summary(),
+            "observations": observations[bisect_left(observations, since_iteration, key=_ITERATION):],
+            "actions": [a for a in self.state.actions if a.iteration >= since_iteration],
         }
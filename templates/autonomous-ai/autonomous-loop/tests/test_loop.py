@@ -1,6 +1,3 @@
-import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 import pytest
 from loop import AutonomousLoop, GovernanceLimits, LoopStatus
 
@@ -61,3 +58,55 @@ def test_advance_and_complete():
     assert final.goal_achieved is True
     assert final.status == LoopStatus.COMPLETE
     assert final.completed_at is not None
+
+
+def test_observation_and_action_ids_scoped_to_loop():
+    from datetime import datetime, timezone
+
+    loop = AutonomousLoop(goal="Track ids")
+    loop.start()
+    obs = [loop.observe(i) for i in range(3)]
+    action = loop.decide_action("noop", {})
+    ids = [o.observation_id for o in obs] + [action.action_id]
+    assert len(set(ids)) == 4
+    assert all(i.startswith(loop.state.loop_id) for i in ids)
+    stamp = datetime.fromisoformat(obs[0].timestamp)
+    assert stamp.tzinfo == timezone.utc
+    assert abs((datetime.now(timezone.utc) - stamp).total_seconds()) < 5
+
+
+def test_summary_counts_executed_actions():
+    loop = AutonomousLoop(goal="Count actions")
+    loop.start()
+    for cost in (0.1, 0.2):
+        loop.execute_action(loop.decide_action("step", {}, cost_usd=cost))
+    with pytest.raises(ValueError):
+        loop.execute_action(loop.decide_action("big", {}, cost_usd=5.0))
+    summary = loop.get_summary()
+    assert summary["actions_taken"] == 2
+    assert summary["total_cost_usd"] == pytest.approx(0.3)
+
+
+def test_summary_delta_returns_entries_since_iteration():
+    loop = AutonomousLoop(goal="Stream progress")
+    loop.start()
+    loop.observe("first")
+    loop.execute_action(loop.decide_action("step", {}))
+    loop.advance_iteration()
+    second = loop.observe("second")
+    delta = loop.summary_delta(since_iteration=1)
+    assert delta["observations"] == [second]
+    assert delta["actions"] == []
+    assert delta["actions_taken"] == 1
+    assert len(loop.summary_delta(since_iteration=0)["observations"]) == 2
+
+
+def test_summary_delta_keeps_actions_executed_out_of_order():
+    loop = AutonomousLoop(goal="Stream progress")
+    loop.start()
+    late = loop.decide_action("late", {})
+    loop.advance_iteration()
+    current = loop.execute_action(loop.decide_action("current", {}))
+    loop.execute_action(late)
+    assert loop.summary_delta(since_iteration=1)["actions"] == [current]
+    assert loop.summary_delta(since_iteration=0)["actions"] == [current, late]
@@ -5,6 +5,8 @@ A unified chat interface that routes messages to any supported LLM provider.
 Supports: OpenAI, Ollama, Groq, Gemini (all via the connectors/ modules)
 """
 from pydantic import BaseModel, Field
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Optional, Any
 from enum import Enum
 import uuid
@@ -15,7 +17,8 @@ class Provider(str, Enum):
     GROQ = "groq"
     GEMINI = "gemini"
 
-class Message(BaseModel):
+@dataclass(slots=True)
+class Message:
     role: str  # system|user|assistant
     content: str
 
@@ -54,9 +57,12 @@ class MultiProviderChat:
         Provider.GROQ: ["llama-3.3-70b-versatile", "mixtral-8x7b-32768"],
         Provider.GEMINI: ["gemini-1.5-pro", "gemini-2.0-flash"],
     }
+    _PROVIDER_MODEL_SETS = {p: frozenset(m) for p, m in PROVIDER_MODELS.items()}
 
-    def __init__(self):
-        self.sessions: dict[str, ConversationHistory] = {}
+    def __init__(self, max_sessions: int = 10_000):
+        # Least-recently-used sessions are evicted once max_sessions is exceeded.
+        self.sessions: OrderedDict[str, ConversationHistory] = OrderedDict()
+        self.max_sessions = max_sessions
 
     def create_session(self, provider: Provider = Provider.OPENAI,
                        model: str = "gpt-4o-mini",
@@ -65,12 +71,12 @@ class MultiProviderChat:
         if system_prompt:
             session.messages.append(Message(role="system", content=system_prompt))
         self.sessions[session.session_id] = session
+        if len(self.sessions) > self.max_sessions:
+            self.sessions.popitem(last=False)
         return session
 
     def add_message(self, session_id: str, role: str, content: str) -> Message:
-        session = self.sessions.get(session_id)
-        if not session:
-            raise ValueError(f"Session {session_id} not found")
+        session = self.get_session(session_id)
         msg = Message(role=role, content=content)
         session.messages.append(msg)
         return msg
@@ -79,11 +85,15 @@ class MultiProviderChat:
         session = self.sessions.get(session_id)
         if not session:
             raise ValueError(f"Session {session_id} not found")
+        self.sessions.move_to_end(session_id)
         return session
 
     def list_models(self, provider: Provider) -> list[str]:
         return self.PROVIDER_MODELS.get(provider, [])
 
+    def supports(self, provider: Provider, model: str) -> bool:
+        return model in self._PROVIDER_MODEL_SETS.get(provider, frozenset())
+
     def build_request(self, session_id: str, user_message: str) -> ChatRequest:
         session = self.get_session(session_id)
         self.add_message(session_id, "user", user_message)
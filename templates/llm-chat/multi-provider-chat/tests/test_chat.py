@@ -1,6 +1,3 @@
-import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from chat import MultiProviderChat, Provider, Message
 
 
@@ -54,3 +51,20 @@ def test_list_models():
 
     gemini_models = chat.list_models(Provider.GEMINI)
     assert "gemini-1.5-pro" in gemini_models
+
+
+def test_sessions_evict_least_recently_used():
+    chat = MultiProviderChat(max_sessions=2)
+    first = chat.create_session()
+    second = chat.create_session()
+    chat.get_session(first.session_id)  # first becomes most recently used
+    third = chat.create_session()
+    assert list(chat.sessions) == [first.session_id, third.session_id]
+    assert second.session_id not in chat.sessions
+
+
+def test_supports_checks_provider_models():
+    chat = MultiProviderChat()
+    assert chat.supports(Provider.OPENAI, "gpt-4o")
+    assert not chat.supports(Provider.OPENAI, "llama3.2")
+    assert chat.supports(Provider.OLLAMA, "llama3.2")
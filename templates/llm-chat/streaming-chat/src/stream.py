@@ -4,8 +4,10 @@ Streaming Chat Template
 Handles streaming token responses from LLM APIs.
 Supports SSE (Server-Sent Events) and WebSocket streaming.
 """
-from pydantic import BaseModel, Field
-from typing import Iterator, AsyncIterator, Optional
+from pydantic import BaseModel, Field, computed_field, model_validator
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Iterator, AsyncIterator, Optional
 from enum import Enum
 import uuid
 
@@ -14,8 +16,9 @@ class StreamMode(str, Enum):
     WEBSOCKET = "websocket"
     GENERATOR = "generator"
 
-class StreamChunk(BaseModel):
-    chunk_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True)
+class StreamChunk:
+    chunk_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     session_id: str
     delta: str  # The incremental token(s)
     finish_reason: Optional[str] = None  # None until stream ends
@@ -24,50 +27,81 @@ class StreamChunk(BaseModel):
 class StreamSession(BaseModel):
     session_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     mode: StreamMode = StreamMode.GENERATOR
-    buffer: str = ""
+    # Excluded from dumps so they keep the original shape: the joined text appears once, as buffer.
+    buffer_parts: list[str] = Field(default_factory=list, exclude=True)
     chunk_count: int = 0
     complete: bool = False
 
+    @computed_field
+    @property
+    def buffer(self) -> str:
+        # Deltas are appended in O(1) and joined only when the text is read.
+        return "".join(self.buffer_parts)
+
+    @buffer.setter
+    def buffer(self, value: str) -> None:
+        self.buffer_parts = [value]
+
+    @model_validator(mode="before")
+    @classmethod
+    def _buffer_to_parts(cls, data: Any) -> Any:
+        # Dumps carry only the joined buffer, so accept it back as a single part.
+        if isinstance(data, dict) and "buffer" in data:
+            data = dict(data)
+            buffer = data.pop("buffer")
+            data.setdefault("buffer_parts", [buffer] if buffer else [])
+        return data
+
 class StreamingChatEngine:
     """Manages streaming chat sessions."""
 
-    def __init__(self):
-        self.sessions: dict[str, StreamSession] = {}
+    def __init__(self, max_sessions: int = 10_000):
+        # Least-recently-used sessions are evicted once max_sessions is exceeded.
+        self.sessions: OrderedDict[str, StreamSession] = OrderedDict()
+        self.max_sessions = max_sessions
 
     def create_stream_session(self, mode: StreamMode = StreamMode.GENERATOR) -> StreamSession:
         session = StreamSession(mode=mode)
         self.sessions[session.session_id] = session
+        if len(self.sessions) > self.max_sessions:
+            self.sessions.popitem(last=False)
         return session
 
-    def consume_chunk(self, session_id: str, delta: str,
-                      finish_reason: str | None = None) -> StreamChunk:
+    def _get_session(self, session_id: str) -> StreamSession:
         session = self.sessions.get(session_id)
         if not session:
             raise ValueError(f"Stream session {session_id} not found")
+        self.sessions.move_to_end(session_id)
+        return session
+
+    def consume_chunk(self, session_id: str, delta: str,
+                      finish_reason: str | None = None) -> StreamChunk:
+        session = self._get_session(session_id)
         if session.complete:
             raise ValueError(f"Stream session {session_id} is already complete")
         chunk = StreamChunk(
+            # Unique per session without a uuid4() call per token.
+            chunk_id=f"{session_id}-{session.chunk_count}",
             session_id=session_id,
             delta=delta,
             finish_reason=finish_reason,
             index=session.chunk_count,
         )
-        session.buffer += delta
+        session.buffer_parts.append(delta)
         session.chunk_count += 1
         if finish_reason == "stop":
             session.complete = True
         return chunk
 
     def get_full_response(self, session_id: str) -> str:
-        session = self.sessions.get(session_id)
-        if not session:
-            raise ValueError(f"Stream session {session_id} not found")
-        return session.buffer
+        return self._get_session(session_id).buffer
 
     def simulate_stream(self, session_id: str, full_text: str) -> Iterator[StreamChunk]:
         """Simulate streaming by yielding words one at a time."""
         words = full_text.split()
-        for i, word in enumerate(words):
-            delta = word + (" " if i < len(words) - 1 else "")
-            finish = "stop" if i == len(words) - 1 else None
-            yield self.consume_chunk(session_id, delta, finish)
+        if not words:
+            return
+        last = words.pop()
+        for word in words:
+            yield self.consume_chunk(session_id, word + " ")
+        yield self.consume_chunk(session_id, last, "stop")
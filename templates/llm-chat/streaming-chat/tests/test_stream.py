@@ -1,8 +1,5 @@
-import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 import pytest
-from stream import StreamingChatEngine, StreamMode
+from stream import StreamingChatEngine, StreamMode, StreamSession
 
 
 def test_create_stream_session():
@@ -46,3 +43,45 @@ def test_simulate_stream_builds_full_text():
     assert chunks[-1].finish_reason == "stop"
     reconstructed = engine.get_full_response(session.session_id)
     assert reconstructed == full_text
+
+
+def test_chunk_ids_unique_within_session():
+    engine = StreamingChatEngine()
+    session = engine.create_stream_session()
+    chunks = list(engine.simulate_stream(session.session_id, "one two three"))
+    ids = [c.chunk_id for c in chunks]
+    assert len(set(ids)) == 3
+    assert all(i.startswith(session.session_id) for i in ids)
+
+
+def test_session_dump_includes_joined_buffer():
+    engine = StreamingChatEngine()
+    session = engine.create_stream_session()
+    list(engine.simulate_stream(session.session_id, "a b c"))
+    dumped = session.model_dump()
+    assert dumped["buffer"] == "a b c"
+    assert "buffer_parts" not in dumped
+    assert session.buffer_parts == ["a ", "b ", "c"]
+    assert list(engine.simulate_stream(engine.create_stream_session().session_id, "")) == []
+
+
+def test_stream_sessions_are_bounded():
+    engine = StreamingChatEngine(max_sessions=1)
+    old = engine.create_stream_session()
+    new = engine.create_stream_session()
+    assert list(engine.sessions) == [new.session_id]
+    with pytest.raises(ValueError, match="not found"):
+        engine.consume_chunk(old.session_id, "late")
+
+
+def test_session_round_trips_through_dump():
+    engine = StreamingChatEngine()
+    session = engine.create_stream_session()
+    list(engine.simulate_stream(session.session_id, "a b c"))
+    restored = StreamSession.model_validate(session.model_dump())
+    assert restored.buffer == "a b c"
+    assert restored.model_dump() == session.model_dump()
+    seeded = StreamSession(buffer="draft")
+    assert seeded.buffer == "draft"
+    seeded.buffer = "replaced"
+    assert seeded.buffer_parts == ["replaced"]
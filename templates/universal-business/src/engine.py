@@ -11,10 +11,42 @@ This engine captures that universal pattern and provides
 automation hooks for every stage.
 """
 from pydantic import BaseModel, Field
-from typing import Any, Optional
-from datetime import datetime, timezone
+from dataclasses import asdict, dataclass, field, fields
+from typing import Callable, Optional
+from functools import lru_cache
 from enum import Enum
-import uuid
+import ast
+import copy
+import itertools
+import json
+import operator
+import os
+import sys
+import time
+
+try:  # orjson is optional; the stdlib json module is the fallback.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+# Process-unique prefix plus a counter: cheaper than a uuid4() syscall per record.
+_ID_PREFIX = os.urandom(6).hex()
+_id_counter = itertools.count()
+
+
+def _new_id() -> str:
+    return f"{_ID_PREFIX}-{next(_id_counter):x}"
+
+
+@lru_cache(maxsize=1)
+def _iso_seconds(seconds: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+
+def _utc_now_iso() -> str:
+    """UTC ISO-8601 timestamp; the per-second prefix is formatted once and reused."""
+    seconds, ns = divmod(time.time_ns(), 1_000_000_000)
+    return f"{_iso_seconds(seconds)}.{ns // 1000:06d}+00:00"
 
 
 class ProcessType(str, Enum):
@@ -27,39 +59,101 @@ class ProcessType(str, Enum):
     REPORTING = "reporting"     # Analytics and insights
 
 
-class BusinessProcess(BaseModel):
-    process_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True, kw_only=True, frozen=True)
+class BusinessProcess:
+    process_id: str = field(default_factory=_new_id)
     name: str
     type: ProcessType
     description: str
-    inputs: list[str]
-    outputs: list[str]
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
     automation_level: str = "manual"  # manual|semi-auto|full-auto
     estimated_hours_per_unit: float = 1.0
     cost_per_unit: float = 0.0
 
 
-class WorkItem(BaseModel):
-    item_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(slots=True)
+class HistoryEntry:
+    src: str
+    dst: str
+    timestamp: str
+    assigned_to: Optional[str] = None
+
+
+@dataclass(slots=True, kw_only=True)
+class WorkItem:
+    # current_process and status are owned by UniversalBusinessEngine, which indexes
+    # items by them; change them through advance_item/complete_item/set_status.
+    item_id: str = field(default_factory=_new_id)
     title: str
-    data: dict = Field(default_factory=dict)
+    data: dict = field(default_factory=dict)
     current_process: str
     status: str = "pending"  # pending|in_progress|complete|blocked|cancelled
     priority: int = 5  # 1=highest, 10=lowest
     assigned_to: Optional[str] = None
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-    updated_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-    history: list[dict] = Field(default_factory=list)
+    created_at: str = field(default_factory=_utc_now_iso)
+    updated_at: str = field(default_factory=_utc_now_iso)
+    history: list[HistoryEntry] = field(default_factory=list)
+
+
+_COMPARE_OPS = {
+    ast.Eq: operator.eq, ast.NotEq: operator.ne,
+    ast.Lt: operator.lt, ast.LtE: operator.le,
+    ast.Gt: operator.gt, ast.GtE: operator.ge,
+    ast.In: lambda a, b: a in b, ast.NotIn: lambda a, b: a not in b,
+}
+_WORK_ITEM_FIELDS = frozenset(f.name for f in fields(WorkItem))
+
+
+def _compile_node(node: ast.expr, condition: str) -> Callable[[WorkItem], bool]:
+    if isinstance(node, ast.BoolOp):
+        parts = [_compile_node(v, condition) for v in node.values]
+        if isinstance(node.op, ast.And):
+            return lambda item: all(p(item) for p in parts)
+        return lambda item: any(p(item) for p in parts)
+    if (
+        isinstance(node, ast.Compare)
+        and len(node.ops) == 1
+        and isinstance(node.left, ast.Name)
+        and node.left.id in _WORK_ITEM_FIELDS
+        and type(node.ops[0]) in _COMPARE_OPS
+    ):
+        name = node.left.id
+        op = _COMPARE_OPS[type(node.ops[0])]
+        try:
+            value = ast.literal_eval(node.comparators[0])
+        except ValueError:
+            raise ValueError(f"Unsupported trigger condition: {condition!r}") from None
+        return lambda item: op(getattr(item, name), value)
+    raise ValueError(f"Unsupported trigger condition: {condition!r}")
+
+
+@lru_cache(maxsize=1024)
+def _compile_condition(condition: str) -> Callable[[WorkItem], bool]:
+    """Compile "field OP literal" comparisons joined by and/or into a predicate (no eval)."""
+    try:
+        tree = ast.parse(condition, mode="eval")
+    except SyntaxError:
+        raise ValueError(f"Unsupported trigger condition: {condition!r}") from None
+    return _compile_node(tree.body, condition)
 
 
 class AutomationRule(BaseModel):
-    rule_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    rule_id: str = Field(default_factory=_new_id)
     name: str
     trigger_process: str
     trigger_condition: str  # e.g., "status == 'complete'", "priority < 3"
     action: str             # e.g., "advance_to:review", "notify:slack", "assign:agent"
     enabled: bool = True
 
+    def evaluate(self, item: WorkItem) -> bool:
+        """Check the condition against item; unsupported conditions raise ValueError here.
+
+        Compiled predicates are cached per condition string, so each is parsed once and
+        a rule copied with a new trigger_condition never reuses a stale predicate.
+        """
+        return bool(_compile_condition(self.trigger_condition)(item))
+
 
 class BusinessMetrics(BaseModel):
     total_items: int = 0
@@ -89,53 +183,99 @@ class UniversalBusinessEngine:
         self.processes: dict[str, BusinessProcess] = {}
         self.work_items: dict[str, WorkItem] = {}
         self.automation_rules: list[AutomationRule] = []
+        self._rules_by_process: dict[str, list[AutomationRule]] = {}
+        # Processes are replaced, never edited, so each is serialized once in add_process.
+        self._process_dumps: dict[str, dict] = {}
+        # Secondary indexes (name/status -> {item_id: item}) kept in step with every mutation.
+        self._items_by_process: dict[str, dict[str, WorkItem]] = {}
+        self._items_by_status: dict[str, dict[str, WorkItem]] = {}
+        self._auto_process_count = 0
 
     def add_process(self, name: str, process_type: ProcessType, description: str,
                     inputs: list[str], outputs: list[str],
                     automation_level: str = "manual",
                     estimated_hours: float = 1.0, cost_per_unit: float = 0.0) -> BusinessProcess:
+        name = sys.intern(name)
         process = BusinessProcess(
-            name=name, type=process_type, description=description,
-            inputs=inputs, outputs=outputs, automation_level=automation_level,
+            name=name, type=ProcessType(process_type), description=description,
+            inputs=tuple(inputs), outputs=tuple(outputs), automation_level=automation_level,
             estimated_hours_per_unit=estimated_hours, cost_per_unit=cost_per_unit,
         )
+        previous = self.processes.get(name)
+        if previous is not None and previous.automation_level == "full-auto":
+            self._auto_process_count -= 1
+        if automation_level == "full-auto":
+            self._auto_process_count += 1
         self.processes[name] = process
+        self._process_dumps[name] = asdict(process)
         return process
 
     def create_work_item(self, title: str, data: dict,
                          process: str, priority: int = 5) -> WorkItem:
-        if process not in self.processes:
+        registered = self.processes.get(process)
+        if registered is None:
             raise ValueError(f"Process '{process}' not defined. Add it first.")
+        # Share the interned name so every item in a process holds the same string object.
+        process = registered.name
         item = WorkItem(title=title, data=data, current_process=process, priority=priority)
         self.work_items[item.item_id] = item
+        self._items_by_process.setdefault(process, {})[item.item_id] = item
+        self._items_by_status.setdefault(item.status, {})[item.item_id] = item
         return item
 
+    def _set_process(self, item: WorkItem, process: str) -> None:
+        del self._items_by_process[item.current_process][item.item_id]
+        self._items_by_process.setdefault(process, {})[item.item_id] = item
+        item.current_process = process
+
+    def _set_status(self, item: WorkItem, status: str) -> None:
+        del self._items_by_status[item.status][item.item_id]
+        self._items_by_status.setdefault(status, {})[item.item_id] = item
+        item.status = status
+
     def advance_item(self, item_id: str, next_process: str,
                      assigned_to: str | None = None) -> WorkItem:
+        return self.advance_items([item_id], next_process, assigned_to)[0]
+
+    def advance_items(self, item_ids: list[str], next_process: str,
+                      assigned_to: str | None = None) -> list[WorkItem]:
+        """Advance several items at once; all ids are checked before any item moves."""
+        registered = self.processes.get(next_process)
+        if registered is None:
+            raise ValueError(f"Process '{next_process}' not defined")
+        next_process = registered.name
+        work_items = self.work_items
+        items = []
+        for item_id in item_ids:
+            item = work_items.get(item_id)
+            if not item:
+                raise ValueError(f"Work item {item_id} not found")
+            items.append(item)
+        now = _utc_now_iso()
+        for item in items:
+            item.history.append(HistoryEntry(item.current_process, next_process, now, assigned_to))
+            self._set_process(item, next_process)
+            self._set_status(item, "in_progress")
+            item.updated_at = now
+            if assigned_to:
+                item.assigned_to = assigned_to
+        return items
+
+    def complete_item(self, item_id: str) -> WorkItem:
         item = self.work_items.get(item_id)
         if not item:
             raise ValueError(f"Work item {item_id} not found")
-        if next_process not in self.processes:
-            raise ValueError(f"Process '{next_process}' not defined")
-        item.history.append({
-            "from": item.current_process,
-            "to": next_process,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "assigned_to": assigned_to,
-        })
-        item.current_process = next_process
-        item.status = "in_progress"
-        item.updated_at = datetime.now(timezone.utc).isoformat()
-        if assigned_to:
-            item.assigned_to = assigned_to
+        self._set_status(item, "complete")
+        item.updated_at = _utc_now_iso()
         return item
 
-    def complete_item(self, item_id: str) -> WorkItem:
+    def set_status(self, item_id: str, status: str) -> WorkItem:
+        """Set an item's status (e.g. "blocked", "cancelled") without moving it."""
         item = self.work_items.get(item_id)
         if not item:
             raise ValueError(f"Work item {item_id} not found")
-        item.status = "complete"
-        item.updated_at = datetime.now(timezone.utc).isoformat()
+        self._set_status(item, status)
+        item.updated_at = _utc_now_iso()
         return item
 
     def add_automation_rule(self, name: str, trigger_process: str,
@@ -145,22 +285,31 @@ class UniversalBusinessEngine:
             trigger_condition=trigger_condition, action=action,
         )
         self.automation_rules.append(rule)
+        self._rules_by_process.setdefault(trigger_process, []).append(rule)
         return rule
 
+    def rules_for(self, process_name: str) -> list[AutomationRule]:
+        return list(self._rules_by_process.get(process_name, ()))
+
+    def matching_rules(self, item_id: str) -> list[AutomationRule]:
+        """Enabled rules for the item's current process whose condition holds."""
+        item = self.work_items.get(item_id)
+        if not item:
+            raise ValueError(f"Work item {item_id} not found")
+        return [
+            r for r in self._rules_by_process.get(item.current_process, ())
+            if r.enabled and r.evaluate(item)
+        ]
+
     def get_items_in_process(self, process_name: str) -> list[WorkItem]:
-        return [i for i in self.work_items.values() if i.current_process == process_name]
+        return list(self._items_by_process.get(process_name, {}).values())
 
     def get_metrics(self) -> BusinessMetrics:
-        items = list(self.work_items.values())
-        by_status: dict[str, int] = {}
-        by_process: dict[str, int] = {}
-        for item in items:
-            by_status[item.status] = by_status.get(item.status, 0) + 1
-            by_process[item.current_process] = by_process.get(item.current_process, 0) + 1
-        auto_processes = sum(1 for p in self.processes.values() if p.automation_level == "full-auto")
-        auto_rate = auto_processes / len(self.processes) if self.processes else 0.0
+        by_status = {k: len(v) for k, v in self._items_by_status.items() if v}
+        by_process = {k: len(v) for k, v in self._items_by_process.items() if v}
+        auto_rate = self._auto_process_count / len(self.processes) if self.processes else 0.0
         return BusinessMetrics(
-            total_items=len(items),
+            total_items=len(self.work_items),
             items_by_status=by_status,
             items_by_process=by_process,
             automation_rate=auto_rate,
@@ -171,7 +320,15 @@ class UniversalBusinessEngine:
         return {
             "business": self.business_name,
             "industry": self.industry,
-            "processes": {name: p.model_dump() for name, p in self.processes.items()},
+            # Deep-copied so callers editing the export cannot corrupt the cached snapshots.
+            "processes": {k: copy.deepcopy(v) for k, v in self._process_dumps.items()},
             "automation_rules": [r.model_dump() for r in self.automation_rules],
             "work_item_count": len(self.work_items),
         }
+
+    def export_process_map_json(self) -> bytes:
+        """export_process_map() encoded as UTF-8 JSON, via orjson when it is installed."""
+        data = self.export_process_map()
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data, separators=(",", ":")).encode()
@@ -1,5 +1,5 @@
 import pytest
-from src.engine import UniversalBusinessEngine, ProcessType
+from src.engine import AutomationRule, UniversalBusinessEngine, ProcessType
 
 
 def _make_engine() -> UniversalBusinessEngine:
@@ -49,8 +49,8 @@ def test_advance_item():
     assert advanced.status == "in_progress"
     assert advanced.assigned_to == "agent-1"
     assert len(advanced.history) == 1
-    assert advanced.history[0]["from"] == "intake"
-    assert advanced.history[0]["to"] == "review"
+    assert advanced.history[0].src == "intake"
+    assert advanced.history[0].dst == "review"
 
 
 def test_complete_item():
@@ -75,3 +75,195 @@ def test_get_metrics():
     assert metrics.items_by_status["in_progress"] == 1
     # 1 of 2 processes is full-auto
     assert metrics.automation_rate == pytest.approx(0.5)
+
+
+def test_get_items_in_process_follows_advances():
+    engine = _make_engine()
+    a = engine.create_work_item("Item A", data={}, process="intake")
+    b = engine.create_work_item("Item B", data={}, process="intake")
+    engine.advance_item(a.item_id, "review")
+    engine.complete_item(a.item_id)
+    assert engine.get_items_in_process("intake") == [b]
+    assert engine.get_items_in_process("review") == [a]
+    assert engine.get_items_in_process("missing") == []
+    metrics = engine.get_metrics()
+    assert metrics.items_by_status == {"pending": 1, "complete": 1}
+
+
+def test_get_metrics_follows_mutations():
+    engine = _make_engine()
+    item = engine.create_work_item("Item A", data={}, process="intake")
+    assert engine.get_metrics().items_by_status == {"pending": 1}
+    engine.complete_item(item.item_id)
+    assert engine.get_metrics().items_by_status == {"complete": 1}
+    engine.add_process(
+        "review", ProcessType.REVIEW, description="Manual review",
+        inputs=["intake_record"], outputs=["decision"],
+    )
+    assert engine.get_metrics().automation_rate == 0.0
+
+
+def test_advance_item_stamps_history_and_updated_at_together():
+    from datetime import datetime, timezone
+
+    engine = _make_engine()
+    item = engine.create_work_item("Item A", data={}, process="intake")
+    engine.advance_item(item.item_id, "review")
+    assert item.history[0].timestamp == item.updated_at
+    stamp = datetime.fromisoformat(item.updated_at)
+    assert stamp.tzinfo == timezone.utc
+    assert abs((datetime.now(timezone.utc) - stamp).total_seconds()) < 5
+
+
+def test_advance_items_moves_batch_or_nothing():
+    engine = _make_engine()
+    a = engine.create_work_item("Item A", data={}, process="intake")
+    b = engine.create_work_item("Item B", data={}, process="intake")
+    with pytest.raises(ValueError, match="not found"):
+        engine.advance_items([a.item_id, "missing"], "review")
+    assert a.current_process == "intake"
+    moved = engine.advance_items([a.item_id, b.item_id], "review", assigned_to="agent-1")
+    assert moved == [a, b]
+    assert engine.get_items_in_process("review") == [a, b]
+    assert a.history[0].timestamp == b.history[0].timestamp
+
+
+def test_add_process_coerces_type_string():
+    engine = UniversalBusinessEngine(business_name="Acme")
+    proc = engine.add_process("ship", "delivery", description="Ship", inputs=[], outputs=[])
+    assert proc.type is ProcessType.DELIVERY
+    with pytest.raises(ValueError):
+        engine.add_process("bad", "unknown", description="Bad", inputs=[], outputs=[])
+    assert engine.export_process_map()["processes"]["ship"]["type"] is ProcessType.DELIVERY
+
+
+def test_ids_are_unique_across_record_types():
+    engine = _make_engine()
+    items = [engine.create_work_item(f"Item {i}", data={}, process="intake") for i in range(3)]
+    rule = engine.add_automation_rule("auto", "intake", "status == 'complete'", "advance_to:review")
+    ids = [i.item_id for i in items] + [rule.rule_id, engine.processes["intake"].process_id]
+    assert len(set(ids)) == len(ids)
+
+
+def test_automation_rule_conditions_compile_once():
+    engine = _make_engine()
+    rule = engine.add_automation_rule(
+        "urgent", "intake", "status == 'pending' and priority < 3", "advance_to:review"
+    )
+    urgent = engine.create_work_item("Urgent", data={}, process="intake", priority=1)
+    normal = engine.create_work_item("Normal", data={}, process="intake")
+    assert rule.evaluate(urgent)
+    assert not rule.evaluate(normal)
+    for bad in ("__import__('os')", "status ==", "unknown == 1", "status == other"):
+        # Free-form conditions are still accepted; only evaluating them fails.
+        rule = engine.add_automation_rule("bad", "intake", bad, "notify:slack")
+        with pytest.raises(ValueError, match="Unsupported trigger condition"):
+            rule.evaluate(urgent)
+
+
+def test_automation_rule_copy_uses_updated_condition():
+    engine = _make_engine()
+    rule = engine.add_automation_rule("pending", "intake", "status == 'pending'", "notify:slack")
+    item = engine.create_work_item("Item A", data={}, process="intake")
+    assert rule.evaluate(item)
+    changed = rule.model_copy(update={"trigger_condition": "status == 'complete'"})
+    assert not changed.evaluate(item)
+    restored = AutomationRule.model_validate({**rule.model_dump(), "trigger_condition": "data['x'] > 1"})
+    assert restored.trigger_condition == "data['x'] > 1"
+
+
+def test_matching_rules_only_checks_current_process():
+    engine = _make_engine()
+    done = engine.add_automation_rule("done", "review", "status == 'complete'", "notify:slack")
+    engine.add_automation_rule("intake-done", "intake", "status == 'complete'", "notify:slack")
+    item = engine.create_work_item("Item A", data={}, process="intake")
+    engine.advance_item(item.item_id, "review")
+    assert engine.matching_rules(item.item_id) == []
+    engine.complete_item(item.item_id)
+    assert engine.matching_rules(item.item_id) == [done]
+    assert engine.rules_for("review") == [done]
+    done.enabled = False
+    assert engine.matching_rules(item.item_id) == []
+
+
+def test_items_share_canonical_process_name():
+    engine = _make_engine()
+    a = engine.create_work_item("Item A", data={}, process="".join(["in", "take"]))
+    b = engine.create_work_item("Item B", data={}, process="intake")
+    assert a.current_process is b.current_process
+    engine.advance_items([a.item_id, b.item_id], "".join(["re", "view"]))
+    assert a.current_process is engine.processes["review"].name
+    assert a.history[0].src is b.history[0].src
+
+
+def test_export_process_map_tracks_replaced_processes():
+    engine = _make_engine()
+    first = engine.export_process_map()
+    engine.add_process(
+        "review", ProcessType.REVIEW, description="Manual review",
+        inputs=["intake_record"], outputs=["decision"],
+    )
+    exported = engine.export_process_map()
+    assert exported["processes"]["review"]["automation_level"] == "manual"
+    assert first["processes"]["review"]["automation_level"] == "full-auto"
+    assert list(exported["processes"]) == ["intake", "review"]
+
+
+def test_business_process_is_frozen():
+    from dataclasses import FrozenInstanceError
+
+    engine = _make_engine()
+    proc = engine.processes["intake"]
+    with pytest.raises(FrozenInstanceError):
+        proc.automation_level = "full-auto"
+    assert engine.export_process_map()["processes"]["intake"]["automation_level"] == "manual"
+
+
+def test_export_process_map_json_round_trips():
+    import json
+
+    engine = _make_engine()
+    engine.add_automation_rule("auto", "intake", "status == 'complete'", "advance_to:review")
+    decoded = json.loads(engine.export_process_map_json())
+    assert decoded["processes"]["review"]["type"] == "review"
+    assert decoded["automation_rules"][0]["name"] == "auto"
+    assert decoded["work_item_count"] == 0
+
+
+def test_export_process_map_mutation_does_not_leak():
+    engine = _make_engine()
+    exported = engine.export_process_map()
+    exported["processes"]["intake"]["name"] = "zzz"
+    exported["processes"]["intake"]["automation_level"] = "full-auto"
+    exported["processes"].pop("review")
+    fresh = engine.export_process_map()
+    assert fresh["processes"]["intake"]["name"] == "intake"
+    assert fresh["processes"]["intake"]["automation_level"] == "manual"
+    assert list(fresh["processes"]) == ["intake", "review"]
+    assert engine.processes["intake"].inputs == ("request_form",)
+    with pytest.raises(AttributeError):
+        engine.processes["intake"].inputs.append("HACK")
+
+
+def test_get_metrics_mutation_does_not_leak():
+    engine = _make_engine()
+    engine.create_work_item("Item A", data={}, process="intake")
+    engine.get_metrics().items_by_status["pending"] = 99
+    engine.get_metrics().items_by_process["intake"] = 99
+    metrics = engine.get_metrics()
+    assert metrics.items_by_status == {"pending": 1}
+    assert metrics.items_by_process == {"intake": 1}
+
+
+def test_set_status_updates_indexes():
+    engine = _make_engine()
+    item = engine.create_work_item("Item A", data={}, process="intake")
+    blocked = engine.set_status(item.item_id, "blocked")
+    assert blocked is item
+    assert item.status == "blocked"
+    assert engine.get_metrics().items_by_status == {"blocked": 1}
+    engine.set_status(item.item_id, "cancelled")
+    assert engine.get_metrics().items_by_status == {"cancelled": 1}
+    assert engine.get_items_in_process("intake") == [item]
+    with pytest.raises(ValueError, match="not found"):
+        engine.set_status("missing", "blocked")